@@ -10,8 +10,18 @@ import click
     "--theme", default="dark", help="UI theme (dark, light, monokai, solarized)"
 )
 @click.option("--no-tui", is_flag=True, help="Disable TUI and use CLI mode")
+@click.option(
+    "--cache",
+    is_flag=True,
+    help="Keep DNS and certificate results on disk between runs",
+)
+@click.option(
+    "--race",
+    is_flag=True,
+    help="Race DNS queries across public resolvers instead of authoritative servers",
+)
 @click.version_option(version="0.1.2", prog_name="d")
-def main(domain: str, theme: str, no_tui: bool) -> None:
+def main(domain: str, theme: str, no_tui: bool, cache: bool, race: bool) -> None:
     """DNS Debugger - Interactive TUI for debugging DNS, certificates, and domain registration.
 
     Usage: d DOMAIN
@@ -37,6 +47,12 @@ def main(domain: str, theme: str, no_tui: bool) -> None:
         click.echo(f"❌ Error checking DNS tools: {str(e)}")
         sys.exit(1)
 
+    # Opt-in adapter behaviour, set before any screen creates an adapter
+    from dns_debugger.adapters.cert.factory import CertificateAdapterFactory
+
+    DNSAdapterFactory.configure(race=race, persistent=cache)
+    CertificateAdapterFactory.configure(persistent=cache)
+
     # Launch TUI or CLI mode
     if no_tui:
         # CLI mode (for testing or scripting)
@@ -58,6 +74,16 @@ def run_cli_mode(domain: str) -> None:
     from dns_debugger.adapters.dns.factory import DNSAdapterFactory
     from dns_debugger.domain.models.dns_record import RecordType
 
+    record_types = [
+        RecordType.A,
+        RecordType.AAAA,
+        RecordType.MX,
+        RecordType.NS,
+        RecordType.TXT,
+        RecordType.SOA,
+        RecordType.CAA,
+    ]
+
     click.echo(f"🚀 DNS Debugger (CLI mode) - {domain}")
     click.echo()
 
@@ -73,18 +99,22 @@ def run_cli_mode(domain: str) -> None:
         # Create DNS adapter
         dns_adapter = DNSAdapterFactory.create()
 
-        # Query A record
-        click.echo(f"Querying A records for {domain}...")
-        response = dns_adapter.query(domain, RecordType.A)
+        # Query all record types at once (the adapter sends them concurrently)
+        type_names = ", ".join(record_type.value for record_type in record_types)
+        click.echo(f"Querying {type_names} records for {domain}...")
+        responses = dns_adapter.query_multiple_types(domain, record_types)
 
-        if response.is_success:
-            click.echo(f"✓ Query completed in {response.query_time_ms:.2f}ms")
-            click.echo(f"✓ Found {response.record_count} record(s)")
+        for record_type in record_types:
+            response = responses[record_type]
             click.echo()
-            for record in response.records:
-                click.echo(f"  {record}")
-        else:
-            click.echo(f"❌ Query failed: {response.error}")
+            click.echo(f"{record_type.value}:")
+            if response.is_success:
+                click.echo(f"✓ Query completed in {response.query_time_ms:.2f}ms")
+                click.echo(f"✓ Found {response.record_count} record(s)")
+                for record in response.records:
+                    click.echo(f"  {record}")
+            else:
+                click.echo(f"❌ Query failed: {response.error}")
 
     except Exception as e:
         click.echo(f"❌ Error: {str(e)}")
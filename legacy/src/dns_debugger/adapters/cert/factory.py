@@ -4,6 +4,7 @@ from typing import Optional
 
 from dns_debugger.domain.ports.cert_port import CertificatePort
 from dns_debugger.adapters.cert.openssl_adapter import OpenSSLAdapter
+from dns_debugger.adapters.tool_probe import tool_path
 
 
 class CertificateAdapterFactory:
@@ -13,8 +14,51 @@ class CertificateAdapterFactory:
     Future: Add cryptography library fallback.
     """
 
-    @staticmethod
-    def create() -> CertificatePort:
+    # Shared adapter instance, created lazily by create()
+    _instance: Optional[CertificatePort] = None
+
+    # Whether the shared instance keeps results on disk, set by configure()
+    _persistent = False
+
+    @classmethod
+    def configure(cls, *, persistent: bool = False) -> None:
+        """Choose whether the shared adapter keeps results between runs.
+
+        Meant to be called once at startup; adapters created afterwards use
+        the new option.
+
+        Args:
+            persistent: Keep handshake results on disk until the leaf
+                certificate expires, but for at most 12 hours
+                (PersistentCachingCertificatePort)
+        """
+        cls._persistent = persistent
+        cls._instance = None
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget cached tool availability and the shared adapter instance."""
+        tool_path.cache_clear()
+        cls._instance = None
+
+    @classmethod
+    def _shared_instance(cls) -> CertificatePort:
+        """Return the shared adapter, creating it on first use."""
+        if cls._instance is None:
+            adapter: CertificatePort = OpenSSLAdapter()
+            if cls._persistent:
+                # Imported here so that default callers skip sqlite3
+                from dns_debugger.adapters.cert.persistent_cache import (
+                    PersistentCachingCertificatePort,
+                )
+                from dns_debugger.adapters.disk_cache import DiskCache
+
+                adapter = PersistentCachingCertificatePort(adapter, DiskCache())
+            cls._instance = adapter
+        return cls._instance
+
+    @classmethod
+    def create(cls) -> CertificatePort:
         """Create a certificate adapter using the best available tool.
 
         Returns:
@@ -24,9 +68,8 @@ class CertificateAdapterFactory:
             RuntimeError: If no certificate tool is available
         """
         # Try OpenSSL
-        openssl = OpenSSLAdapter()
-        if openssl.is_available():
-            return openssl
+        if OpenSSLAdapter.tool_is_available():
+            return cls._shared_instance()
 
         # No certificate tool available
         raise RuntimeError(
@@ -36,8 +79,8 @@ class CertificateAdapterFactory:
             "  - RHEL/Fedora: dnf install openssl"
         )
 
-    @staticmethod
-    def create_specific(tool_name: str) -> CertificatePort:
+    @classmethod
+    def create_specific(cls, tool_name: str) -> CertificatePort:
         """Create a specific certificate adapter by name.
 
         Args:
@@ -50,18 +93,16 @@ class CertificateAdapterFactory:
             ValueError: If tool_name is not recognized
             RuntimeError: If the requested tool is not available
         """
-        if tool_name.lower() == "openssl":
-            adapter = OpenSSLAdapter()
-        else:
+        if tool_name.lower() != "openssl":
             raise ValueError(f"Unknown certificate tool: {tool_name}")
 
-        if not adapter.is_available():
+        if not OpenSSLAdapter.tool_is_available():
             raise RuntimeError(f"Certificate tool '{tool_name}' is not available")
 
-        return adapter
+        return cls._shared_instance()
 
-    @staticmethod
-    def get_available_tools() -> list[str]:
+    @classmethod
+    def get_available_tools(cls) -> list[str]:
         """Get a list of available certificate tools.
 
         Returns:
@@ -69,18 +110,17 @@ class CertificateAdapterFactory:
         """
         tools = []
 
-        openssl = OpenSSLAdapter()
-        if openssl.is_available():
+        if OpenSSLAdapter.tool_is_available():
             tools.append("openssl")
 
         return tools
 
-    @staticmethod
-    def get_preferred_tool() -> Optional[str]:
+    @classmethod
+    def get_preferred_tool(cls) -> Optional[str]:
         """Get the name of the preferred tool that will be used.
 
         Returns:
             Name of the preferred tool, or None if no tool is available
         """
-        tools = CertificateAdapterFactory.get_available_tools()
+        tools = cls.get_available_tools()
         return tools[0] if tools else None
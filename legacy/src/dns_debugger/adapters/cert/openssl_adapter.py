@@ -1,10 +1,31 @@
-"""Certificate adapter using OpenSSL command-line tool."""
+"""Certificate adapter using OpenSSL (via the ssl module or the command-line tool)."""
 
+import base64
+import binascii
+import dataclasses
+import functools
+import hashlib
 import json
 import re
+import socket
+import ssl
 import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Iterator, Optional
+
+try:
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import dsa, ec, ed448, ed25519, rsa
+    from cryptography.x509.oid import NameOID, SignatureAlgorithmOID
+
+    _CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    x509 = None
+    _CRYPTOGRAPHY_AVAILABLE = False
 
 from dns_debugger.domain.models.certificate import (
     Certificate,
@@ -14,16 +35,140 @@ from dns_debugger.domain.models.certificate import (
     TLSVersion,
 )
 from dns_debugger.domain.ports.cert_port import CertificatePort
+from dns_debugger.adapters.tool_probe import is_tool_available
+
+# The peer's full chain is only readable through a public API from Python
+# 3.13 on (SSLSocket.get_unverified_chain). Older interpreters fall back to
+# parsing `openssl s_client -showcerts` output.
+_IN_PROCESS_CHAIN = _CRYPTOGRAPHY_AVAILABLE and sys.version_info >= (3, 13)
+
+# CertificateSubject field -> X.509 name attribute
+_SUBJECT_ATTRIBUTES = (
+    {
+        "common_name": NameOID.COMMON_NAME,
+        "organization": NameOID.ORGANIZATION_NAME,
+        "organizational_unit": NameOID.ORGANIZATIONAL_UNIT_NAME,
+        "locality": NameOID.LOCALITY_NAME,
+        "state": NameOID.STATE_OR_PROVINCE_NAME,
+        "country": NameOID.COUNTRY_NAME,
+    }
+    if _CRYPTOGRAPHY_AVAILABLE
+    else {}
+)
+
+# Public key type -> algorithm name as printed by `openssl x509 -text`
+_PUBLIC_KEY_ALGORITHMS = (
+    (
+        (rsa.RSAPublicKey, "rsaEncryption"),
+        (ec.EllipticCurvePublicKey, "id-ecPublicKey"),
+        (ed25519.Ed25519PublicKey, "ED25519"),
+        (ed448.Ed448PublicKey, "ED448"),
+        (dsa.DSAPublicKey, "dsaEncryption"),
+    )
+    if _CRYPTOGRAPHY_AVAILABLE
+    else ()
+)
+
+# Signature algorithm OID -> name as printed by `openssl x509 -text`
+_SIGNATURE_ALGORITHMS = (
+    {
+        SignatureAlgorithmOID.RSA_WITH_SHA1: "sha1WithRSAEncryption",
+        SignatureAlgorithmOID.RSA_WITH_SHA256: "sha256WithRSAEncryption",
+        SignatureAlgorithmOID.RSA_WITH_SHA384: "sha384WithRSAEncryption",
+        SignatureAlgorithmOID.RSA_WITH_SHA512: "sha512WithRSAEncryption",
+        SignatureAlgorithmOID.RSASSA_PSS: "rsassaPss",
+        SignatureAlgorithmOID.ECDSA_WITH_SHA256: "ecdsa-with-SHA256",
+        SignatureAlgorithmOID.ECDSA_WITH_SHA384: "ecdsa-with-SHA384",
+        SignatureAlgorithmOID.ECDSA_WITH_SHA512: "ecdsa-with-SHA512",
+        SignatureAlgorithmOID.ED25519: "ED25519",
+        SignatureAlgorithmOID.ED448: "ED448",
+    }
+    if _CRYPTOGRAPHY_AVAILABLE
+    else {}
+)
+
+_PEM_BEGIN = "-----BEGIN CERTIFICATE-----"
+_PEM_END = "-----END CERTIFICATE-----"
+
+# Printed by `s_client -status` when the server staples a good OCSP response
+_OCSP_STAPLED_MARKER = "OCSP Response Status: successful"
+# Printed by `s_client -status` whether or not a response was stapled
+_OCSP_STATUS_MARKER = "OCSP response:"
+
+# Patterns for `openssl s_client` / `openssl x509 -text` output
+_SERIAL_RE = re.compile(r"Serial Number:\s*\n?\s*([0-9a-f:]+)", re.IGNORECASE)
+_VERSION_RE = re.compile(r"Version:\s*(\d+)")
+_NOT_BEFORE_RE = re.compile(r"Not Before\s*:\s*(.+)")
+_NOT_AFTER_RE = re.compile(r"Not After\s*:\s*(.+)")
+_SIG_ALGO_RE = re.compile(r"Signature Algorithm:\s*(.+)")
+_PUBKEY_ALGO_RE = re.compile(r"Public Key Algorithm:\s*(.+)")
+_PUBKEY_SIZE_RE = re.compile(r"Public-Key:\s*\((\d+)\s*bit\)")
+_SAN_RE = re.compile(r"Subject Alternative Name:\s*\n\s*(.+)")
+_FINGERPRINT_RE = re.compile(r"Fingerprint=(.+)")
+# Negotiated cipher line, as printed by `s_client` and the in-process summary
+_CIPHER_RE = re.compile(r"^\s*Cipher\s*:\s*(\S+)", re.MULTILINE)
+
+# "Subject:" / "Issuer:" lines, capturing the label and the DN
+_DN_LINE_RE = re.compile(r"^\s*(Subject|Issuer):\s*(.+)$", re.MULTILINE)
+
+# Month abbreviation in `openssl x509` dates -> month number
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split(), start=1
+    )
+}
+
+# DN attribute -> pattern capturing its value
+_DN_FIELD_RES = {
+    field: re.compile(f"{field}\\s*=\\s*([^,]+)")
+    for field in ("CN", "O", "OU", "L", "ST", "C")
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _client_context(verify: bool) -> ssl.SSLContext:
+    """Return the shared TLS client context, verifying the peer or not.
+
+    Loading the trust store is the slow part of creating a context, so each
+    kind is created once per process (SSLContext is safe to share).
+    """
+    ctx = ssl.create_default_context()
+    if not verify:
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+def _iter_pem_blocks(output: str) -> Iterator[str]:
+    """Yield each PEM certificate block in command output, in order."""
+    position = 0
+    while True:
+        begin = output.find(_PEM_BEGIN, position)
+        if begin < 0:
+            return
+        end = output.find(_PEM_END, begin)
+        if end < 0:
+            return
+        position = end + len(_PEM_END)
+        yield output[begin:position]
 
 
 class OpenSSLAdapter(CertificatePort):
     """Adapter for certificate operations using OpenSSL command-line tool."""
 
+    # Bound on _parse_cache entries
+    PARSE_CACHE_SIZE = 4096
+
+    # SHA-256 of a certificate's encoding -> parsed Certificate, shared by
+    # all instances
+    _parse_cache: dict[bytes, Certificate] = {}
+
     def get_certificate_info(
         self, host: str, port: int = 443, servername: Optional[str] = None
     ) -> TLSInfo:
         """Get SSL/TLS certificate information for a host."""
-        start_time = datetime.now()
+        start = time.perf_counter()
 
         sni = servername or host
 
@@ -32,13 +177,19 @@ class OpenSSLAdapter(CertificatePort):
             host, port, servername
         )
 
-        # Skip slow TLS version, cipher suite, and OCSP checks
+        # Skip slow TLS version checks
         # These add 10+ seconds per domain and aren't essential
         supported_versions = []
-        cipher_suites = []
-        has_ocsp = False
+        # The cipher negotiated in the chain handshake
+        cipher_suites = self._negotiated_ciphers(raw_chain_output)
+        # OCSP stapling is requested in the chain handshake itself (s_client
+        # only; the ssl module cannot send a status request, so after an
+        # in-process handshake it is unknown)
+        has_ocsp: Optional[bool] = None
+        if _OCSP_STATUS_MARKER in raw_chain_output:
+            has_ocsp = _OCSP_STAPLED_MARKER in raw_chain_output
 
-        connection_time = (datetime.now() - start_time).total_seconds() * 1000
+        connection_time = (time.perf_counter() - start) * 1000
 
         return TLSInfo(
             host=host,
@@ -53,6 +204,32 @@ class OpenSSLAdapter(CertificatePort):
             raw_data={"raw_output": raw_chain_output} if raw_chain_output else None,
         )
 
+    def probe_full_tls_matrix(
+        self, host: str, port: int = 443, servername: Optional[str] = None
+    ) -> TLSInfo:
+        """Get certificate information plus the probes get_certificate_info skips.
+
+        Adds the TLS versions the server accepts (one handshake per version)
+        and, when the chain handshake could not tell, an explicit OCSP
+        stapling check. These cost several extra handshakes, so they are
+        only run when a detail view asks for them.
+        """
+        tls_info = self.get_certificate_info(host, port, servername)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            versions = executor.submit(self._get_supported_tls_versions, host, port)
+            ocsp = (
+                None
+                if tls_info.has_ocsp_stapling
+                else executor.submit(self.check_ocsp_stapling, host, port)
+            )
+
+            return dataclasses.replace(
+                tls_info,
+                supported_versions=versions.result(),
+                has_ocsp_stapling=ocsp.result() if ocsp else True,
+            )
+
     def get_certificate_chain(
         self, host: str, port: int = 443, servername: Optional[str] = None
     ) -> tuple[CertificateChain, str]:
@@ -63,10 +240,17 @@ class OpenSSLAdapter(CertificatePort):
         """
         sni = servername or host
 
+        if _IN_PROCESS_CHAIN:
+            return self._get_certificate_chain_in_process(host, port, sni)
+
         try:
             # Get certificate chain using openssl s_client
             # Use echo with Q command to quit immediately after getting certs
-            cmd = f"echo Q | openssl s_client -connect {host}:{port} -servername {sni} -showcerts 2>&1"
+            # -status also asks for a stapled OCSP response in the same handshake
+            cmd = (
+                f"echo Q | openssl s_client -connect {host}:{port} -servername {sni}"
+                " -showcerts -status 2>&1"
+            )
 
             result = subprocess.run(
                 cmd, shell=True, capture_output=True, text=True, timeout=3
@@ -114,17 +298,212 @@ class OpenSSLAdapter(CertificatePort):
                 "",
             )
 
+    def _get_certificate_chain_in_process(
+        self, host: str, port: int, sni: str
+    ) -> tuple[CertificateChain, str]:
+        """Fetch and parse the chain with an in-process TLS handshake.
+
+        The handshake verifies the chain and hostname against the system
+        trust store. If verification fails, the reason is recorded and, like
+        `s_client`, the chain is fetched anyway with a second, unverified
+        handshake.
+
+        Returns:
+            Tuple of (CertificateChain, raw_output), where raw_output is an
+            s_client style summary of the chain with each certificate in PEM
+        """
+        validation_errors = []
+        verify_result = "0 (ok)"
+        try:
+            try:
+                der_chain, protocol, cipher = self._handshake(host, port, sni, True)
+            except ssl.SSLCertVerificationError as e:
+                validation_errors.append(e.verify_message or str(e))
+                verify_result = f"{e.verify_code} ({e.verify_message})"
+                der_chain, protocol, cipher = self._handshake(host, port, sni, False)
+        except socket.timeout:
+            return (
+                CertificateChain(
+                    certificates=[],
+                    is_valid=False,
+                    validation_errors=["Connection timeout"],
+                ),
+                "",
+            )
+        except (OSError, ssl.SSLError) as e:
+            return (
+                CertificateChain(
+                    certificates=[], is_valid=False, validation_errors=[str(e)]
+                ),
+                "",
+            )
+
+        certificates = []
+        raw_lines = [f"CONNECTED({host}:{port})", "---", "Certificate chain"]
+        for depth, der in enumerate(der_chain):
+            pem = ssl.DER_cert_to_PEM_cert(der)
+            try:
+                cert = self._parse_cached(der, self._certificate_from_der)
+            except Exception:
+                # Something this cryptography version cannot load (e.g. an
+                # unsupported key type): let `openssl x509` parse it instead
+                cert = self._parse_cached(
+                    pem.encode(),
+                    lambda encoded: self._parse_certificate_with_openssl(
+                        encoded.decode()
+                    ),
+                )
+            if cert is None:
+                continue
+            certificates.append(cert)
+            raw_lines.append(f" {depth} s:{cert.subject}")
+            raw_lines.append(f"   i:{cert.issuer}")
+            raw_lines.append(pem.rstrip("\n"))
+        raw_lines.append("---")
+        raw_lines.append(f"Protocol  : {protocol}")
+        if cipher:
+            raw_lines.append(f"Cipher    : {cipher[0]}")
+        raw_lines.append(f"Verify return code: {verify_result}")
+
+        chain = CertificateChain(
+            certificates=certificates,
+            is_valid=not validation_errors,
+            validation_errors=validation_errors,
+        )
+        return chain, "\n".join(raw_lines) + "\n"
+
+    def _handshake(
+        self, host: str, port: int, sni: str, verify: bool
+    ) -> tuple[list[bytes], Optional[str], Optional[tuple[str, str, int]]]:
+        """Complete a TLS handshake and read what the server presented.
+
+        Raises:
+            ssl.SSLCertVerificationError: If verify is set and the chain or
+                hostname does not verify
+
+        Returns:
+            Tuple of (DER chain leaf first, protocol version, cipher)
+        """
+        ctx = _client_context(verify)
+        with socket.create_connection((host, port), timeout=3) as sock:
+            with ctx.wrap_socket(sock, server_hostname=sni) as ssock:
+                return self._peer_der_chain(ssock), ssock.version(), ssock.cipher()
+
+    @staticmethod
+    def _peer_der_chain(ssock: ssl.SSLSocket) -> list[bytes]:
+        """Return the peer's certificate chain as DER blobs, leaf first."""
+        # Public from Python 3.13 on, which _IN_PROCESS_CHAIN requires
+        return list(ssock.get_unverified_chain() or [])  # type: ignore[attr-defined]
+
+    def _parse_cached(
+        self, encoded: bytes, parse: Callable[[bytes], Optional[Certificate]]
+    ) -> Optional[Certificate]:
+        """Parse a certificate, reusing the result for an identical encoding.
+
+        Intermediates and roots recur across nearly every host, so in a scan
+        each distinct certificate is parsed once. Failed parses (None) are
+        not cached.
+
+        Args:
+            encoded: DER or PEM bytes of the certificate
+            parse: Parser to call on a cache miss
+        """
+        key = hashlib.sha256(encoded).digest()
+        cert = self._parse_cache.get(key)
+        if cert is None:
+            cert = parse(encoded)
+            if cert is not None:
+                if len(self._parse_cache) >= self.PARSE_CACHE_SIZE:
+                    # Evict the oldest entry
+                    self._parse_cache.pop(next(iter(self._parse_cache)), None)
+                self._parse_cache[key] = cert
+        return cert
+
+    def _certificate_from_der(self, der: bytes) -> Optional[Certificate]:
+        """Parse a DER certificate, returning None if it is malformed."""
+        try:
+            cert = x509.load_der_x509_certificate(der)
+        except ValueError:
+            return None
+        return self._certificate_from_x509(cert)
+
+    def _certificate_from_pem(self, cert_pem: str) -> Optional[Certificate]:
+        """Parse a PEM certificate in-process, returning None if it is malformed."""
+        body = cert_pem.replace(_PEM_BEGIN, "").replace(_PEM_END, "")
+        try:
+            der = base64.b64decode(body)
+        except binascii.Error:
+            return None
+        return self._certificate_from_der(der)
+
+    def _certificate_from_x509(self, cert: "x509.Certificate") -> Certificate:
+        """Build a Certificate from a parsed cryptography certificate."""
+        try:
+            san = cert.extensions.get_extension_for_class(x509.SubjectAlternativeName)
+            sans = san.value.get_values_for_type(x509.DNSName)
+        except x509.ExtensionNotFound:
+            sans = []
+
+        if hasattr(cert, "not_valid_before_utc"):  # cryptography 42+
+            not_before = cert.not_valid_before_utc.replace(tzinfo=None)
+            not_after = cert.not_valid_after_utc.replace(tzinfo=None)
+        else:
+            not_before = cert.not_valid_before
+            not_after = cert.not_valid_after
+
+        public_key = cert.public_key()
+
+        serial_number = format(cert.serial_number, "x")
+        if len(serial_number) % 2:
+            serial_number = "0" + serial_number
+
+        return Certificate(
+            subject=self._subject_from_name(cert.subject),
+            issuer=self._subject_from_name(cert.issuer),
+            serial_number=serial_number,
+            version=cert.version.value + 1,
+            not_before=not_before,
+            not_after=not_after,
+            signature_algorithm=_SIGNATURE_ALGORITHMS.get(
+                cert.signature_algorithm_oid,
+                cert.signature_algorithm_oid.dotted_string,
+            ),
+            public_key_algorithm=next(
+                (
+                    name
+                    for key_type, name in _PUBLIC_KEY_ALGORITHMS
+                    if isinstance(public_key, key_type)
+                ),
+                "unknown",
+            ),
+            public_key_size=getattr(public_key, "key_size", 0),
+            subject_alternative_names=sans,
+            fingerprint_sha256=cert.fingerprint(hashes.SHA256()).hex(":").upper(),
+        )
+
+    @staticmethod
+    def _subject_from_name(name: "x509.Name") -> CertificateSubject:
+        """Build a CertificateSubject from an X.509 subject or issuer name."""
+        fields = {}
+        for field, oid in _SUBJECT_ATTRIBUTES.items():
+            attributes = name.get_attributes_for_oid(oid)
+            if attributes:
+                fields[field] = str(attributes[0].value)
+        fields.setdefault("common_name", "unknown")
+        return CertificateSubject(**fields)
+
     def _parse_certificate_chain(self, output: str) -> list[Certificate]:
         """Parse certificate chain from openssl s_client output."""
         certificates = []
 
-        # Split output into individual certificates
-        cert_pattern = r"-----BEGIN CERTIFICATE-----.*?-----END CERTIFICATE-----"
-        cert_texts = re.findall(cert_pattern, output, re.DOTALL)
-
-        for cert_text in cert_texts:
+        # Skip the OCSP responder certificate `-status` prints before the chain
+        chain_start = max(output.find("Certificate chain"), 0)
+        for cert_text in _iter_pem_blocks(output[chain_start:]):
             try:
-                cert = self._parse_certificate(cert_text)
+                cert = self._parse_cached(
+                    cert_text.encode(),
+                    lambda pem: self._parse_certificate(pem.decode()),
+                )
                 if cert:
                     certificates.append(cert)
             except Exception:
@@ -134,9 +513,20 @@ class OpenSSLAdapter(CertificatePort):
 
     def _parse_certificate(self, cert_pem: str) -> Optional[Certificate]:
         """Parse a single PEM certificate."""
+        if _CRYPTOGRAPHY_AVAILABLE:
+            try:
+                return self._certificate_from_pem(cert_pem)
+            except Exception:
+                # Not loadable by this cryptography version; use openssl
+                pass
+        return self._parse_certificate_with_openssl(cert_pem)
+
+    def _parse_certificate_with_openssl(self, cert_pem: str) -> Optional[Certificate]:
+        """Parse a single PEM certificate with the `openssl x509` command."""
         try:
-            # Use openssl x509 to parse certificate details
-            cmd = ["openssl", "x509", "-text", "-noout"]
+            # Use openssl x509 to parse certificate details, including the
+            # SHA-256 fingerprint in the same output
+            cmd = ["openssl", "x509", "-text", "-noout", "-fingerprint", "-sha256"]
 
             result = subprocess.run(
                 cmd, input=cert_pem, capture_output=True, text=True, timeout=5
@@ -147,27 +537,24 @@ class OpenSSLAdapter(CertificatePort):
 
             text = result.stdout
 
-            # Parse subject
-            subject = self._parse_subject(text, "Subject:")
-
-            # Parse issuer
-            issuer = self._parse_subject(text, "Issuer:")
+            # Parse subject and issuer, finding both DN lines in one pass
+            dn_lines = self._find_dn_lines(text)
+            subject = self._parse_subject(dn_lines.get("Subject"))
+            issuer = self._parse_subject(dn_lines.get("Issuer"))
 
             # Parse serial number
-            serial_match = re.search(
-                r"Serial Number:\s*\n?\s*([0-9a-f:]+)", text, re.IGNORECASE
-            )
+            serial_match = _SERIAL_RE.search(text)
             serial_number = (
                 serial_match.group(1).replace(":", "") if serial_match else ""
             )
 
             # Parse version
-            version_match = re.search(r"Version:\s*(\d+)", text)
+            version_match = _VERSION_RE.search(text)
             version = int(version_match.group(1)) if version_match else 3
 
             # Parse validity dates
-            not_before_match = re.search(r"Not Before\s*:\s*(.+)", text)
-            not_after_match = re.search(r"Not After\s*:\s*(.+)", text)
+            not_before_match = _NOT_BEFORE_RE.search(text)
+            not_after_match = _NOT_AFTER_RE.search(text)
 
             not_before = (
                 self._parse_openssl_date(not_before_match.group(1))
@@ -181,24 +568,24 @@ class OpenSSLAdapter(CertificatePort):
             )
 
             # Parse signature algorithm
-            sig_algo_match = re.search(r"Signature Algorithm:\s*(.+)", text)
+            sig_algo_match = _SIG_ALGO_RE.search(text)
             signature_algorithm = (
                 sig_algo_match.group(1).strip() if sig_algo_match else "unknown"
             )
 
             # Parse public key info
-            pubkey_match = re.search(r"Public Key Algorithm:\s*(.+)", text)
+            pubkey_match = _PUBKEY_ALGO_RE.search(text)
             public_key_algorithm = (
                 pubkey_match.group(1).strip() if pubkey_match else "unknown"
             )
 
-            pubkey_size_match = re.search(r"Public-Key:\s*\((\d+)\s*bit\)", text)
+            pubkey_size_match = _PUBKEY_SIZE_RE.search(text)
             public_key_size = (
                 int(pubkey_size_match.group(1)) if pubkey_size_match else 0
             )
 
             # Parse SANs
-            san_match = re.search(r"Subject Alternative Name:\s*\n\s*(.+)", text)
+            san_match = _SAN_RE.search(text)
             sans = []
             if san_match:
                 san_text = san_match.group(1)
@@ -208,20 +595,9 @@ class OpenSSLAdapter(CertificatePort):
                     if "DNS:" in s
                 ]
 
-            # Get fingerprint (SHA256)
-            fingerprint_cmd = ["openssl", "x509", "-fingerprint", "-sha256", "-noout"]
-            fp_result = subprocess.run(
-                fingerprint_cmd,
-                input=cert_pem,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            fingerprint = ""
-            if fp_result.returncode == 0:
-                fp_match = re.search(r"Fingerprint=(.+)", fp_result.stdout)
-                fingerprint = fp_match.group(1).strip() if fp_match else ""
+            # Parse fingerprint (SHA256)
+            fp_match = _FINGERPRINT_RE.search(text)
+            fingerprint = fp_match.group(1).strip() if fp_match else ""
 
             return Certificate(
                 subject=subject,
@@ -240,14 +616,21 @@ class OpenSSLAdapter(CertificatePort):
         except Exception:
             return None
 
-    def _parse_subject(self, text: str, prefix: str) -> CertificateSubject:
-        """Parse subject or issuer from certificate text."""
-        match = re.search(f"{prefix}(.+)", text)
-        if not match:
+    @staticmethod
+    def _find_dn_lines(text: str) -> dict[str, str]:
+        """Map "Subject"/"Issuer" to the first DN of each in certificate text."""
+        dn_lines: dict[str, str] = {}
+        for match in _DN_LINE_RE.finditer(text):
+            dn_lines.setdefault(match.group(1), match.group(2).strip())
+            if len(dn_lines) == 2:
+                break
+        return dn_lines
+
+    def _parse_subject(self, subject_text: Optional[str]) -> CertificateSubject:
+        """Parse a subject or issuer DN (as found by _find_dn_lines)."""
+        if not subject_text:
             return CertificateSubject(common_name="unknown")
 
-        subject_text = match.group(1).strip()
-
         # Parse DN components
         cn = self._extract_dn_field(subject_text, "CN")
         o = self._extract_dn_field(subject_text, "O")
@@ -267,22 +650,41 @@ class OpenSSLAdapter(CertificatePort):
 
     def _extract_dn_field(self, dn: str, field: str) -> Optional[str]:
         """Extract a field from a Distinguished Name."""
-        pattern = f"{field}\\s*=\\s*([^,]+)"
-        match = re.search(pattern, dn)
+        match = _DN_FIELD_RES[field].search(dn)
         return match.group(1).strip() if match else None
 
     def _parse_openssl_date(self, date_str: str) -> datetime:
-        """Parse OpenSSL date format."""
+        """Parse OpenSSL date format.
+
+        The format is fixed, so it is split by hand rather than with
+        strptime, which is slow. Anything unexpected falls back to strptime.
+        """
+        # OpenSSL format: "Jan  1 00:00:00 2024 GMT"
+        try:
+            month, day, clock, year, _ = date_str.split()
+            hour, minute, second = clock.split(":")
+            return datetime(
+                int(year),
+                _MONTHS[month],
+                int(day),
+                int(hour),
+                int(minute),
+                int(second),
+            )
+        except (KeyError, ValueError):
+            pass
+
         try:
-            # OpenSSL format: "Jan  1 00:00:00 2024 GMT"
             return datetime.strptime(date_str.strip(), "%b %d %H:%M:%S %Y %Z")
         except ValueError:
             return datetime.now()
 
     def _get_supported_tls_versions(self, host: str, port: int) -> list[TLSVersion]:
-        """Get supported TLS versions."""
-        supported = []
+        """Get supported TLS versions.
 
+        The per-version probes are independent handshakes, so they run
+        concurrently and cost roughly one probe's latency overall.
+        """
         # Test each TLS version
         versions_to_test = [
             (TLSVersion.TLS_1_3, "tls1_3"),
@@ -291,20 +693,34 @@ class OpenSSLAdapter(CertificatePort):
             (TLSVersion.TLS_1_0, "tls1"),
         ]
 
-        for version_enum, version_flag in versions_to_test:
-            cmd = f"echo Q | openssl s_client -{version_flag} -connect {host}:{port} -brief 2>&1"
+        with ThreadPoolExecutor(max_workers=len(versions_to_test)) as executor:
+            results = executor.map(
+                lambda version: self._probe_version(host, port, version[1]),
+                versions_to_test,
+            )
 
-            try:
-                result = subprocess.run(
-                    cmd, shell=True, capture_output=True, text=True, timeout=2
-                )
+            return [
+                version_enum
+                for (version_enum, _), supported in zip(versions_to_test, results)
+                if supported
+            ]
 
-                if result.returncode == 0 and "Verification error" not in result.stdout:
-                    supported.append(version_enum)
-            except:
-                continue
+    def _probe_version(self, host: str, port: int, version_flag: str) -> bool:
+        """Check whether a handshake succeeds when forced to one TLS version.
+
+        Args:
+            version_flag: s_client protocol flag, e.g. "tls1_2"
+        """
+        cmd = f"echo Q | openssl s_client -{version_flag} -connect {host}:{port} -brief 2>&1"
+
+        try:
+            result = subprocess.run(
+                cmd, shell=True, capture_output=True, text=True, timeout=2
+            )
+        except (subprocess.SubprocessError, OSError):
+            return False
 
-        return supported
+        return result.returncode == 0 and "Verification error" not in result.stdout
 
     def verify_certificate(
         self, host: str, port: int = 443, servername: Optional[str] = None
@@ -322,29 +738,27 @@ class OpenSSLAdapter(CertificatePort):
                 cmd, shell=True, capture_output=True, text=True, timeout=2
             )
 
-            return "OCSP Response Status: successful" in result.stdout
+            return _OCSP_STAPLED_MARKER in result.stdout
 
         except:
             return False
 
     def get_supported_cipher_suites(self, host: str, port: int = 443) -> list[str]:
-        """Get the list of supported cipher suites."""
-        try:
-            cmd = f"echo Q | openssl s_client -connect {host}:{port} -cipher ALL -brief 2>&1"
+        """Get the list of supported cipher suites.
 
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, timeout=2
-            )
-
-            # Parse cipher from output
-            cipher_match = re.search(r"Cipher:\s*(.+)", result.stdout)
-            if cipher_match:
-                return [cipher_match.group(1).strip()]
-
-            return []
+        Only the cipher negotiated with the default client configuration is
+        reported, read from the same handshake used to fetch the chain.
+        """
+        _, raw_output = self.get_certificate_chain(host, port)
+        return self._negotiated_ciphers(raw_output)
 
-        except:
-            return []
+    @staticmethod
+    def _negotiated_ciphers(raw_output: str) -> list[str]:
+        """Extract the negotiated cipher from chain output, if one was agreed."""
+        cipher_match = _CIPHER_RE.search(raw_output)
+        if cipher_match and cipher_match.group(1) != "(NONE)":
+            return [cipher_match.group(1)]
+        return []
 
     def export_certificate_pem(self, certificate: Certificate) -> str:
         """Export a certificate in PEM format."""
@@ -352,15 +766,17 @@ class OpenSSLAdapter(CertificatePort):
         # For now, return a placeholder
         return "# Certificate export not yet implemented"
 
+    @staticmethod
+    def tool_is_available() -> bool:
+        """Check if an openssl executable is on PATH, without running it.
+
+        Cached for the life of the process (see is_tool_available).
+        """
+        return is_tool_available("openssl")
+
     def is_available(self) -> bool:
         """Check if OpenSSL is available."""
-        try:
-            subprocess.run(
-                ["openssl", "version"], capture_output=True, timeout=5, check=True
-            )
-            return True
-        except:
-            return False
+        return is_tool_available("openssl")
 
     def get_tool_name(self) -> str:
         """Get the name of the certificate tool."""
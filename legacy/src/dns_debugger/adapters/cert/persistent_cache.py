@@ -0,0 +1,127 @@
+"""Certificate adapter decorator that persists TLS results on disk between runs."""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from dns_debugger.domain.models.certificate import (
+    Certificate,
+    CertificateChain,
+    TLSInfo,
+)
+from dns_debugger.domain.ports.cert_port import CertificatePort
+from dns_debugger.adapters.disk_cache import DiskCache
+
+
+class PersistentCachingCertificatePort(CertificatePort):
+    """CertificatePort decorator that keeps handshake results in a DiskCache.
+
+    Results are kept until the leaf certificate expires, but at most
+    max_ttl seconds so that reissued or revoked certificates are picked up.
+    Failed handshakes (no certificates) are never stored.
+    """
+
+    def __init__(
+        self, adapter: CertificatePort, cache: DiskCache, max_ttl: int = 43200
+    ):
+        """Wrap a certificate adapter.
+
+        Args:
+            adapter: The adapter to delegate cache misses to
+            cache: Disk cache to store results in
+            max_ttl: Upper bound in seconds on how long a result is kept
+        """
+        self._adapter = adapter
+        self._cache = cache
+        self._max_ttl = max_ttl
+
+    def __getattr__(self, name: str) -> Any:
+        """Expose the wrapped adapter's extra methods."""
+        return getattr(self._adapter, name)
+
+    @staticmethod
+    def _key(kind: str, host: str, port: int, servername: Optional[str]) -> str:
+        """Build the cache key for a lookup."""
+        return f"cert:{kind}:{host.lower()}:{port}:{servername or ''}"
+
+    def _ttl(self, chain: CertificateChain) -> float:
+        """Seconds a chain may be cached (0 if it should not be)."""
+        leaf = chain.leaf_certificate
+        if leaf is None:
+            return 0
+        remaining = (leaf.not_after - datetime.utcnow()).total_seconds()
+        return min(remaining, self._max_ttl)
+
+    def get_certificate_info(
+        self, host: str, port: int = 443, servername: Optional[str] = None
+    ) -> TLSInfo:
+        """Get SSL/TLS certificate information, answering from disk when possible."""
+        key = self._key("info", host, port, servername)
+        tls_info = self._cache.get(key, TLSInfo)
+        if tls_info is None:
+            tls_info = self._adapter.get_certificate_info(host, port, servername)
+            self._cache.put(key, tls_info, self._ttl(tls_info.certificate_chain))
+        return tls_info
+
+    def probe_full_tls_matrix(
+        self, host: str, port: int = 443, servername: Optional[str] = None
+    ) -> TLSInfo:
+        """Get the full TLS probe results, answering from disk when possible."""
+        key = self._key("matrix", host, port, servername)
+        tls_info = self._cache.get(key, TLSInfo)
+        if tls_info is None:
+            tls_info = self._adapter.probe_full_tls_matrix(host, port, servername)
+            self._cache.put(key, tls_info, self._ttl(tls_info.certificate_chain))
+        return tls_info
+
+    def get_certificate_chain(
+        self, host: str, port: int = 443, servername: Optional[str] = None
+    ) -> tuple[CertificateChain, str]:
+        """Get the full certificate chain, answering from disk when possible."""
+        key = self._key("chain", host, port, servername)
+        result = self._cache.get(key, tuple[CertificateChain, str])
+        if result is None:
+            result = self._adapter.get_certificate_chain(host, port, servername)
+            self._cache.put(key, result, self._ttl(result[0]))
+        return result
+
+    def verify_certificate(
+        self, host: str, port: int = 443, servername: Optional[str] = None
+    ) -> tuple[bool, list[str]]:
+        """Verify the certificate and chain for a host (not cached)."""
+        return self._adapter.verify_certificate(host, port, servername)
+
+    def check_ocsp_stapling(self, host: str, port: int = 443) -> bool:
+        """Check if OCSP stapling is enabled (not cached)."""
+        return self._adapter.check_ocsp_stapling(host, port)
+
+    def get_supported_cipher_suites(self, host: str, port: int = 443) -> list[str]:
+        """Get the list of supported cipher suites (not cached)."""
+        return self._adapter.get_supported_cipher_suites(host, port)
+
+    def export_certificate_pem(self, certificate: Certificate) -> str:
+        """Export a certificate in PEM format."""
+        return self._adapter.export_certificate_pem(certificate)
+
+    def forget_domain(self, domain: str) -> None:
+        """Delete the stored results for a domain and its subdomains."""
+        name = domain.lower().rstrip(".")
+        self._cache.delete_matching(f"cert:*:{name}:*")
+        self._cache.delete_matching(f"cert:*:*.{name}:*")
+
+    def clear_cache(self) -> None:
+        """Drop the wrapped adapter's in-memory caches.
+
+        Persisted results are kept until they expire (or until
+        forget_domain() is called), so that clearing caches on launch or
+        refresh does not make the next run a cold one.
+        """
+        if hasattr(self._adapter, "clear_cache"):
+            self._adapter.clear_cache()
+
+    def is_available(self) -> bool:
+        """Check if the wrapped certificate tool is available."""
+        return self._adapter.is_available()
+
+    def get_tool_name(self) -> str:
+        """Get the name of the wrapped certificate tool."""
+        return self._adapter.get_tool_name()
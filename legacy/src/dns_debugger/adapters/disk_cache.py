@@ -0,0 +1,228 @@
+"""SQLite-backed result cache shared across process runs."""
+
+import dataclasses
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Optional, Union, get_args, get_origin, get_type_hints
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def default_cache_path() -> Path:
+    """Return the default cache database path (under $XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "dns_debugger" / "cache.sqlite"
+
+
+def _to_jsonable(value: Any) -> Any:
+    """Convert a domain model into JSON-compatible values.
+
+    Dataclasses become dicts of their init fields (derived fields such as
+    DNSResponse's type index are rebuilt on demand), enums their values and
+    datetimes ISO 8601 strings.
+    """
+    if dataclasses.is_dataclass(value):
+        return {
+            field.name: _to_jsonable(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+            if field.init
+        }
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_jsonable(item) for key, item in value.items()}
+    return value
+
+
+def _from_jsonable(value_type: Any, data: Any) -> Any:
+    """Rebuild a value of value_type (a type annotation) from _to_jsonable() output."""
+    if data is None:
+        return None
+    origin = get_origin(value_type)
+    if origin is Union:
+        # Optional[X]
+        (value_type,) = [arg for arg in get_args(value_type) if arg is not type(None)]
+        return _from_jsonable(value_type, data)
+    if origin is list:
+        (item_type,) = get_args(value_type)
+        return [_from_jsonable(item_type, item) for item in data]
+    if origin is tuple:
+        return tuple(
+            _from_jsonable(item_type, item)
+            for item_type, item in zip(get_args(value_type), data)
+        )
+    if dataclasses.is_dataclass(value_type) and isinstance(value_type, type):
+        hints = get_type_hints(value_type)
+        return value_type(
+            **{
+                field.name: _from_jsonable(hints[field.name], data[field.name])
+                for field in dataclasses.fields(value_type)
+                if field.init
+            }
+        )
+    if isinstance(value_type, type) and issubclass(value_type, Enum):
+        return value_type(data)
+    if value_type is datetime:
+        return datetime.fromisoformat(data)
+    return data
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a domain model to JSON, using orjson when it is installed."""
+    data = _to_jsonable(value)
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _loads(blob: bytes) -> Any:
+    """Parse JSON written by _dumps()."""
+    if orjson is not None:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
+class DiskCache:
+    """Key/value store with per-entry expiry, persisted in SQLite.
+
+    Values are domain model dataclasses stored as JSON, so reading a cache
+    file can never execute code. The cache is an optimization only: any
+    database error is treated as a miss (or a skipped write) rather than
+    surfaced to the caller, and an entry that cannot be decoded (e.g. one
+    written by an older version) is deleted and treated as a miss.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        """Open (creating if needed) the cache database.
+
+        Args:
+            path: Database file (defaults to default_cache_path())
+        """
+        self._path = Path(path) if path else default_cache_path()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self._path, timeout=5, check_same_thread=False, isolation_level=None
+            )
+            # WAL lets several processes read while one writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache"
+                " (key TEXT PRIMARY KEY, expiry REAL NOT NULL, blob BLOB NOT NULL)"
+            )
+            self._conn = conn
+        except (OSError, sqlite3.Error):
+            # Unwritable cache directory etc.: behave as an always-empty cache
+            self._conn = None
+
+    def get(self, key: str, value_type: Any) -> Optional[Any]:
+        """Return the cached value for a key, or None if missing or expired.
+
+        Args:
+            key: Cache key
+            value_type: Type the value was stored as (e.g. DNSResponse or
+                tuple[CertificateChain, str]), used to rebuild it
+        """
+        entry = self.get_with_ttl(key, value_type)
+        return entry[0] if entry is not None else None
+
+    def get_with_ttl(self, key: str, value_type: Any) -> Optional[tuple[Any, float]]:
+        """Like get(), but also return how many seconds the entry has left.
+
+        Returns:
+            Tuple of (value, remaining seconds), or None if missing or expired
+        """
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT expiry, blob FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                remaining = row[0] - time.time()
+                if remaining <= 0:
+                    self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    return None
+        except sqlite3.Error:
+            return None
+
+        try:
+            return _from_jsonable(value_type, _loads(row[1])), remaining
+        except Exception:
+            # Undecodable or from an older model layout: drop it
+            self._delete(key)
+            return None
+
+    def put(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value for ttl seconds (ignored if ttl is not positive)."""
+        if self._conn is None or ttl <= 0:
+            return
+        try:
+            blob = _dumps(value)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, expiry, blob) VALUES (?, ?, ?)",
+                    (key, time.time() + ttl, blob),
+                )
+        except (sqlite3.Error, TypeError, ValueError):
+            # ValueError/TypeError: a value JSON cannot represent
+            pass
+
+    def _delete(self, key: str) -> None:
+        """Delete one entry."""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+        except sqlite3.Error:
+            pass
+
+    def delete_matching(self, pattern: str) -> None:
+        """Delete every entry whose key matches a SQLite GLOB pattern."""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM cache WHERE key GLOB ?", (pattern,))
+        except sqlite3.Error:
+            pass
+
+    def purge_expired(self) -> None:
+        """Delete every expired entry."""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE expiry <= ?", (time.time(),)
+                )
+        except sqlite3.Error:
+            pass
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM cache")
+        except sqlite3.Error:
+            pass
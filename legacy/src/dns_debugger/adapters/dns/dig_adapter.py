@@ -1,10 +1,16 @@
 """DNS adapter implementation using the 'dig' command (fallback)."""
 
+import base64
+import functools
 import re
+import struct
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, Hashable, Iterable, Optional, TypeVar
 
 from dns_debugger.domain.models.dns_record import (
     DNSQuery,
@@ -24,6 +30,118 @@ from dns_debugger.domain.models.dnssec_info import (
     ZoneData,
 )
 from dns_debugger.domain.ports.dns_port import DNSPort
+from dns_debugger.adapters.dns.dnspython_adapter import DnsPythonAdapter
+from dns_debugger.adapters.dns.iterative_trace import (
+    ITERATIVE_TRACE_AVAILABLE,
+    trace_from_root,
+)
+from dns_debugger.adapters.tool_probe import is_tool_available, tool_path
+
+# Answer line (NAME TTL CLASS TYPE RDATA); comment lines start with ";"
+_DIG_ANSWER_RE = re.compile(
+    r"^(?!;)(\S+)[ \t]+(\d+)[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S.*?)\s*$", re.MULTILINE
+)
+
+# Line closing each step of `dig +trace` output, e.g.
+# ";; Received 525 bytes from 198.41.0.4#53(a.root-servers.net) in 12 ms"
+_TRACE_RECEIVED_RE = re.compile(
+    r"^;; Received \d+ bytes from ([^#\s]+)#\d+\(([^)]*)\) in (\d+) ms", re.MULTILINE
+)
+
+_RECORD_TYPE_VALUES = frozenset(rt.value for rt in RecordType)
+
+# Version line printed by `dig -v`
+_DIG_VERSION_RE = re.compile(rb"^DiG\s+([\d.]+)", re.MULTILINE)
+
+# DNSKEY record in `dig +multi` output: TTL, flags, protocol, algorithm, then
+# either the key in parentheses (possibly over several lines) followed by a
+# comment such as "; KSK; alg = ECDSAP256SHA256 ; key id = 2371", or the key
+# on the rest of the line
+_DNSKEY_RE = re.compile(
+    r"^[ \t]*[^;\s]\S*[ \t]+(\d+)[ \t]+\S+[ \t]+DNSKEY[ \t]+(\d+)[ \t]+(\d+)[ \t]+(\d+)"
+    r"[ \t]+(?:\(([^)]*)\)([^\n]*)|([^(\n]*)$)",
+    re.MULTILINE,
+)
+
+# Key tag in the comment dig +multi prints after a DNSKEY ("; key id = 20326")
+_KEY_TAG_RE = re.compile(r"key\s+(?:id|tag)\s*=\s*(\d+)")
+
+# DS / DNSKEY RDATA: three integer fields followed by the digest or key
+_NUMERIC_RDATA_RE = re.compile(r"(\d+)\s+(\d+)\s+(\d+)\s+(\S.*)", re.DOTALL)
+
+# DNSSEC algorithm numbers (RFC 8624) and DS digest types
+_ALG_MAP = {
+    1: DNSSECAlgorithm.RSAMD5,
+    2: DNSSECAlgorithm.DH,
+    3: DNSSECAlgorithm.DSA,
+    5: DNSSECAlgorithm.RSASHA1,
+    6: DNSSECAlgorithm.DSA_NSEC3_SHA1,
+    7: DNSSECAlgorithm.RSASHA1_NSEC3_SHA1,
+    8: DNSSECAlgorithm.RSASHA256,
+    10: DNSSECAlgorithm.RSASHA512,
+    12: DNSSECAlgorithm.ECC_GOST,
+    13: DNSSECAlgorithm.ECDSAP256SHA256,
+    14: DNSSECAlgorithm.ECDSAP384SHA384,
+    15: DNSSECAlgorithm.ED25519,
+    16: DNSSECAlgorithm.ED448,
+}
+_DIGEST_MAP = {
+    1: DigestType.SHA1,
+    2: DigestType.SHA256,
+    3: DigestType.GOST,
+    4: DigestType.SHA384,
+}
+
+
+def _dig_executable() -> str:
+    """Return the absolute path of dig, found once per process."""
+    return tool_path("dig") or "dig"
+
+
+@functools.lru_cache(maxsize=None)
+def _dig_version() -> Optional[str]:
+    """Run `dig -v` once and return the version it reports."""
+    try:
+        result = subprocess.run(
+            [_dig_executable(), "-v"],
+            capture_output=True,
+            timeout=5,
+            check=True,
+        )
+        # dig prints its version (e.g. "DiG 9.10.6") to stderr
+        match = _DIG_VERSION_RE.search(result.stderr) or _DIG_VERSION_RE.search(
+            result.stdout
+        )
+        return match.group(1).decode("ascii") if match else None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _decode(output: bytes) -> str:
+    """Decode captured dig output (ASCII in practice; bad bytes are replaced)."""
+    return output.decode("utf-8", "replace")
+
+
+def _question_key(name: str) -> str:
+    """Normalize a query name for matching dig's question lines ("." -> "")."""
+    return name.rstrip(".").lower()
+
+
+def _short_answers(output: bytes) -> list[str]:
+    """Split `dig +short` output into names/addresses without trailing dots."""
+    return [
+        line.strip().rstrip(b".").decode("ascii", "replace")
+        for line in output.splitlines()
+        if line.strip()
+    ]
+
+
+# Shared by all adapters for independent dig runs (per-nameserver batches,
+# DNSSEC chain lookups); tasks never wait on each other, so a fixed-size
+# pool cannot deadlock
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="dig")
+
+T = TypeVar("T")
 
 
 class DigAdapter(DNSPort):
@@ -31,19 +149,87 @@ class DigAdapter(DNSPort):
 
     dig is the traditional DNS lookup utility from BIND.
     Used as a fallback when dog is not available.
+
+    When dnspython is installed, plain lookups (query, query_multiple_types,
+    reverse_lookup and the nameserver discovery behind them) are sent
+    in-process through a DnsPythonAdapter instead of forking dig for each
+    one. dig is still run for the DNSSEC lookups, which rely on its +multi
+    key tags.
     """
 
-    def __init__(self):
-        """Initialize the dig adapter."""
+    # Upper bound in seconds on how long DNSKEY and DS lookups are reused
+    DNSKEY_CACHE_MAX_TTL = 3600
+
+    def __init__(
+        self, timeout: float = 5.0, trace_timeout: float = 30.0, in_process: bool = True
+    ):
+        """Initialize the dig adapter.
+
+        Args:
+            timeout: Seconds a dig run may take before it is abandoned, so a
+                dead resolver fails fast instead of holding a pool worker
+            trace_timeout: Seconds allowed for a full `dig +trace`
+            in_process: Send plain lookups with dnspython when it is
+                installed; False runs dig for every lookup
+        """
+        self._timeout = timeout
+        self._trace_timeout = trace_timeout
+        # In-process resolver for plain lookups, or None to run dig for them
+        self._inprocess: Optional[DnsPythonAdapter] = None
+        if in_process:
+            adapter = DnsPythonAdapter(timeout=timeout)
+            if adapter.is_available():
+                self._inprocess = adapter
         # Cache for authoritative nameservers to avoid repeated lookups
-        self._ns_cache = {}
+        self._ns_cache: dict[str, Optional[str]] = {}
+        # Zone -> (expiry, (DNSKEY records, raw output)). The root and TLD
+        # keys are fetched by every DNSSEC validation, so reusing them for
+        # their TTL saves most of each chain walk.
+        self._dnskey_cache: dict[str, tuple[float, tuple[list[DNSKEYRecord], str]]] = {}
+        # Delegated name -> (expiry, DS records). Sibling domains share every
+        # DS lookup above their own, so these are reused the same way.
+        self._ds_cache: dict[str, tuple[float, list[DSRecord]]] = {}
+        # Lookups currently running, awaited by concurrent identical callers
+        self._inflight: dict[Hashable, "Future[Any]"] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _single_flight(self, key: Hashable, fetch: Callable[[], T]) -> T:
+        """Run fetch(), or wait for the identical lookup already running.
+
+        The DNSSEC panel and the dashboard validate the same domain at the
+        same time, and per-type queries discover the same nameserver, so
+        concurrent callers with the same key share one lookup (whose result
+        then lands in the caches above).
+        """
+        with self._inflight_lock:
+            running = self._inflight.get(key)
+            if running is None:
+                future: "Future[T]" = Future()
+                self._inflight[key] = future
+
+        if running is not None:
+            result: T = running.result()
+            return result
+
+        try:
+            result = fetch()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
 
     def clear_cache(self) -> None:
-        """Clear the authoritative nameserver cache.
+        """Clear the authoritative nameserver, DNSKEY and DS caches.
 
-        This should be called when refreshing data to ensure fresh NS lookups.
+        This should be called when refreshing data to ensure fresh lookups.
         """
         self._ns_cache.clear()
+        self._dnskey_cache.clear()
+        self._ds_cache.clear()
 
     def _get_authoritative_nameserver(
         self, domain: str, for_ds_query: bool = False
@@ -62,219 +248,231 @@ class DigAdapter(DNSPort):
         if cache_key in self._ns_cache:
             return self._ns_cache[cache_key]
 
-        try:
-            # Query for NS records
-            cmd = ["dig", "+short", domain, "NS"]
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=5, check=False
-            )
+        return self._single_flight(
+            ("ns", cache_key),
+            lambda: self._find_authoritative_nameserver(domain, cache_key),
+        )
 
-            if result.returncode == 0 and result.stdout.strip():
-                # Get first nameserver
-                nameservers = [
-                    ns.strip().rstrip(".")
-                    for ns in result.stdout.strip().split("\n")
-                    if ns.strip()
-                ]
-                if nameservers:
-                    # Resolve the nameserver to an IP
-                    ns_host = nameservers[0]
-                    resolve_cmd = ["dig", "+short", ns_host, "A"]
-                    resolve_result = subprocess.run(
-                        resolve_cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                        check=False,
-                    )
-                    if resolve_result.returncode == 0 and resolve_result.stdout.strip():
-                        ips = [
-                            ip.strip()
-                            for ip in resolve_result.stdout.strip().split("\n")
-                            if ip.strip()
-                        ]
-                        if ips:
-                            # Cache the result
-                            result = ips[0]
-                            self._ns_cache[cache_key] = result
-                            return result
+    def _find_authoritative_nameserver(
+        self, domain: str, cache_key: str
+    ) -> Optional[str]:
+        """Look up the first nameserver of a domain and cache its address."""
+        try:
+            # Get first nameserver
+            nameservers = self._short_lookup(domain, RecordType.NS)
+            if nameservers:
+                # Resolve the nameserver to an IP
+                ips = self._short_lookup(nameservers[0], RecordType.A)
+                if ips:
+                    # Cache the result
+                    self._ns_cache[cache_key] = ips[0]
+                    return ips[0]
 
             # Cache None result if we didn't find one (will use system resolver)
             self._ns_cache[cache_key] = None
             return None
-        except Exception:
+        except (OSError, subprocess.SubprocessError):
             # Cache None on error
             self._ns_cache[cache_key] = None
             return None
 
+    def _short_lookup(self, name: str, record_type: RecordType) -> list[str]:
+        """Look up a name with the system resolver, like `dig +short`.
+
+        Returns:
+            Answer values without trailing dots (empty if the lookup failed)
+        """
+        if self._inprocess is not None:
+            response = self._inprocess.query(name, record_type)
+            return [record.value.rstrip(".") for record in response.records]
+
+        cmd = [_dig_executable(), "+short", name, record_type.value]
+        result = subprocess.run(
+            cmd, capture_output=True, timeout=self._timeout, check=False
+        )
+        return _short_answers(result.stdout) if result.returncode == 0 else []
+
+    def _select_resolver(
+        self, domain: str, record_type: RecordType, resolver: Optional[str]
+    ) -> Optional[str]:
+        """Pick the nameserver for a query, preferring authoritative servers.
+
+        Returns:
+            The explicit resolver if given, otherwise an authoritative
+            nameserver IP, or None to fall back to the system resolver
+        """
+        if resolver:
+            return resolver
+
+        # For DS records, query the parent zone's nameservers
+        if record_type == RecordType.DS:
+            # Get parent domain (e.g., "ca" from "dmbtechservices.ca")
+            parts = domain.rstrip(".").split(".")
+            if len(parts) > 1:
+                parent_domain = ".".join(parts[1:])
+                return self._get_authoritative_nameserver(
+                    parent_domain, for_ds_query=True
+                )
+            return None
+
+        # For other records, query the domain's own nameservers
+        return self._get_authoritative_nameserver(domain, for_ds_query=False)
+
     def query(
         self, domain: str, record_type: RecordType, resolver: Optional[str] = None
     ) -> DNSResponse:
         """Execute a DNS query using dig, preferring authoritative nameservers."""
-        start_time = datetime.now()
+        start = time.perf_counter()
         query_obj = DNSQuery(domain=domain, record_type=record_type, resolver=resolver)
 
         # If no resolver specified, try to use authoritative nameserver
-        if not resolver:
-            # For DS records, query the parent zone's nameservers
-            if record_type == RecordType.DS:
-                # Get parent domain (e.g., "ca" from "dmbtechservices.ca")
-                parts = domain.rstrip(".").split(".")
-                if len(parts) > 1:
-                    parent_domain = ".".join(parts[1:])
-                    resolver = self._get_authoritative_nameserver(
-                        parent_domain, for_ds_query=True
-                    )
-            else:
-                # For other records, query the domain's own nameservers
-                resolver = self._get_authoritative_nameserver(
-                    domain, for_ds_query=False
-                )
+        resolver = self._select_resolver(domain, record_type, resolver)
+        if self._inprocess is not None:
+            return self._inprocess.query(domain, record_type, resolver)
 
         # Build dig command
-        cmd = ["dig", "+noall", "+answer", domain, record_type.value]
+        cmd = [_dig_executable(), "+noall", "+answer", domain, record_type.value]
         if resolver:
             cmd.insert(1, f"@{resolver}")
 
         try:
             result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=10, check=True
+                cmd, capture_output=True, timeout=self._timeout, check=False
             )
-
-            records = self._parse_dig_output(result.stdout, domain, record_type)
-            query_time = (datetime.now() - start_time).total_seconds() * 1000
-            resolver_used = resolver or "system"
-
-            return DNSResponse(
-                query=query_obj,
-                records=records,
-                query_time_ms=query_time,
-                resolver_used=resolver_used,
-                timestamp=datetime.now(),
-                has_dnssec=False,
-                raw_data={"raw_output": result.stdout},
-            )
-
-        except subprocess.CalledProcessError as e:
-            query_time = (datetime.now() - start_time).total_seconds() * 1000
-
-            return DNSResponse(
-                query=query_obj,
-                records=[],
-                query_time_ms=query_time,
-                resolver_used=resolver or "system",
-                timestamp=datetime.now(),
-                error=f"Query failed: {e.stderr}",
-            )
-        except Exception as e:
-            query_time = (datetime.now() - start_time).total_seconds() * 1000
-            return DNSResponse(
-                query=query_obj,
-                records=[],
-                query_time_ms=query_time,
-                resolver_used=resolver or "system",
-                timestamp=datetime.now(),
-                error=f"Unexpected error: {str(e)}",
+        except (OSError, subprocess.SubprocessError) as e:
+            return self._error_response(
+                query_obj, start, f"Query failed: {e}", resolver
             )
+        if result.returncode != 0:
+            error = f"Query failed: {_decode(result.stderr)}"
+            return self._error_response(query_obj, start, error, resolver)
+
+        output = _decode(result.stdout)
+        return DNSResponse(
+            query=query_obj,
+            records=self._parse_dig_output(output, domain, record_type),
+            query_time_ms=(time.perf_counter() - start) * 1000,
+            resolver_used=resolver or "system",
+            timestamp=datetime.now(),
+            has_dnssec=False,
+            raw_data={"raw_output": output},
+        )
+
+    @staticmethod
+    def _error_response(
+        query_obj: DNSQuery, start: float, error: str, resolver: Optional[str]
+    ) -> DNSResponse:
+        """Build the response for a failed query started at perf_counter() start."""
+        return DNSResponse(
+            query=query_obj,
+            records=[],
+            query_time_ms=(time.perf_counter() - start) * 1000,
+            resolver_used=resolver or "system",
+            timestamp=datetime.now(),
+            error=error,
+        )
 
     def query_dnskey_with_keytag(self, domain: str) -> tuple[list[DNSKEYRecord], str]:
         """Query DNSKEY records with proper key tag parsing using +multi format.
 
+        Results are reused for the lowest TTL among the keys (at most
+        DNSKEY_CACHE_MAX_TTL). Empty results are not cached.
+
         Returns:
             Tuple of (list of DNSKEYRecord objects, raw output string)
         """
-        start_time = datetime.now()
-
+        result = self._cached_dnskeys(domain)
+        if result is None:
+            result = self._query_dnskey_with_keytag(domain)
+            self._store_dnskeys(domain, result)
+        return result
+
+    def _cached_dnskeys(self, zone: str) -> Optional[tuple[list[DNSKEYRecord], str]]:
+        """Return a zone's cached DNSKEY result, or None if missing or expired."""
+        cached = self._dnskey_cache.get(zone.lower())
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
+    def _store_dnskeys(self, zone: str, result: tuple[list[DNSKEYRecord], str]) -> None:
+        """Cache a zone's DNSKEY result for its lowest TTL (if it has keys)."""
+        dnskey_records = result[0]
+        if dnskey_records:
+            ttl = min(record.ttl for record in dnskey_records)
+            ttl = min(ttl, self.DNSKEY_CACHE_MAX_TTL)
+            self._dnskey_cache[zone.lower()] = (time.monotonic() + ttl, result)
+
+    def _cached_ds(self, name: str) -> Optional[list[DSRecord]]:
+        """Return a delegation's cached DS records, or None if missing or expired."""
+        cached = self._ds_cache.get(name.lower())
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
+    def _store_ds(self, name: str, ds_records: list[DSRecord]) -> None:
+        """Cache a delegation's DS records for their lowest TTL (if any)."""
+        if ds_records:
+            ttl = min(record.ttl for record in ds_records)
+            ttl = min(ttl, self.DNSKEY_CACHE_MAX_TTL)
+            self._ds_cache[name.lower()] = (time.monotonic() + ttl, ds_records)
+
+    def _query_dnskey_with_keytag(self, domain: str) -> tuple[list[DNSKEYRecord], str]:
+        """Run the DNSKEY +multi query behind query_dnskey_with_keytag()."""
+        # Use +multi to get key tags in comments
+        cmd = [_dig_executable(), domain, "DNSKEY", "+dnssec", "+multi"]
         try:
-            # Use +multi to get key tags in comments
-            cmd = ["dig", domain, "DNSKEY", "+dnssec", "+multi"]
             result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=10, check=True
+                cmd, capture_output=True, timeout=self._timeout, check=False
             )
+        except (OSError, subprocess.SubprocessError):
+            return [], ""
+        if result.returncode != 0:
+            return [], ""
 
-            # Parse the +multi output to extract key tags
-            dnskey_records = []
-            lines = result.stdout.split("\n")
-
-            i = 0
-            while i < len(lines):
-                line = lines[i].strip()
-
-                # Look for DNSKEY lines (but not RRSIG DNSKEY)
-                if (
-                    "DNSKEY" in line
-                    and not line.startswith(";")
-                    and "RRSIG" not in line
-                ):
-                    # Extract base fields
-                    # Format: domain TTL IN DNSKEY flags protocol algorithm (key...)
-                    parts = line.split()
-                    if len(parts) >= 7:
-                        ttl = int(parts[1])
-                        flags = int(parts[4])
-                        protocol = int(parts[5])
-                        algorithm = int(parts[6])
-
-                        # Collect the public key (may span multiple lines)
-                        public_key_parts = []
-                        if "(" in line:
-                            # Multi-line format
-                            i += 1
-                            while i < len(lines) and ")" not in lines[i]:
-                                public_key_parts.append(lines[i].strip())
-                                i += 1
-                            if i < len(lines):
-                                # Get last line before )
-                                last_line = lines[i].split(")")[0].strip()
-                                if last_line:
-                                    public_key_parts.append(last_line)
-
-                                # Look for key id in comment after )
-                                comment = (
-                                    lines[i].split(")", 1)[1] if ")" in lines[i] else ""
-                                )
-                                key_tag = None
-                                if "key id" in comment or "key tag" in comment:
-                                    import re
-
-                                    match = re.search(
-                                        r"key\s+(?:id|tag)\s*=\s*(\d+)", comment
-                                    )
-                                    if match:
-                                        key_tag = int(match.group(1))
-                        else:
-                            # Single line - extract key from end
-                            key_start = line.find(str(algorithm)) + len(str(algorithm))
-                            public_key_parts.append(line[key_start:].strip())
-                            # No key tag available in single-line format
-                            key_tag = None
-
-                        public_key = "".join(public_key_parts)
-
-                        # If no key tag found, calculate it (will be wrong but better than nothing)
-                        if key_tag is None:
-                            key_tag = (flags + protocol + algorithm) % 65536
-
-                        # Parse algorithm enum
-                        algo_enum = self._parse_algorithm(algorithm)
-
-                        dnskey_records.append(
-                            DNSKEYRecord(
-                                flags=flags,
-                                protocol=protocol,
-                                algorithm=algo_enum,
-                                key_tag=key_tag,
-                                public_key=public_key,
-                                ttl=ttl,
-                            )
-                        )
+        output = _decode(result.stdout)
+        return self._parse_dnskey_multi(output), output
 
-                i += 1
+    def _parse_dnskey_multi(self, output: str) -> list[DNSKEYRecord]:
+        """Parse DNSKEY records (with key tags) from `dig +multi` output."""
+        dnskey_records = []
+        for match in _DNSKEY_RE.finditer(output):
+            flags = int(match.group(2))
+            protocol = int(match.group(3))
+            algorithm = int(match.group(4))
+
+            key_tag = None
+            if match.group(5) is not None:
+                # Multi-line format: the key spans the lines inside ( ... )
+                public_key = "".join(match.group(5).split())
+                tag_match = _KEY_TAG_RE.search(match.group(6))
+                if tag_match:
+                    key_tag = int(tag_match.group(1))
+            else:
+                # Single line - no key tag available
+                public_key = match.group(7).strip()
 
-            return dnskey_records, result.stdout
+            # dig only prints the key tag in +multi comments; compute it otherwise
+            if key_tag is None:
+                try:
+                    key_tag = self._calculate_key_tag(
+                        flags, protocol, algorithm, public_key
+                    )
+                except ValueError:
+                    # Malformed key: skip it, not the rest of the zone's keys
+                    continue
+
+            dnskey_records.append(
+                DNSKEYRecord(
+                    flags=flags,
+                    protocol=protocol,
+                    algorithm=self._parse_algorithm(algorithm),
+                    key_tag=key_tag,
+                    public_key=public_key,
+                    ttl=int(match.group(1)),
+                )
+            )
 
-        except Exception:
-            return [], ""
+        return dnskey_records
 
     def _parse_dig_output(
         self, output: str, domain: str, record_type: RecordType
@@ -284,33 +482,16 @@ class DigAdapter(DNSPort):
         dig output format:
         domain.com.    300    IN    A    93.184.216.34
         """
-        records = []
-
-        for line in output.strip().split("\n"):
-            if not line or line.startswith(";"):
-                continue
-
-            # Parse dig answer line
-            # Format: NAME TTL CLASS TYPE RDATA
-            parts = line.split(None, 4)
-            if len(parts) < 5:
-                continue
-
-            name, ttl, record_class, rtype, value = parts
-
-            # Clean up the name (remove trailing dot)
-            name = name.rstrip(".")
-
-            record = DNSRecord(
-                name=name,
+        return [
+            DNSRecord(
+                name=match.group(1).rstrip("."),
                 record_type=record_type,
-                value=value.strip(),
-                ttl=int(ttl),
-                record_class=record_class,
+                value=match.group(5),
+                ttl=int(match.group(2)),
+                record_class=match.group(3),
             )
-            records.append(record)
-
-        return records
+            for match in _DIG_ANSWER_RE.finditer(output)
+        ]
 
     def query_multiple_types(
         self,
@@ -318,194 +499,353 @@ class DigAdapter(DNSPort):
         record_types: list[RecordType],
         resolver: Optional[str] = None,
     ) -> dict[RecordType, DNSResponse]:
-        """Execute multiple DNS queries for different record types."""
+        """Execute multiple DNS queries for different record types.
+
+        Record types that go to the same nameserver are sent in a single dig
+        invocation, so N types cost one process instead of N. In-process
+        lookups are simply sent concurrently.
+        """
+        # Pick each type's nameserver (DS queries go to the parent zone,
+        # everything else to the domain)
+        servers = [
+            self._select_resolver(domain, record_type, resolver)
+            for record_type in record_types
+        ]
+        inprocess = self._inprocess
+        if inprocess is not None:
+            responses = _EXECUTOR.map(
+                lambda record_type, server: inprocess.query(
+                    domain, record_type, server
+                ),
+                record_types,
+                servers,
+            )
+            return dict(zip(record_types, responses))
+
+        # Group record types by the nameserver they will be sent to
+        groups: dict[Optional[str], list[RecordType]] = {}
+        for record_type, server in zip(record_types, servers):
+            groups.setdefault(server, []).append(record_type)
+
+        # One dig process per nameserver, run concurrently
         results = {}
-        for record_type in record_types:
-            results[record_type] = self.query(domain, record_type, resolver)
-        return results
+        for group_results in _EXECUTOR.map(
+            lambda group: self._query_batch(domain, group[1], group[0]),
+            groups.items(),
+        ):
+            results.update(group_results)
 
-    def reverse_lookup(self, ip_address: str) -> DNSResponse:
-        """Perform a reverse DNS lookup (PTR record)."""
-        # dig has a -x flag for reverse lookups
-        start_time = datetime.now()
-        query_obj = DNSQuery(domain=ip_address, record_type=RecordType.PTR)
+        return {record_type: results[record_type] for record_type in record_types}
+
+    def _query_batch(
+        self, domain: str, record_types: list[RecordType], resolver: Optional[str]
+    ) -> dict[RecordType, DNSResponse]:
+        """Query several record types for one domain with a single dig process.
 
-        cmd = ["dig", "+noall", "+answer", "-x", ip_address]
+        dig prints each lookup's question line (with +question) ahead of its
+        answers, which is used to split the combined output per record type.
+        """
+        start = time.perf_counter()
+
+        cmd = [_dig_executable(), "+noall", "+question", "+answer"]
+        if resolver:
+            cmd.append(f"@{resolver}")
+        for record_type in record_types:
+            cmd.extend([domain, record_type.value])
 
         try:
             result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=10, check=True
+                cmd, capture_output=True, timeout=self._timeout, check=False
             )
+            sections = self._split_batch_output(_decode(result.stdout))
+            error = None
+        except (OSError, subprocess.SubprocessError) as e:
+            sections = {}
+            error = f"Query failed: {e}"
 
-            records = self._parse_dig_output(result.stdout, ip_address, RecordType.PTR)
-            query_time = (datetime.now() - start_time).total_seconds() * 1000
+        query_time = (time.perf_counter() - start) * 1000
+        timestamp = datetime.now()
+        resolver_used = resolver or "system"
 
-            return DNSResponse(
-                query=query_obj,
-                records=records,
-                query_time_ms=query_time,
-                resolver_used="system",
-                timestamp=datetime.now(),
+        responses = {}
+        for record_type in record_types:
+            query_obj = DNSQuery(
+                domain=domain, record_type=record_type, resolver=resolver
             )
+            section = sections.get((_question_key(domain), record_type.value))
+
+            if section is None:
+                # dig prints nothing for a lookup that got no reply
+                responses[record_type] = DNSResponse(
+                    query=query_obj,
+                    records=[],
+                    query_time_ms=query_time,
+                    resolver_used=resolver_used,
+                    timestamp=timestamp,
+                    error=error
+                    or f"Query failed: {_decode(result.stderr or result.stdout)}",
+                )
+                continue
 
-        except Exception as e:
-            query_time = (datetime.now() - start_time).total_seconds() * 1000
-            return DNSResponse(
+            responses[record_type] = DNSResponse(
                 query=query_obj,
-                records=[],
+                records=self._parse_dig_output(section, domain, record_type),
                 query_time_ms=query_time,
-                resolver_used="system",
-                timestamp=datetime.now(),
-                error=str(e),
+                resolver_used=resolver_used,
+                timestamp=timestamp,
+                has_dnssec=False,
+                raw_data={"raw_output": section},
             )
 
-    def trace(self, domain: str) -> list[DNSResponse]:
-        """Trace the DNS resolution path from root servers."""
-        # dig has a +trace flag
-        start_time = datetime.now()
-        cmd = ["dig", "+trace", domain]
+        return responses
+
+    def _split_batch_output(self, output: str) -> dict[tuple[str, str], str]:
+        """Split multi-query dig output into answer text per lookup.
+
+        Each lookup starts with a question line such as
+        ";example.com.            IN      MX"
+
+        Returns:
+            Answer text keyed by (_question_key(name), record type)
+        """
+        sections: dict[tuple[str, str], list[str]] = {}
+        current: Optional[list[str]] = None
+
+        for line in output.split("\n"):
+            if line.startswith(";;"):
+                continue
+            if line.startswith(";"):
+                parts = line.split()
+                current = (
+                    sections.setdefault((_question_key(parts[0][1:]), parts[-1]), [])
+                    if len(parts) >= 2
+                    else None
+                )
+            elif current is not None and line:
+                current.append(line)
+
+        return {
+            key: "\n".join(lines) + "\n" if lines else ""
+            for key, lines in sections.items()
+        }
+
+    def reverse_lookup(self, ip_address: str) -> DNSResponse:
+        """Perform a reverse DNS lookup (PTR record)."""
+        if self._inprocess is not None:
+            return self._inprocess.reverse_lookup(ip_address)
+
+        # dig has a -x flag for reverse lookups
+        start = time.perf_counter()
+        query_obj = DNSQuery(domain=ip_address, record_type=RecordType.PTR)
+
+        cmd = [_dig_executable(), "+noall", "+answer", "-x", ip_address]
 
         try:
             result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=30, check=True
+                cmd, capture_output=True, timeout=self._timeout, check=False
             )
+        except (OSError, subprocess.SubprocessError) as e:
+            return self._error_response(query_obj, start, str(e), None)
+        if result.returncode != 0:
+            return self._error_response(query_obj, start, _decode(result.stderr), None)
+
+        return DNSResponse(
+            query=query_obj,
+            records=self._parse_dig_output(
+                _decode(result.stdout), ip_address, RecordType.PTR
+            ),
+            query_time_ms=(time.perf_counter() - start) * 1000,
+            resolver_used="system",
+            timestamp=datetime.now(),
+        )
+
+    def trace(self, domain: str) -> list[DNSResponse]:
+        """Trace the DNS resolution path from root servers.
 
-            # TODO: Parse trace output into multiple DNSResponse objects
-            # For now, return a single response with all data
-            return []
+        With dnspython installed the referrals are followed in-process,
+        querying each zone's nameservers concurrently. Otherwise `dig +trace`
+        is run and its output split into one response per server.
+        """
+        if ITERATIVE_TRACE_AVAILABLE:
+            return trace_from_root(domain, timeout=self._timeout)
+        return self._dig_trace(domain)
+
+    def _dig_trace(self, domain: str) -> list[DNSResponse]:
+        """Run `dig +trace`, parsing each step as soon as dig prints it.
 
-        except Exception:
-            return []
+        dig is stopped after trace_timeout seconds; the steps it completed
+        by then are still returned instead of being discarded.
+        """
+        cmd = [_dig_executable(), "+trace", domain]
+        responses: list[DNSResponse] = []
+
+        try:
+            with subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            ) as proc:
+                # stdout=PIPE always gives the process a stdout stream
+                assert proc.stdout is not None
+                timer = threading.Timer(self._trace_timeout, proc.kill)
+                timer.start()
+                try:
+                    step: list[bytes] = []
+                    for line in proc.stdout:
+                        step.append(line)
+                        # Each step ends with the ";; Received ..." line
+                        if line.startswith(b";; Received "):
+                            responses.extend(
+                                self._parse_trace_output(
+                                    _decode(b"".join(step)), domain
+                                )
+                            )
+                            step = []
+                finally:
+                    timer.cancel()
+                    # No-op if dig has already exited
+                    proc.kill()
+        except OSError:
+            pass
+
+        return responses
+
+    def _parse_trace_output(self, output: str, domain: str) -> list[DNSResponse]:
+        """Split `dig +trace` output into one DNSResponse per step.
+
+        Each step's records are followed by a ";; Received ... from" line
+        naming the server that sent them.
+        """
+        responses = []
+        section_start = 0
+        for received in _TRACE_RECEIVED_RE.finditer(output):
+            section = output[section_start : received.start()]
+            section_start = received.end()
+            server = received.group(1)
+            responses.append(
+                DNSResponse(
+                    query=DNSQuery(
+                        domain=domain, record_type=RecordType.A, resolver=server
+                    ),
+                    records=[
+                        DNSRecord(
+                            name=match.group(1).rstrip("."),
+                            record_type=RecordType.from_str(match.group(4)),
+                            value=match.group(5),
+                            ttl=int(match.group(2)),
+                            record_class=match.group(3),
+                        )
+                        for match in _DIG_ANSWER_RE.finditer(section)
+                        if match.group(4) in _RECORD_TYPE_VALUES
+                    ],
+                    query_time_ms=float(received.group(3)),
+                    resolver_used=server,
+                    timestamp=datetime.now(),
+                    raw_data={"raw_output": section.strip() + "\n" + received.group(0)},
+                )
+            )
+        return responses
+
+    @staticmethod
+    def tool_is_available() -> bool:
+        """Check if a dig executable is on PATH, without running it.
+
+        The result is cached for the life of the process (see
+        is_tool_available).
+        """
+        return is_tool_available("dig")
 
     def is_available(self) -> bool:
         """Check if dig is available on the system."""
-        try:
-            subprocess.run(["dig", "-v"], capture_output=True, timeout=5, check=True)
-            return True
-        except (
-            subprocess.CalledProcessError,
-            FileNotFoundError,
-            subprocess.TimeoutExpired,
-        ):
-            return False
+        return is_tool_available("dig")
 
     def get_tool_name(self) -> str:
         """Get the name of the DNS tool."""
         return "dig"
 
     def get_version(self) -> Optional[str]:
-        """Get the version of dig."""
-        try:
-            result = subprocess.run(
-                ["dig", "-v"], capture_output=True, text=True, timeout=5, check=True
-            )
-            # dig version output is like "DiG 9.10.6"
-            match = re.search(r"DiG\s+([\d.]+)", result.stdout)
-            return match.group(1) if match else None
-        except Exception:
-            return None
+        """Get the version of dig (probed once per process)."""
+        return _dig_version()
 
-    def validate_dnssec(self, domain: str) -> DNSSECValidation:
+    def validate_dnssec(
+        self, domain: str, *, build_chain: bool = True
+    ) -> DNSSECValidation:
         """Validate DNSSEC for a domain using dig.
 
+        The status only depends on the domain's own DNSKEY and DS records;
+        the root and parent zones are fetched to fill chain.parent_zones.
+
         Args:
             domain: The domain to validate
+            build_chain: Also fetch the root and parent zones' DNSKEY and DS
+                records (False leaves chain.parent_zones empty)
 
         Returns:
             DNSSECValidation with validation results
         """
-        start_time = datetime.now()
+        start = time.perf_counter()
 
         try:
-            # Query for DNSSEC-related records
-            ds_response = self.query(domain, RecordType.DS)
-            dnskey_records, dnskey_raw = self.query_dnskey_with_keytag(domain)
+            leaf = domain.rstrip(".")
+            parts = leaf.split(".")
+
+            # The domain's DS record, from its parent zone's nameserver
+            ds_future = _EXECUTOR.submit(
+                self._single_flight,
+                ("ds", leaf.lower()),
+                lambda: self.query(domain, RecordType.DS),
+            )
 
-            has_ds = ds_response.is_success and ds_response.record_count > 0
+            # Recursive DNSSEC chain from root to leaf: each zone's DNSKEYs
+            # and the DS records it publishes for the next zone down
+            zone_pairs = []
+            if build_chain:
+                # "a.example.com" -> ["com", "example.com", "a.example.com"]
+                suffixes = [".".join(parts[i:]) for i in range(len(parts) - 1, -1, -1)]
+                zone_pairs = list(zip([".", *suffixes[:-1]], suffixes))
+            # Each zone's DNSKEYs and the DS records for its child come from
+            # one dig process, and all zones (plus the domain's own DNSKEYs,
+            # the only lookup without build_chain) are fetched concurrently.
+            # The last zone's DS is the domain's own, already sent.
+            lookups = [
+                (zone, None if child == leaf else child) for zone, child in zone_pairs
+            ] + [(domain, None)]
+            fetched = list(
+                _EXECUTOR.map(
+                    lambda lookup: self._single_flight(
+                        ("zone",) + lookup, lambda: self._fetch_zone(*lookup)
+                    ),
+                    lookups,
+                )
+            )
+            (dnskey_records, dnskey_raw), _ = fetched[-1]
             has_dnskey = len(dnskey_records) > 0
 
-            # Parse DNSSEC records
-            ds_records = self._parse_ds_records(ds_response)
-
-            # Try to check for RRSIG records by querying authoritative nameserver
+            # RRSIG presence, as seen from an authoritative nameserver (while
+            # the DS lookup finishes); an unsigned zone cannot have any
             rrsig_records = []
-            has_rrsig = False
-            dnssec_output = ""
-            try:
-                # First get the authoritative nameserver
-                ns_cmd = ["dig", "+short", domain, "NS"]
-                ns_result = subprocess.run(
-                    ns_cmd, capture_output=True, text=True, timeout=10, check=True
+            if has_dnskey:
+                has_rrsig, dnssec_output = self._single_flight(
+                    ("rrsig", leaf.lower()), lambda: self._query_soa_with_rrsig(domain)
                 )
-                nameservers = [
-                    ns.strip().rstrip(".")
-                    for ns in ns_result.stdout.strip().split("\n")
-                    if ns.strip()
-                ]
-
-                if nameservers:
-                    # Query the authoritative nameserver for RRSIGs (use SOA since it always exists)
-                    auth_ns = nameservers[0]
-                    cmd = [
-                        "dig",
-                        f"@{auth_ns}",
-                        "+dnssec",
-                        "+noall",
-                        "+answer",
-                        domain,
-                        "SOA",
-                    ]
-                    result = subprocess.run(
-                        cmd, capture_output=True, text=True, timeout=10, check=True
-                    )
-                    # Check if RRSIG records are present in output
-                    has_rrsig = "RRSIG" in result.stdout
-                    dnssec_output = result.stdout
-            except Exception:
-                has_rrsig = False
-
-            # Build complete recursive DNSSEC chain from root to leaf
-            parent_zones = []
-            parts = domain.rstrip(".").split(".")
+            else:
+                has_rrsig, dnssec_output = False, ""
 
-            # Always query root zone
-            try:
-                root_dnskey_records, _ = self.query_dnskey_with_keytag(".")
+            ds_response = ds_future.result()
+            has_ds = ds_response.is_success and ds_response.record_count > 0
 
-                tld = parts[-1]
-                root_ds_response = self.query(tld, RecordType.DS)
-                root_ds_records = self._parse_ds_records(root_ds_response)
+            # Parse DNSSEC records
+            ds_records = self._parse_ds_records(ds_response.iter_records(RecordType.DS))
 
-                root_zone = ZoneData(
-                    zone_name=".",
-                    dnskey_records=root_dnskey_records,
-                    ds_records=root_ds_records,
+            parent_zones = [
+                ZoneData(
+                    zone_name=zone,
+                    dnskey_records=zone_dnskeys,
+                    ds_records=zone_ds_records if ds_name else ds_records,
                     rrsig_records=[],
                 )
-                parent_zones.append(root_zone)
-            except Exception:
-                pass
-
-            # Build each level from TLD down to parent of target
-            for i in range(len(parts) - 1, 0, -1):
-                current_zone = ".".join(parts[i:])
-                child_zone = ".".join(parts[i - 1 :])
-
-                try:
-                    zone_dnskey_records, _ = self.query_dnskey_with_keytag(current_zone)
-
-                    zone_ds_response = self.query(child_zone, RecordType.DS)
-                    zone_ds_records = self._parse_ds_records(zone_ds_response)
-
-                    zone_data = ZoneData(
-                        zone_name=current_zone,
-                        dnskey_records=zone_dnskey_records,
-                        ds_records=zone_ds_records,
-                        rrsig_records=[],
-                    )
-                    parent_zones.append(zone_data)
-                except Exception:
-                    pass
+                for (zone, ds_name), ((zone_dnskeys, _), zone_ds_records) in zip(
+                    lookups[:-1], fetched
+                )
+            ]
 
             # Build DNSSEC chain
             chain = DNSSECChain(
@@ -540,7 +880,7 @@ class DigAdapter(DNSPort):
             else:
                 status = DNSSECStatus.INDETERMINATE
 
-            validation_time = (datetime.now() - start_time).total_seconds() * 1000
+            validation_time = (time.perf_counter() - start) * 1000
 
             warnings = []
             if has_dnskey and not has_ds:
@@ -572,13 +912,13 @@ class DigAdapter(DNSPort):
                 timestamp=datetime.now(),
                 chain=chain,
                 warnings=warnings,
-                raw_data={"raw_output": "\n\n".join(raw_outputs)}
-                if raw_outputs
-                else None,
+                raw_data=(
+                    {"raw_output": "\n\n".join(raw_outputs)} if raw_outputs else None
+                ),
             )
 
         except Exception as e:
-            validation_time = (datetime.now() - start_time).total_seconds() * 1000
+            validation_time = (time.perf_counter() - start) * 1000
             return DNSSECValidation(
                 domain=domain,
                 status=DNSSECStatus.INDETERMINATE,
@@ -587,95 +927,192 @@ class DigAdapter(DNSPort):
                 error_message=f"DNSSEC validation failed: {str(e)}",
             )
 
-    def _parse_ds_records(self, response: DNSResponse) -> list[DSRecord]:
-        """Parse DS records from DNS response."""
-        ds_records = []
-        for record in response.records:
+    def _fetch_zone(
+        self, zone: str, ds_name: Optional[str]
+    ) -> tuple[tuple[list[DNSKEYRecord], str], list[DSRecord]]:
+        """Fetch a zone's DNSKEYs and a child's DS records with one dig process.
+
+        DNSKEY and DS sets still in the cache are not asked for again (if
+        both are cached, nothing is sent at all). With dnspython installed
+        both lookups are sent in-process and key tags are computed from the
+        keys. Otherwise dig applies options given after a query name to that
+        query only, so the DNSKEY lookup uses +multi (for the key tags) and
+        the DS lookup does not.
+
+        Args:
+            zone: Zone to fetch DNSKEY records for
+            ds_name: Delegated child to fetch DS records for (None to skip)
+
+        Returns:
+            Tuple of ((DNSKEY records, raw answer text), DS records)
+        """
+        dnskeys = self._cached_dnskeys(zone)
+        ds_records = self._cached_ds(ds_name) if ds_name else []
+        if self._inprocess is not None:
+            if dnskeys is None:
+                response = self._inprocess.query(zone, RecordType.DNSKEY)
+                raw = "".join(f"{record}\n" for record in response.records)
+                dnskeys = (self._parse_dnskey_records(response), raw)
+                self._store_dnskeys(zone, dnskeys)
+            if ds_records is None:
+                # Only a named child's DS set can miss the cache
+                assert ds_name is not None
+                response = self._inprocess.query(ds_name, RecordType.DS)
+                ds_records = self._parse_ds_records(
+                    response.iter_records(RecordType.DS)
+                )
+                self._store_ds(ds_name, ds_records)
+            return dnskeys, ds_records
+
+        cmd = [_dig_executable(), "+noall", "+question", "+answer"]
+        if dnskeys is None:
+            cmd.extend([zone, "DNSKEY", "+dnssec", "+multi"])
+        if ds_records is None:
+            assert ds_name is not None
+            cmd.extend([ds_name, "DS"])
+
+        sections: dict[tuple[str, str], str] = {}
+        if dnskeys is None or ds_records is None:
             try:
-                # DS record format: key_tag algorithm digest_type digest
-                parts = record.value.split(None, 3)
-                if len(parts) == 4:
-                    key_tag = int(parts[0])
-                    algorithm = self._parse_algorithm(int(parts[1]))
-                    digest_type = self._parse_digest_type(int(parts[2]))
-                    digest = parts[3]
-
-                    ds_records.append(
-                        DSRecord(
-                            key_tag=key_tag,
-                            algorithm=algorithm,
-                            digest_type=digest_type,
-                            digest=digest,
-                            ttl=record.ttl,
-                        )
-                    )
-            except (ValueError, IndexError):
-                continue
+                result = subprocess.run(
+                    cmd, capture_output=True, timeout=self._timeout, check=False
+                )
+                sections = self._split_batch_output(_decode(result.stdout))
+            except (OSError, subprocess.SubprocessError):
+                pass
+
+        if dnskeys is None:
+            section = sections.get((_question_key(zone), "DNSKEY"), "")
+            dnskeys = (self._parse_dnskey_multi(section), section)
+            self._store_dnskeys(zone, dnskeys)
+
+        if ds_records is None:
+            assert ds_name is not None
+            ds_section = sections.get((_question_key(ds_name), "DS"), "")
+            ds_records = self._parse_ds_records(
+                self._parse_dig_output(ds_section, ds_name, RecordType.DS)
+            )
+            self._store_ds(ds_name, ds_records)
+        return dnskeys, ds_records
+
+    def _query_soa_with_rrsig(self, domain: str) -> tuple[bool, str]:
+        """Ask an authoritative nameserver for the SOA record with +dnssec.
+
+        SOA is used because it always exists.
 
-        return ds_records
+        Returns:
+            Tuple of (whether RRSIG records came back, raw dig output)
+        """
+        # The same (cached) authoritative nameserver that query() uses
+        nameserver = self._get_authoritative_nameserver(domain)
+        if not nameserver:
+            return False, ""
+
+        cmd = [
+            _dig_executable(),
+            f"@{nameserver}",
+            "+dnssec",
+            "+noall",
+            "+answer",
+            domain,
+            "SOA",
+        ]
+        try:
+            result = subprocess.run(
+                cmd, capture_output=True, timeout=self._timeout, check=False
+            )
+        except (OSError, subprocess.SubprocessError):
+            return False, ""
+        if result.returncode != 0:
+            return False, ""
+
+        output = _decode(result.stdout)
+        has_rrsig = any(
+            match.group(4) == "RRSIG" for match in _DIG_ANSWER_RE.finditer(output)
+        )
+        return has_rrsig, output
+
+    def _parse_ds_records(self, records: Iterable[DNSRecord]) -> list[DSRecord]:
+        """Parse DS records from DNS records."""
+        # DS record format: key_tag algorithm digest_type digest
+        matches = (
+            (_NUMERIC_RDATA_RE.match(record.value), record) for record in records
+        )
+        return [
+            DSRecord(
+                key_tag=int(match.group(1)),
+                algorithm=self._parse_algorithm(int(match.group(2))),
+                digest_type=self._parse_digest_type(int(match.group(3))),
+                digest=match.group(4),
+                ttl=record.ttl,
+            )
+            for match, record in matches
+            if match
+        ]
 
     def _parse_dnskey_records(self, response: DNSResponse) -> list[DNSKEYRecord]:
-        """Parse DNSKEY records from DNS response."""
+        """Parse DNSKEY records from DNS response.
+
+        Records that do not parse (including keys that are not valid base64)
+        are skipped.
+        """
         dnskey_records = []
-        for record in response.records:
+        for record in response.iter_records(RecordType.DNSKEY):
+            # DNSKEY format: flags protocol algorithm public_key
+            match = _NUMERIC_RDATA_RE.match(record.value)
+            if not match:
+                continue
+            flags, protocol, algorithm = (int(match.group(i)) for i in (1, 2, 3))
+            # Long keys may be printed in space-separated chunks
+            public_key = "".join(match.group(4).split())
             try:
-                # DNSKEY format: flags protocol algorithm public_key
-                parts = record.value.split(None, 3)
-                if len(parts) == 4:
-                    flags = int(parts[0])
-                    protocol = int(parts[1])
-                    algorithm = self._parse_algorithm(int(parts[2]))
-                    public_key = parts[3]
-
-                    # Calculate key tag (simplified)
-                    key_tag = self._calculate_key_tag(flags, protocol, int(parts[2]))
-
-                    dnskey_records.append(
-                        DNSKEYRecord(
-                            flags=flags,
-                            protocol=protocol,
-                            algorithm=algorithm,
-                            key_tag=key_tag,
-                            public_key=public_key,
-                            ttl=record.ttl,
-                        )
-                    )
-            except (ValueError, IndexError):
+                key_tag = self._calculate_key_tag(
+                    flags, protocol, algorithm, public_key
+                )
+            except ValueError:
                 continue
 
+            dnskey_records.append(
+                DNSKEYRecord(
+                    flags=flags,
+                    protocol=protocol,
+                    algorithm=self._parse_algorithm(algorithm),
+                    key_tag=key_tag,
+                    public_key=public_key,
+                    ttl=record.ttl,
+                )
+            )
+
         return dnskey_records
 
-    def _parse_algorithm(self, alg_num: int) -> DNSSECAlgorithm:
+    @staticmethod
+    def _parse_algorithm(alg_num: int) -> DNSSECAlgorithm:
         """Parse DNSSEC algorithm number to enum."""
-        algorithm_map = {
-            1: DNSSECAlgorithm.RSAMD5,
-            2: DNSSECAlgorithm.DH,
-            3: DNSSECAlgorithm.DSA,
-            5: DNSSECAlgorithm.RSASHA1,
-            6: DNSSECAlgorithm.DSA_NSEC3_SHA1,
-            7: DNSSECAlgorithm.RSASHA1_NSEC3_SHA1,
-            8: DNSSECAlgorithm.RSASHA256,
-            10: DNSSECAlgorithm.RSASHA512,
-            12: DNSSECAlgorithm.ECC_GOST,
-            13: DNSSECAlgorithm.ECDSAP256SHA256,
-            14: DNSSECAlgorithm.ECDSAP384SHA384,
-            15: DNSSECAlgorithm.ED25519,
-            16: DNSSECAlgorithm.ED448,
-        }
-        return algorithm_map.get(alg_num, DNSSECAlgorithm.UNKNOWN)
+        return _ALG_MAP.get(alg_num, DNSSECAlgorithm.UNKNOWN)
 
-    def _parse_digest_type(self, digest_num: int) -> DigestType:
+    @staticmethod
+    def _parse_digest_type(digest_num: int) -> DigestType:
         """Parse DS digest type number to enum."""
-        digest_map = {
-            1: DigestType.SHA1,
-            2: DigestType.SHA256,
-            3: DigestType.GOST,
-            4: DigestType.SHA384,
-        }
-        return digest_map.get(digest_num, DigestType.UNKNOWN)
+        return _DIGEST_MAP.get(digest_num, DigestType.UNKNOWN)
+
+    @staticmethod
+    def _calculate_key_tag(
+        flags: int, protocol: int, algorithm: int, public_key: str
+    ) -> int:
+        """Calculate a DNSKEY's key tag from its RDATA (RFC 4034 Appendix B).
 
-    def _calculate_key_tag(self, flags: int, protocol: int, algorithm: int) -> int:
-        """Calculate a simplified key tag (for display purposes)."""
-        # This is a simplified calculation
-        # Real key tag calculation involves the entire RDATA
-        return (flags + protocol + algorithm) % 65536
+        Raises:
+            ValueError: If the public key is not valid base64
+        """
+        key = base64.b64decode(public_key)
+        if algorithm == 1:
+            # RSA/MD5 uses bits 8-23 of the modulus, which ends the key (B.1)
+            return int.from_bytes(key[-3:-1], "big")
+
+        # One's-complement-style sum of the RDATA as 16-bit big-endian words
+        rdata = struct.pack("!HBB", flags, protocol, algorithm) + key
+        if len(rdata) % 2:
+            rdata += b"\0"
+        ac: int = sum(struct.unpack(f"!{len(rdata) // 2}H", rdata))
+        ac += (ac >> 16) & 0xFFFF
+        return ac & 0xFFFF
@@ -0,0 +1,283 @@
+"""DNS adapter implementation using dnspython (in-process, no subprocess)."""
+
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional, Union
+
+try:
+    import dns.exception
+    import dns.flags
+    import dns.message
+    import dns.query
+    import dns.rcode
+    import dns.rdataclass
+    import dns.resolver
+    import dns.reversename
+    import dns.version
+
+    _DNSPYTHON_AVAILABLE = True
+except ImportError:
+    dns = None  # type: ignore[assignment]
+    _DNSPYTHON_AVAILABLE = False
+
+from dns_debugger.domain.models.dns_record import (
+    DNSQuery,
+    DNSRecord,
+    DNSResponse,
+    RecordType,
+)
+from dns_debugger.domain.models.dnssec_info import DNSSECStatus, DNSSECValidation
+from dns_debugger.domain.ports.dns_port import DNSPort
+from dns_debugger.adapters.dns.iterative_trace import trace_from_root
+
+# Runs the lookups of query_multiple_types() side by side
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="dnspython")
+
+
+class DnsPythonAdapter(DNSPort):
+    """Adapter that resolves queries in-process with dnspython.
+
+    Each lookup is a plain UDP/TCP exchange instead of a dig process, so a
+    query costs one network round trip and no fork/exec or text parsing.
+    Queries go to the system's recursive resolvers (or the resolver given);
+    it does not seek out authoritative nameservers itself. DigAdapter sends
+    its plain lookups through this adapter (after picking the nameserver),
+    and it is used on its own when dig is not installed, in which case
+    DNSSEC validation is not available.
+
+    Queries to an explicitly given nameserver are sent directly over UDP.
+    Truncated answers are retried over TCP connections that are kept open
+    and reused, so repeated large answers (TXT, DNSKEY) from the same server
+    do not pay a TCP handshake each time.
+    """
+
+    # Port explicitly given nameservers are queried on
+    PORT = 53
+
+    def __init__(self, timeout: float = 5.0):
+        """Initialize the dnspython adapter.
+
+        Args:
+            timeout: Seconds allowed per query (DigAdapter's default)
+        """
+        self._timeout = timeout
+        # Resolver for the system configuration, created on first use
+        self._resolver: Optional["dns.resolver.Resolver"] = None
+        # Nameserver IP -> idle TCP connections to it
+        self._tcp_pool: dict[str, list[socket.socket]] = {}
+        self._lock = threading.Lock()
+
+    def _get_resolver(self) -> "dns.resolver.Resolver":
+        """Return the Resolver that uses the system's nameservers."""
+        with self._lock:
+            if self._resolver is None:
+                self._resolver = dns.resolver.Resolver()
+            return self._resolver
+
+    def _exchange(
+        self, request: "dns.message.Message", nameserver: str
+    ) -> "dns.message.Message":
+        """Send a query to a nameserver, retrying over TCP if it is truncated."""
+        response = dns.query.udp(
+            request, nameserver, timeout=self._timeout, port=self.PORT
+        )
+        if response.flags & dns.flags.TC:
+            response = self._exchange_tcp(request, nameserver)
+        return response
+
+    def _exchange_tcp(
+        self, request: "dns.message.Message", nameserver: str
+    ) -> "dns.message.Message":
+        """Send a query over a pooled TCP connection to a nameserver.
+
+        An idle connection the server has closed in the meantime is dropped
+        and the query retried on the next one (or a new connection).
+        """
+        while True:
+            sock, reused = self._checkout_tcp(nameserver)
+            try:
+                response = dns.query.tcp(
+                    request, nameserver, timeout=self._timeout, sock=sock
+                )
+            except (OSError, EOFError):
+                sock.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                sock.close()
+                raise
+            with self._lock:
+                self._tcp_pool.setdefault(nameserver, []).append(sock)
+            return response
+
+    def _checkout_tcp(self, nameserver: str) -> tuple[socket.socket, bool]:
+        """Take an idle TCP connection to a nameserver, or open a new one.
+
+        Returns:
+            Tuple of (connected non-blocking socket, whether it was reused)
+        """
+        with self._lock:
+            idle = self._tcp_pool.get(nameserver)
+            if idle:
+                return idle.pop(), True
+        sock = socket.create_connection((nameserver, self.PORT), timeout=self._timeout)
+        sock.setblocking(False)
+        return sock, False
+
+    def _resolve(
+        self,
+        query_obj: DNSQuery,
+        qname: Union[str, "dns.name.Name"],
+        resolver: Optional[str],
+    ) -> DNSResponse:
+        """Send one query and convert the answer into a DNSResponse."""
+        start = time.perf_counter()
+        records: list[DNSRecord] = []
+        raw_output = None
+        error = None
+
+        try:
+            if resolver:
+                request = dns.message.make_query(
+                    qname, query_obj.record_type.value, use_edns=0
+                )
+                response = self._exchange(request, resolver)
+                raw_output = response.to_text()
+                rcode = response.rcode()
+                if rcode == dns.rcode.NOERROR:
+                    records = self._records_from_response(
+                        response, query_obj.record_type
+                    )
+                elif rcode != dns.rcode.NXDOMAIN:
+                    error = f"Query failed: {dns.rcode.to_text(rcode)}"
+            else:
+                answer = self._get_resolver().resolve(
+                    qname,
+                    query_obj.record_type.value,
+                    lifetime=self._timeout,
+                    raise_on_no_answer=False,
+                )
+                raw_output = answer.response.to_text()
+                records = self._records_from_response(
+                    answer.response, query_obj.record_type
+                )
+        except dns.resolver.NXDOMAIN:
+            # Like dig, a nonexistent name is an empty answer, not a failure
+            pass
+        except (dns.exception.DNSException, OSError, EOFError) as e:
+            error = f"Query failed: {e}"
+        except ValueError:
+            # dnspython only accepts IP addresses as nameservers
+            error = f"Query failed: {resolver!r} is not an IP address"
+
+        return DNSResponse(
+            query=query_obj,
+            records=records,
+            query_time_ms=(time.perf_counter() - start) * 1000,
+            resolver_used=resolver or "system",
+            timestamp=datetime.now(),
+            has_dnssec=False,
+            error=error,
+            raw_data={"raw_output": raw_output} if raw_output else None,
+        )
+
+    @staticmethod
+    def _records_from_response(
+        response: "dns.message.Message", record_type: RecordType
+    ) -> list[DNSRecord]:
+        """Build DNSRecords from every RRset in the answer section.
+
+        As with dig's +answer output, CNAMEs followed on the way are
+        included alongside the records of the requested type.
+        """
+        return [
+            DNSRecord(
+                name=rrset.name.to_text().rstrip("."),
+                record_type=record_type,
+                value=rdata.to_text(),
+                ttl=rrset.ttl,
+                record_class=dns.rdataclass.to_text(rrset.rdclass),
+            )
+            for rrset in response.answer
+            for rdata in rrset
+        ]
+
+    def query(
+        self, domain: str, record_type: RecordType, resolver: Optional[str] = None
+    ) -> DNSResponse:
+        """Execute a DNS query with dnspython."""
+        query_obj = DNSQuery(domain=domain, record_type=record_type, resolver=resolver)
+        return self._resolve(query_obj, domain, resolver)
+
+    def query_multiple_types(
+        self,
+        domain: str,
+        record_types: list[RecordType],
+        resolver: Optional[str] = None,
+    ) -> dict[RecordType, DNSResponse]:
+        """Execute multiple DNS queries for different record types.
+
+        The queries are independent, so they are sent concurrently and the
+        whole set takes about as long as the slowest one.
+        """
+        responses = _EXECUTOR.map(
+            lambda record_type: self.query(domain, record_type, resolver),
+            record_types,
+        )
+        return dict(zip(record_types, responses))
+
+    def reverse_lookup(self, ip_address: str) -> DNSResponse:
+        """Perform a reverse DNS lookup (PTR record)."""
+        query_obj = DNSQuery(domain=ip_address, record_type=RecordType.PTR)
+        try:
+            qname = dns.reversename.from_address(ip_address)
+        except (dns.exception.SyntaxError, ValueError) as e:
+            return DNSResponse(
+                query=query_obj,
+                records=[],
+                query_time_ms=0.0,
+                resolver_used="system",
+                timestamp=datetime.now(),
+                error=str(e),
+            )
+        return self._resolve(query_obj, qname, None)
+
+    def trace(self, domain: str) -> list[DNSResponse]:
+        """Trace the DNS resolution path from root servers."""
+        return trace_from_root(domain, timeout=self._timeout)
+
+    def validate_dnssec(
+        self, domain: str, *, build_chain: bool = True
+    ) -> DNSSECValidation:
+        """Report DNSSEC as undetermined; validation needs dig's +multi output.
+
+        Args:
+            domain: The domain to validate
+            build_chain: Unused; no records are fetched
+
+        Returns:
+            DNSSECValidation with INDETERMINATE status and an error message
+        """
+        return DNSSECValidation(
+            domain=domain,
+            status=DNSSECStatus.INDETERMINATE,
+            validation_time_ms=0.0,
+            timestamp=datetime.now(),
+            error_message="DNSSEC validation requires dig (BIND DNS tools)",
+        )
+
+    def is_available(self) -> bool:
+        """Check if dnspython is installed."""
+        return _DNSPYTHON_AVAILABLE
+
+    def get_tool_name(self) -> str:
+        """Get the name of the DNS tool."""
+        return "dnspython"
+
+    def get_version(self) -> Optional[str]:
+        """Get the version of dnspython."""
+        return dns.version.version if _DNSPYTHON_AVAILABLE else None
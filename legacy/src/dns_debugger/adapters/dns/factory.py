@@ -4,27 +4,100 @@ from typing import Optional
 
 from dns_debugger.domain.ports.dns_port import DNSPort
 from dns_debugger.adapters.dns.dig_adapter import DigAdapter
+from dns_debugger.adapters.dns.dnspython_adapter import DnsPythonAdapter
+from dns_debugger.adapters.dns.ttl_cache import CachingDNSPort
+from dns_debugger.adapters.tool_probe import tool_path
 
 
 class DNSAdapterFactory:
     """Factory for creating DNS adapters.
 
-    Uses dig (BIND DNS tools) for all DNS queries.
+    Uses dig (BIND DNS tools) for DNS queries, falling back to the in-process
+    dnspython adapter (without DNSSEC validation) when dig is not installed.
     """
 
-    @staticmethod
-    def create() -> DNSPort:
-        """Create a DNS adapter using dig.
+    # Adapters are stateless apart from their own lookup caches, so a single
+    # lazily-created instance per tool is shared by every caller.
+    _instance: Optional[DNSPort] = None
+    _dnspython_instance: Optional[DNSPort] = None
+
+    # Opt-in decorators for the shared instances, set by configure()
+    _race = False
+    _persistent = False
+
+    @classmethod
+    def configure(cls, *, race: bool = False, persistent: bool = False) -> None:
+        """Choose how the shared adapters send and cache queries.
+
+        Meant to be called once at startup; adapters created afterwards use
+        the new options.
+
+        Args:
+            race: Race each query across public recursive resolvers
+                (RacingDNSPort) instead of asking authoritative nameservers
+            persistent: Also keep responses on disk between runs
+                (PersistentCachingDNSPort), so relaunching for a recently
+                debugged domain skips the network
+        """
+        cls._race = race
+        cls._persistent = persistent
+        cls._instance = None
+        cls._dnspython_instance = None
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget cached tool availability and the shared adapter instance."""
+        tool_path.cache_clear()
+        cls._instance = None
+        cls._dnspython_instance = None
+
+    @classmethod
+    def _decorate(cls, adapter: DNSPort) -> DNSPort:
+        """Wrap an adapter in the configured decorators and an in-memory cache."""
+        if cls._race:
+            from dns_debugger.adapters.dns.racing_adapter import RacingDNSPort
+
+            adapter = RacingDNSPort(adapter)
+        if cls._persistent:
+            # Imported here so that default callers skip sqlite3
+            from dns_debugger.adapters.disk_cache import DiskCache
+            from dns_debugger.adapters.dns.persistent_cache import (
+                PersistentCachingDNSPort,
+            )
+
+            adapter = PersistentCachingDNSPort(adapter, DiskCache())
+        return CachingDNSPort(adapter)
+
+    @classmethod
+    def _shared_instance(cls) -> DNSPort:
+        """Return the shared adapter, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls._decorate(DigAdapter())
+        return cls._instance
+
+    @classmethod
+    def _shared_dnspython_instance(cls) -> DNSPort:
+        """Return the shared dnspython adapter, creating it on first use."""
+        if cls._dnspython_instance is None:
+            cls._dnspython_instance = cls._decorate(DnsPythonAdapter())
+        return cls._dnspython_instance
+
+    @classmethod
+    def create(cls) -> DNSPort:
+        """Create a DNS adapter using dig, or dnspython if dig is missing.
 
         Returns:
-            A DNSPort implementation (DigAdapter)
+            A DNSPort implementation (DigAdapter or DnsPythonAdapter behind a
+            CachingDNSPort and any decorators chosen with configure())
 
         Raises:
-            RuntimeError: If dig is not available
+            RuntimeError: If neither dig nor dnspython is available
         """
-        dig = DigAdapter()
-        if dig.is_available():
-            return dig
+        if DigAdapter.tool_is_available():
+            return cls._shared_instance()
+
+        if DnsPythonAdapter().is_available():
+            return cls._shared_dnspython_instance()
 
         # No DNS tool available
         raise RuntimeError(
@@ -34,12 +107,12 @@ class DNSAdapterFactory:
             "  - RHEL/Fedora: dnf install bind-utils"
         )
 
-    @staticmethod
-    def create_specific(tool_name: str) -> DNSPort:
+    @classmethod
+    def create_specific(cls, tool_name: str) -> DNSPort:
         """Create a specific DNS adapter by name.
 
         Args:
-            tool_name: Name of the tool ("dig")
+            tool_name: Name of the tool ("dig" or "dnspython")
 
         Returns:
             The requested DNSPort implementation
@@ -48,20 +121,23 @@ class DNSAdapterFactory:
             ValueError: If tool_name is not recognized
             RuntimeError: If the requested tool is not available
         """
-        if tool_name.lower() == "dig":
-            adapter = DigAdapter()
-        else:
-            raise ValueError(f"Unknown DNS tool: {tool_name}. Only 'dig' is supported.")
+        tool = tool_name.lower()
+        if tool not in ("dig", "dnspython"):
+            raise ValueError(
+                f"Unknown DNS tool: {tool_name}. Use 'dig' or 'dnspython'."
+            )
 
-        if not adapter.is_available():
+        if tool not in cls.get_available_tools():
             raise RuntimeError(
                 f"DNS tool '{tool_name}' is not available on this system"
             )
 
-        return adapter
+        if tool == "dnspython":
+            return cls._shared_dnspython_instance()
+        return cls._shared_instance()
 
-    @staticmethod
-    def get_available_tools() -> list[str]:
+    @classmethod
+    def get_available_tools(cls) -> list[str]:
         """Get a list of available DNS tools on the system.
 
         Returns:
@@ -69,18 +145,20 @@ class DNSAdapterFactory:
         """
         tools = []
 
-        dig = DigAdapter()
-        if dig.is_available():
+        if DigAdapter.tool_is_available():
             tools.append("dig")
 
+        if DnsPythonAdapter().is_available():
+            tools.append("dnspython")
+
         return tools
 
-    @staticmethod
-    def get_preferred_tool() -> Optional[str]:
+    @classmethod
+    def get_preferred_tool(cls) -> Optional[str]:
         """Get the name of the preferred tool that will be used.
 
         Returns:
             Name of the preferred tool, or None if no tool is available
         """
-        dig = DigAdapter()
-        return "dig" if dig.is_available() else None
+        tools = cls.get_available_tools()
+        return tools[0] if tools else None
@@ -0,0 +1,216 @@
+"""Iterative DNS resolution from the root servers, used to trace a domain."""
+
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Optional
+
+try:
+    import dns.exception
+    import dns.flags
+    import dns.message
+    import dns.query
+    import dns.rcode
+    import dns.rdataclass
+    import dns.rdatatype
+    import dns.resolver
+
+    ITERATIVE_TRACE_AVAILABLE = True
+except ImportError:
+    dns = None  # type: ignore[assignment]
+    ITERATIVE_TRACE_AVAILABLE = False
+
+from dns_debugger.domain.models.dns_record import (
+    DNSQuery,
+    DNSRecord,
+    DNSResponse,
+    RecordType,
+)
+
+# IPv4 addresses of the root servers (IANA root hints)
+ROOT_SERVERS = {
+    "a.root-servers.net": "198.41.0.4",
+    "b.root-servers.net": "170.247.170.2",
+    "c.root-servers.net": "192.33.4.12",
+    "d.root-servers.net": "199.7.91.13",
+    "e.root-servers.net": "192.203.230.10",
+    "f.root-servers.net": "192.5.5.241",
+    "g.root-servers.net": "192.112.36.4",
+    "h.root-servers.net": "198.97.190.53",
+    "i.root-servers.net": "192.36.148.17",
+    "j.root-servers.net": "192.58.128.30",
+    "k.root-servers.net": "193.0.14.129",
+    "l.root-servers.net": "199.7.83.42",
+    "m.root-servers.net": "202.12.27.33",
+}
+
+# Nameservers of a zone asked at once; the first reply is used
+FANOUT = 3
+
+# Referrals followed before giving up (guards against delegation loops)
+MAX_DEPTH = 16
+
+_RECORD_TYPE_VALUES = frozenset(rt.value for rt in RecordType)
+
+# Losing queries keep running here after the first reply has been used
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="dns-trace")
+
+
+def trace_from_root(
+    domain: str, record_type: RecordType = RecordType.A, timeout: float = 5.0
+) -> list[DNSResponse]:
+    """Resolve a domain by following referrals down from the root servers.
+
+    At each level up to FANOUT of the zone's nameservers are queried
+    concurrently, so a trace takes about one round trip per zone cut.
+
+    Args:
+        domain: The domain name to trace
+        record_type: Record type asked for at every level
+        timeout: Seconds allowed per query
+
+    Returns:
+        One DNSResponse per level (the referral or final answer, from the
+        nameserver that replied first)
+    """
+    steps = []
+    servers = ROOT_SERVERS
+    for _ in range(MAX_DEPTH):
+        step, response = _query_level(domain, record_type, servers, timeout)
+        steps.append(step)
+        if response is None or response.answer or response.rcode() != dns.rcode.NOERROR:
+            break
+        servers = _referral_servers(response, timeout)
+        if not servers:
+            break
+    return steps
+
+
+def _query_level(
+    domain: str, record_type: RecordType, servers: dict[str, str], timeout: float
+) -> tuple[DNSResponse, Optional["dns.message.Message"]]:
+    """Ask one zone's nameservers and return the first reply.
+
+    Returns:
+        Tuple of (DNSResponse for the step, the raw reply or None if every
+        nameserver failed)
+    """
+    request = dns.message.make_query(domain, record_type.value, use_edns=0)
+    # Iterative query: ask the nameserver itself, not its recursion
+    request.flags &= ~dns.flags.RD
+
+    start = time.perf_counter()
+    chosen = random.sample(list(servers.items()), min(FANOUT, len(servers)))
+    pending = {
+        _EXECUTOR.submit(_exchange, request, address, timeout): address
+        for _, address in chosen
+    }
+    error = None
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            address = pending.pop(future)
+            try:
+                response = future.result()
+            except (dns.exception.DNSException, OSError, EOFError) as e:
+                error = f"Query to {address} failed: {e}"
+                continue
+
+            # A reply arrived, so earlier nameservers' failures do not count
+            error = None
+            rcode = response.rcode()
+            if rcode not in (dns.rcode.NOERROR, dns.rcode.NXDOMAIN):
+                error = f"Query failed: {dns.rcode.to_text(rcode)}"
+            return (
+                DNSResponse(
+                    query=DNSQuery(
+                        domain=domain, record_type=record_type, resolver=address
+                    ),
+                    records=_records_from_response(response),
+                    query_time_ms=(time.perf_counter() - start) * 1000,
+                    resolver_used=address,
+                    timestamp=datetime.now(),
+                    error=error,
+                    raw_data={"raw_output": response.to_text()},
+                ),
+                response,
+            )
+
+    return (
+        DNSResponse(
+            query=DNSQuery(domain=domain, record_type=record_type),
+            records=[],
+            query_time_ms=(time.perf_counter() - start) * 1000,
+            resolver_used=", ".join(address for _, address in chosen),
+            timestamp=datetime.now(),
+            error=error,
+        ),
+        None,
+    )
+
+
+def _exchange(
+    request: "dns.message.Message", address: str, timeout: float
+) -> "dns.message.Message":
+    """Send a query over UDP, retrying over TCP if the reply is truncated."""
+    response, _ = dns.query.udp_with_fallback(request, address, timeout=timeout)
+    return response
+
+
+def _records_from_response(response: "dns.message.Message") -> list[DNSRecord]:
+    """Build DNSRecords from the answer and authority sections.
+
+    Record types the app does not model are left out.
+    """
+    return [
+        DNSRecord(
+            name=rrset.name.to_text().rstrip("."),
+            record_type=RecordType.from_str(rdtype),
+            value=rdata.to_text(),
+            ttl=rrset.ttl,
+            record_class=dns.rdataclass.to_text(rrset.rdclass),
+        )
+        for rrset in response.answer + response.authority
+        for rdtype in [dns.rdatatype.to_text(rrset.rdtype)]
+        if rdtype in _RECORD_TYPE_VALUES
+        for rdata in rrset
+    ]
+
+
+def _referral_servers(
+    response: "dns.message.Message", timeout: float
+) -> dict[str, str]:
+    """Map the nameservers a referral delegates to onto their IPv4 addresses.
+
+    Glue from the additional section is used where present; out-of-zone
+    nameservers (sent without glue) are looked up with the system resolver.
+    """
+    names = [
+        rdata.target.to_text().rstrip(".").lower()
+        for rrset in response.authority
+        if rrset.rdtype == dns.rdatatype.NS
+        for rdata in rrset
+    ]
+    glue = {
+        rrset.name.to_text().rstrip(".").lower(): rrset[0].address
+        for rrset in response.additional
+        if rrset.rdtype == dns.rdatatype.A
+    }
+    servers = {name: glue[name] for name in names if name in glue}
+    if servers or not names:
+        return servers
+
+    addresses = _EXECUTOR.map(
+        lambda name: _resolve_address(name, timeout), names[:FANOUT]
+    )
+    return {name: address for name, address in zip(names, addresses) if address}
+
+
+def _resolve_address(name: str, timeout: float) -> Optional[str]:
+    """Look up a nameserver's first IPv4 address with the system resolver."""
+    try:
+        answer = dns.resolver.resolve(name, "A", lifetime=timeout)
+    except dns.exception.DNSException:
+        return None
+    return str(answer[0].address)
@@ -0,0 +1,157 @@
+"""DNS adapter decorator that persists responses on disk between runs."""
+
+import dataclasses
+from typing import Any, Optional
+
+from dns_debugger.domain.models.dns_record import DNSResponse, RecordType
+from dns_debugger.domain.models.dnssec_info import DNSSECValidation
+from dns_debugger.domain.ports.dns_port import DNSPort
+from dns_debugger.adapters.disk_cache import DiskCache
+
+
+class PersistentCachingDNSPort(DNSPort):
+    """DNSPort decorator that keeps responses in a DiskCache for their TTL.
+
+    Relaunching the app (or re-running the CLI) for a recently debugged
+    domain then answers from disk instead of the network. Responses read
+    back from disk have their TTLs counted down as a resolver would, so an
+    in-memory cache in front of this one expires them on time. Like
+    CachingDNSPort, failed queries are never stored and adapter-specific
+    methods are passed through uncached.
+    """
+
+    def __init__(
+        self,
+        adapter: DNSPort,
+        cache: DiskCache,
+        max_ttl: int = 3600,
+        negative_ttl: int = 30,
+    ):
+        """Wrap a DNS adapter.
+
+        Args:
+            adapter: The adapter to delegate cache misses to
+            cache: Disk cache to store responses in
+            max_ttl: Upper bound in seconds on how long a response is kept
+            negative_ttl: Seconds to keep successful responses with no records
+        """
+        self._adapter = adapter
+        self._cache = cache
+        self._max_ttl = max_ttl
+        self._negative_ttl = negative_ttl
+
+    def __getattr__(self, name: str) -> Any:
+        """Expose the wrapped adapter's adapter-specific methods."""
+        return getattr(self._adapter, name)
+
+    @staticmethod
+    def _key(domain: str, record_type: RecordType, resolver: Optional[str]) -> str:
+        """Build the cache key for a query."""
+        return f"dns:{domain.lower().rstrip('.')}:{record_type.value}:{resolver or ''}"
+
+    def _put(self, key: str, response: DNSResponse) -> None:
+        """Store a successful response for the lowest TTL among its records."""
+        if not response.is_success:
+            return
+        if response.records:
+            ttl = min(min(record.ttl for record in response.records), self._max_ttl)
+        else:
+            ttl = self._negative_ttl
+        self._cache.put(key, response, ttl)
+
+    def _get(self, key: str) -> Optional[DNSResponse]:
+        """Return a stored response with its TTLs lowered to the time left."""
+        entry = self._cache.get_with_ttl(key, DNSResponse)
+        if entry is None:
+            return None
+        response: DNSResponse = entry[0]
+        ttl = int(entry[1])
+        return dataclasses.replace(
+            response,
+            records=[
+                dataclasses.replace(record, ttl=min(record.ttl, ttl))
+                for record in response.records
+            ],
+        )
+
+    def query(
+        self, domain: str, record_type: RecordType, resolver: Optional[str] = None
+    ) -> DNSResponse:
+        """Execute a DNS query, answering from disk when possible."""
+        key = self._key(domain, record_type, resolver)
+        response = self._get(key)
+        if response is None:
+            response = self._adapter.query(domain, record_type, resolver)
+            self._put(key, response)
+        return response
+
+    def query_multiple_types(
+        self,
+        domain: str,
+        record_types: list[RecordType],
+        resolver: Optional[str] = None,
+    ) -> dict[RecordType, DNSResponse]:
+        """Execute multiple queries, only sending the types not on disk."""
+        results: dict[RecordType, DNSResponse] = {}
+        missing = []
+        for record_type in record_types:
+            response = self._get(self._key(domain, record_type, resolver))
+            if response is None:
+                missing.append(record_type)
+            else:
+                results[record_type] = response
+
+        if missing:
+            fetched = self._adapter.query_multiple_types(domain, missing, resolver)
+            for record_type, response in fetched.items():
+                self._put(self._key(domain, record_type, resolver), response)
+            results.update(fetched)
+
+        return {rt: results[rt] for rt in record_types if rt in results}
+
+    def forget_domain(self, domain: str) -> None:
+        """Delete the stored responses for a domain and its subdomains.
+
+        Used when the user asks to refresh, so that the next queries go to
+        the network instead of being answered from disk.
+        """
+        name = domain.lower().rstrip(".")
+        self._cache.delete_matching(f"dns:{name}:*")
+        self._cache.delete_matching(f"dns:*.{name}:*")
+
+    def clear_cache(self) -> None:
+        """Drop the wrapped adapter's in-memory caches.
+
+        Persisted responses are kept until their TTL runs out (or until
+        forget_domain() is called): the app clears caches on its first load
+        as well as on refresh, so wiping the disk here would make every
+        launch a cold one.
+        """
+        if hasattr(self._adapter, "clear_cache"):
+            self._adapter.clear_cache()
+
+    def reverse_lookup(self, ip_address: str) -> DNSResponse:
+        """Perform a reverse DNS lookup (not cached)."""
+        return self._adapter.reverse_lookup(ip_address)
+
+    def trace(self, domain: str) -> list[DNSResponse]:
+        """Trace the resolution path (not cached)."""
+        return self._adapter.trace(domain)
+
+    def validate_dnssec(
+        self, domain: str, *, build_chain: bool = True
+    ) -> DNSSECValidation:
+        """Validate DNSSEC for a domain (not cached)."""
+        return self._adapter.validate_dnssec(domain, build_chain=build_chain)
+
+    def is_available(self) -> bool:
+        """Check if the wrapped DNS tool is available."""
+        return self._adapter.is_available()
+
+    def get_tool_name(self) -> str:
+        """Get the name of the wrapped DNS tool."""
+        return self._adapter.get_tool_name()
+
+    def get_version(self) -> Optional[str]:
+        """Get the version of the wrapped DNS tool."""
+        return self._adapter.get_version()
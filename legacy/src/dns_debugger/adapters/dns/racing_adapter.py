@@ -0,0 +1,181 @@
+"""DNS adapter that races each query across several recursive resolvers."""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional, TypeVar
+
+from dns_debugger.domain.models.dns_record import DNSResponse, RecordType
+from dns_debugger.domain.models.dnssec_info import DNSSECValidation
+from dns_debugger.domain.ports.dns_port import DNSPort
+
+T = TypeVar("T")
+
+# Public recursive resolvers raced by default
+DEFAULT_RACE_RESOLVERS = ["1.1.1.1", "8.8.8.8", "9.9.9.9"]
+
+# Shared by all RacingDNSPorts; losing queries keep running here after the
+# winner has returned
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="dns-race")
+
+
+class RacingDNSPort(DNSPort):
+    """DNSPort decorator that sends each query to several resolvers at once.
+
+    The first successful answer wins, so a slow or lossy resolver no longer
+    stalls the UI. Resolvers are ranked by an exponentially weighted moving
+    average of their response time. Each query goes to the fastest `fanout`
+    of them. Every `reprobe_interval` queries one lower-ranked resolver
+    takes the last slot so that its ranking stays current.
+    """
+
+    # Weight of the newest sample in the response time average
+    EWMA_ALPHA = 0.3
+
+    # Response time (ms) recorded for a failed query
+    FAILURE_PENALTY_MS = 5000.0
+
+    def __init__(
+        self,
+        adapter: DNSPort,
+        resolvers: Optional[list[str]] = None,
+        fanout: int = 3,
+        reprobe_interval: int = 20,
+    ):
+        """Wrap a DNS adapter.
+
+        Args:
+            adapter: Adapter used to send each individual query
+            resolvers: Resolver addresses to race (defaults to
+                DEFAULT_RACE_RESOLVERS)
+            fanout: Number of resolvers each query is sent to
+            reprobe_interval: Queries between probes of a lower-ranked resolver
+        """
+        self._adapter = adapter
+        self._resolvers = list(resolvers or DEFAULT_RACE_RESOLVERS)
+        self._fanout = max(1, min(fanout, len(self._resolvers)))
+        self._reprobe_interval = reprobe_interval
+        # Resolver -> smoothed response time in ms (unmeasured resolvers rank first)
+        self._rtt_ms = {resolver: 0.0 for resolver in self._resolvers}
+        self._queries = 0
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        """Expose the wrapped adapter's adapter-specific methods."""
+        return getattr(self._adapter, name)
+
+    def _pick_resolvers(self) -> list[str]:
+        """Choose the resolvers for the next query, fastest first."""
+        with self._lock:
+            ranked = sorted(self._resolvers, key=self._rtt_ms.__getitem__)
+            self._queries += 1
+            fanout = self._fanout
+            chosen, rest = ranked[:fanout], ranked[fanout:]
+            if rest and self._queries % self._reprobe_interval == 0:
+                probe = rest[(self._queries // self._reprobe_interval) % len(rest)]
+                chosen[-1] = probe
+            return chosen
+
+    def _record_rtt(self, resolver: str, elapsed_ms: float) -> None:
+        """Fold one observed response time into a resolver's average."""
+        with self._lock:
+            previous = self._rtt_ms[resolver]
+            self._rtt_ms[resolver] = (
+                elapsed_ms
+                if previous == 0.0
+                else self.EWMA_ALPHA * elapsed_ms + (1 - self.EWMA_ALPHA) * previous
+            )
+
+    def _timed(
+        self, resolver: str, send: Callable[[str], T], is_success: Callable[[T], bool]
+    ) -> T:
+        """Send one query to a resolver, recording how long it took.
+
+        Failures are recorded as at least FAILURE_PENALTY_MS so that a
+        resolver which errors out quickly does not rank as fast.
+        """
+        start = time.perf_counter()
+        succeeded = False
+        try:
+            result = send(resolver)
+            succeeded = is_success(result)
+            return result
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if not succeeded:
+                elapsed_ms = max(elapsed_ms, self.FAILURE_PENALTY_MS)
+            self._record_rtt(resolver, elapsed_ms)
+
+    def _race(self, send: Callable[[str], T], is_success: Callable[[T], bool]) -> T:
+        """Send a query to the chosen resolvers and return the first success.
+
+        If no resolver succeeds, the last result (or exception) is returned
+        (or raised).
+        """
+        pending: "set[Future[T]]" = {
+            _EXECUTOR.submit(self._timed, resolver, send, is_success)
+            for resolver in self._pick_resolvers()
+        }
+        last: "Optional[Future[T]]" = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                last = future
+                if future.exception() is None and is_success(future.result()):
+                    for loser in pending:
+                        loser.cancel()
+                    return future.result()
+        # At least one resolver is always chosen, so a future has finished
+        assert last is not None
+        return last.result()
+
+    def query(
+        self, domain: str, record_type: RecordType, resolver: Optional[str] = None
+    ) -> DNSResponse:
+        """Execute a DNS query, racing resolvers unless one is given."""
+        if resolver:
+            return self._adapter.query(domain, record_type, resolver)
+        return self._race(
+            lambda r: self._adapter.query(domain, record_type, r),
+            lambda response: response.is_success,
+        )
+
+    def query_multiple_types(
+        self,
+        domain: str,
+        record_types: list[RecordType],
+        resolver: Optional[str] = None,
+    ) -> dict[RecordType, DNSResponse]:
+        """Execute multiple queries, racing resolvers over the whole batch."""
+        if resolver:
+            return self._adapter.query_multiple_types(domain, record_types, resolver)
+        return self._race(
+            lambda r: self._adapter.query_multiple_types(domain, record_types, r),
+            lambda responses: all(r.is_success for r in responses.values()),
+        )
+
+    def reverse_lookup(self, ip_address: str) -> DNSResponse:
+        """Perform a reverse DNS lookup (not raced)."""
+        return self._adapter.reverse_lookup(ip_address)
+
+    def trace(self, domain: str) -> list[DNSResponse]:
+        """Trace the resolution path (not raced)."""
+        return self._adapter.trace(domain)
+
+    def validate_dnssec(
+        self, domain: str, *, build_chain: bool = True
+    ) -> DNSSECValidation:
+        """Validate DNSSEC for a domain (not raced)."""
+        return self._adapter.validate_dnssec(domain, build_chain=build_chain)
+
+    def is_available(self) -> bool:
+        """Check if the wrapped DNS tool is available."""
+        return self._adapter.is_available()
+
+    def get_tool_name(self) -> str:
+        """Get the name of the wrapped DNS tool."""
+        return self._adapter.get_tool_name()
+
+    def get_version(self) -> Optional[str]:
+        """Get the version of the wrapped DNS tool."""
+        return self._adapter.get_version()
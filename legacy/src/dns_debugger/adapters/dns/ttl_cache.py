@@ -0,0 +1,195 @@
+"""TTL-aware caching decorator for DNS adapters."""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Optional
+
+from dns_debugger.domain.models.dns_record import DNSResponse, RecordType
+from dns_debugger.domain.models.dnssec_info import DNSSECValidation
+from dns_debugger.domain.ports.dns_port import DNSPort
+
+CacheKey = tuple[str, RecordType, Optional[str]]
+
+
+class CachingDNSPort(DNSPort):
+    """DNSPort decorator that reuses responses until their records' TTL expires.
+
+    Screens and facades query the same records independently (the email
+    panel, dashboard and raw data screen all ask for MX/TXT), so repeated
+    lookups are answered from memory for as long as the DNS data is valid.
+    Failed queries are never cached. Concurrent identical queries are
+    coalesced so that only one reaches the wrapped adapter. validate_dnssec
+    and adapter-specific methods (e.g. query_dnskey_with_keytag) are passed
+    through to it uncached.
+    """
+
+    def __init__(
+        self,
+        adapter: DNSPort,
+        max_entries: int = 1024,
+        max_ttl: int = 3600,
+        negative_ttl: int = 30,
+    ):
+        """Wrap a DNS adapter.
+
+        Args:
+            adapter: The adapter to delegate cache misses to
+            max_entries: Maximum number of cached responses (LRU eviction)
+            max_ttl: Upper bound in seconds on how long a response is kept
+            negative_ttl: Seconds to keep successful responses with no records
+        """
+        self._adapter = adapter
+        self._max_entries = max_entries
+        self._max_ttl = max_ttl
+        self._negative_ttl = negative_ttl
+        # (domain, record type, resolver) -> (expiry, response), LRU order
+        self._cache: OrderedDict[CacheKey, tuple[float, DNSResponse]] = OrderedDict()
+        # Queries currently being sent, awaited by concurrent identical callers
+        self._inflight: dict[CacheKey, "Future[DNSResponse]"] = {}
+        # Reentrant so query() can check the cache and in-flight table together
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name: str) -> Any:
+        """Expose the wrapped adapter's adapter-specific methods."""
+        return getattr(self._adapter, name)
+
+    @staticmethod
+    def _key(
+        domain: str, record_type: RecordType, resolver: Optional[str]
+    ) -> CacheKey:
+        """Build the cache key for a query."""
+        return (domain.lower().rstrip("."), record_type, resolver)
+
+    def _get(self, key: CacheKey) -> Optional[DNSResponse]:
+        """Return a fresh cached response, dropping it if it has expired."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry[1]
+
+    def _put(self, key: CacheKey, response: DNSResponse) -> None:
+        """Cache a successful response for the lowest TTL among its records."""
+        if not response.is_success:
+            return
+        if response.records:
+            ttl = min(min(record.ttl for record in response.records), self._max_ttl)
+        else:
+            ttl = self._negative_ttl
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._cache[key] = (time.monotonic() + ttl, response)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+
+    def query(
+        self, domain: str, record_type: RecordType, resolver: Optional[str] = None
+    ) -> DNSResponse:
+        """Execute a DNS query, answering from the cache when possible.
+
+        If the same query is already in flight on another thread, wait for
+        its response instead of sending a duplicate.
+        """
+        key = self._key(domain, record_type, resolver)
+        with self._lock:
+            response = self._get(key)
+            if response is not None:
+                return response
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._inflight[key] = Future()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            return future.result()
+
+        try:
+            response = self._adapter.query(domain, record_type, resolver)
+            self._put(key, response)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def query_multiple_types(
+        self,
+        domain: str,
+        record_types: list[RecordType],
+        resolver: Optional[str] = None,
+    ) -> dict[RecordType, DNSResponse]:
+        """Execute multiple queries, only sending the uncached types."""
+        results: dict[RecordType, DNSResponse] = {}
+        missing = []
+        for record_type in record_types:
+            response = self._get(self._key(domain, record_type, resolver))
+            if response is None:
+                missing.append(record_type)
+            else:
+                results[record_type] = response
+
+        if missing:
+            fetched = self._adapter.query_multiple_types(domain, missing, resolver)
+            for record_type, response in fetched.items():
+                self._put(self._key(domain, record_type, resolver), response)
+            results.update(fetched)
+
+        return {rt: results[rt] for rt in record_types if rt in results}
+
+    def invalidate(self, domain: str) -> None:
+        """Drop every cached response for a domain."""
+        name = domain.lower().rstrip(".")
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == name]:
+                del self._cache[key]
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._cache.clear()
+
+    def clear_cache(self) -> None:
+        """Drop cached responses and the wrapped adapter's own caches."""
+        self.clear()
+        if hasattr(self._adapter, "clear_cache"):
+            self._adapter.clear_cache()
+
+    def reverse_lookup(self, ip_address: str) -> DNSResponse:
+        """Perform a reverse DNS lookup (not cached)."""
+        return self._adapter.reverse_lookup(ip_address)
+
+    def trace(self, domain: str) -> list[DNSResponse]:
+        """Trace the resolution path (not cached)."""
+        return self._adapter.trace(domain)
+
+    def validate_dnssec(
+        self, domain: str, *, build_chain: bool = True
+    ) -> DNSSECValidation:
+        """Validate DNSSEC for a domain (not cached)."""
+        return self._adapter.validate_dnssec(domain, build_chain=build_chain)
+
+    def is_available(self) -> bool:
+        """Check if the wrapped DNS tool is available."""
+        return self._adapter.is_available()
+
+    def get_tool_name(self) -> str:
+        """Get the name of the wrapped DNS tool."""
+        return self._adapter.get_tool_name()
+
+    def get_version(self) -> Optional[str]:
+        """Get the version of the wrapped DNS tool."""
+        return self._adapter.get_version()
@@ -1,6 +1,10 @@
 """Email configuration adapter using DNS queries."""
 
+import io
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from dns_debugger.domain.ports.email_port import EmailPort
@@ -13,10 +17,29 @@ from dns_debugger.domain.models.email_info import (
     DMARCPolicy,
 )
 from dns_debugger.domain.ports.dns_port import DNSPort
-from dns_debugger.domain.models.dns_record import RecordType
+from dns_debugger.domain.models.dns_record import DNSResponse, RecordType
 from dns_debugger.adapters.dns.factory import DNSAdapterFactory
 
 
+_SPF_ALL_MECHANISMS = frozenset({"-all", "~all", "?all", "+all"})
+
+# One "tag=value" pair of a DMARC record; tags are separated by semicolons
+_DMARC_TAG_RE = re.compile(r"(?:^|;)\s*(\w+)\s*=\s*([^;]*)")
+
+
+def _parse_dmarc_policy(value: str) -> DMARCPolicy:
+    """Parse a DMARC p=/sp= value, mapping unknown policies to UNKNOWN."""
+    try:
+        return DMARCPolicy(value)
+    except ValueError:
+        return DMARCPolicy.UNKNOWN
+
+
+def _parse_dmarc_addresses(value: str) -> list[str]:
+    """Parse a DMARC rua=/ruf= value into report addresses."""
+    return [addr.strip() for addr in value.replace("mailto:", "").split(",")]
+
+
 class DNSEmailAdapter(EmailPort):
     """Adapter for email configuration using DNS queries."""
 
@@ -35,6 +58,10 @@ class DNSEmailAdapter(EmailPort):
         "mx",
     ]
 
+    # Lifetime bounds (seconds) for cached DKIM selector lookups
+    DKIM_CACHE_MIN_TTL = 60
+    DKIM_CACHE_MAX_TTL = 3600
+
     def __init__(self, dns_adapter: Optional[DNSPort] = None):
         """Initialize with a DNS adapter.
 
@@ -42,14 +69,35 @@ class DNSEmailAdapter(EmailPort):
             dns_adapter: DNS adapter to use, or None to create one
         """
         self.dns_adapter = dns_adapter or DNSAdapterFactory.create()
+        # (domain, selector) -> (expiry, result) for lookups made through
+        # this adapter's DNS adapter
+        self._dkim_cache: dict[
+            tuple[str, str], tuple[float, tuple[DKIMRecord, str]]
+        ] = {}
+        # Guards _dkim_cache, which the selector probes update from a thread pool
+        self._dkim_cache_lock = threading.Lock()
+
+    def clear_cache(self) -> None:
+        """Forget cached DKIM selector lookups."""
+        with self._dkim_cache_lock:
+            self._dkim_cache.clear()
 
     def get_email_config(self, domain: str) -> EmailConfiguration:
         """Get complete email configuration for a domain."""
+        # MX and TXT live at the apex, so fetch them together
+        apex_responses = self.dns_adapter.query_multiple_types(
+            domain, [RecordType.MX, RecordType.TXT]
+        )
+
         # Query MX records
-        mx_records, mx_raw = self._get_mx_records(domain)
+        mx_records, mx_raw = self._get_mx_records(
+            domain, apex_responses.get(RecordType.MX)
+        )
 
         # Query SPF
-        spf_record, spf_raw = self._get_spf_record(domain)
+        spf_record, spf_raw = self._get_spf_record(
+            domain, apex_responses.get(RecordType.TXT)
+        )
 
         # Query DMARC
         dmarc_record, dmarc_raw = self._get_dmarc_record(domain)
@@ -57,16 +105,20 @@ class DNSEmailAdapter(EmailPort):
         # Check common DKIM selectors
         dkim_records, dkim_raw = self._check_dkim_selectors(domain)
 
-        # Collect raw outputs
-        raw_outputs = []
-        if mx_raw:
-            raw_outputs.append(f"# MX Records\n{mx_raw}")
-        if spf_raw:
-            raw_outputs.append(f"# SPF Record\n{spf_raw}")
-        if dmarc_raw:
-            raw_outputs.append(f"# DMARC Record\n{dmarc_raw}")
-        if dkim_raw:
-            raw_outputs.append(f"# DKIM Records\n{dkim_raw}")
+        # Collect raw outputs, separated by blank lines
+        buf = io.StringIO()
+        for heading, raw in (
+            ("MX Records", mx_raw),
+            ("SPF Record", spf_raw),
+            ("DMARC Record", dmarc_raw),
+            ("DKIM Records", dkim_raw),
+        ):
+            if raw:
+                if buf.tell():
+                    buf.write("\n\n")
+                buf.write(f"# {heading}\n")
+                buf.write(raw)
+        raw_output = buf.getvalue()
 
         return EmailConfiguration(
             domain=domain,
@@ -75,37 +127,47 @@ class DNSEmailAdapter(EmailPort):
             dmarc_record=dmarc_record,
             dkim_selectors_checked=self.COMMON_DKIM_SELECTORS,
             dkim_records=dkim_records,
-            raw_data={"raw_output": "\n\n".join(raw_outputs)} if raw_outputs else None,
+            raw_data={"raw_output": raw_output} if raw_output else None,
         )
 
-    def _get_mx_records(self, domain: str) -> tuple[list[MXRecord], str]:
+    def _get_mx_records(
+        self, domain: str, response: Optional[DNSResponse] = None
+    ) -> tuple[list[MXRecord], str]:
         """Get and parse MX records.
 
+        Args:
+            domain: The domain to query
+            response: Already-fetched MX response, or None to query now
+
         Returns:
             Tuple of (mx_records, raw_output)
         """
-        response = self.dns_adapter.query(domain, RecordType.MX)
+        if response is None:
+            response = self.dns_adapter.query(domain, RecordType.MX)
         raw_output = (
             response.raw_data.get("raw_output", "") if response.raw_data else ""
         )
 
-        mx_records = []
-        for record in response.records:
+        # First pass: parse (priority, hostname) pairs
+        targets = []
+        for record in response.iter_records(RecordType.MX):
             # MX format: "priority hostname"
             parts = record.value.split(None, 1)
             if len(parts) == 2:
                 try:
-                    priority = int(parts[0])
-                    hostname = parts[1].rstrip(".")
+                    targets.append((int(parts[0]), parts[1].rstrip(".")))
+                except ValueError:
+                    continue
 
-                    # Try to resolve the MX hostname to IPs
-                    ip_addresses = []
-                    try:
-                        a_response = self.dns_adapter.query(hostname, RecordType.A)
-                        ip_addresses = [r.value for r in a_response.records]
-                    except Exception:
-                        pass
+        # Second pass: resolve every MX hostname to IPs concurrently
+        mx_records = []
+        if targets:
+            with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+                resolved = executor.map(
+                    lambda target: self._resolve_mx_host(target[1]), targets
+                )
 
+                for (priority, hostname), ip_addresses in zip(targets, resolved):
                     mx_records.append(
                         MXRecord(
                             priority=priority,
@@ -113,25 +175,41 @@ class DNSEmailAdapter(EmailPort):
                             ip_addresses=ip_addresses,
                         )
                     )
-                except ValueError:
-                    continue
 
         # Sort by priority
         mx_records.sort(key=lambda x: x.priority)
         return mx_records, raw_output
 
-    def _get_spf_record(self, domain: str) -> tuple[Optional[SPFRecord], str]:
+    def _resolve_mx_host(self, hostname: str) -> list[str]:
+        """Resolve an MX hostname to its A record values (empty on failure)."""
+        try:
+            a_response = self.dns_adapter.query(hostname, RecordType.A)
+            return [r.value for r in a_response.iter_records(RecordType.A)]
+        except Exception:
+            return []
+
+    def _get_spf_record(
+        self, domain: str, response: Optional[DNSResponse] = None
+    ) -> tuple[Optional[SPFRecord], str]:
         """Get and parse SPF record.
 
+        Args:
+            domain: The domain to query
+            response: Already-fetched TXT response, or None to query now
+
         Returns:
             Tuple of (spf_record, raw_output)
         """
-        response = self.dns_adapter.query(domain, RecordType.TXT)
+        if response is None:
+            response = self.dns_adapter.query(domain, RecordType.TXT)
         raw_output = (
             response.raw_data.get("raw_output", "") if response.raw_data else ""
         )
 
-        for record in response.records:
+        for record in response.iter_records(RecordType.TXT):
+            # Cheap containment test first; only the candidate gets stripped
+            if "v=spf1" not in record.value:
+                continue
             value = record.value.strip('"')
             if value.startswith("v=spf1"):
                 return self._parse_spf(domain, value), raw_output
@@ -140,39 +218,22 @@ class DNSEmailAdapter(EmailPort):
 
     def _parse_spf(self, domain: str, record: str) -> SPFRecord:
         """Parse SPF record."""
-        mechanisms = []
-        includes = []
-        ip4_addresses = []
-        ip6_addresses = []
-        exists = []
-        all_mechanism = None
-
-        # Split on whitespace
-        parts = record.split()
-
-        for part in parts[1:]:  # Skip v=spf1
-            mechanisms.append(part)
-
-            if part.startswith("include:"):
-                includes.append(part[8:])
-            elif part.startswith("ip4:"):
-                ip4_addresses.append(part[4:])
-            elif part.startswith("ip6:"):
-                ip6_addresses.append(part[4:])
-            elif part.startswith("exists:"):
-                exists.append(part[7:])
-            elif part in ["-all", "~all", "?all", "+all"]:
-                all_mechanism = part
+        mechanisms = record.split()[1:]  # Skip v=spf1
+
+        # The last "all" wins, as when the terms were scanned in order
+        all_mechanism = next(
+            (m for m in reversed(mechanisms) if m in _SPF_ALL_MECHANISMS), None
+        )
 
         return SPFRecord(
             domain=domain,
             record=record,
             mechanisms=mechanisms,
             all_mechanism=all_mechanism,
-            includes=includes,
-            ip4_addresses=ip4_addresses,
-            ip6_addresses=ip6_addresses,
-            exists=exists,
+            includes=[m[8:] for m in mechanisms if m.startswith("include:")],
+            ip4_addresses=[m[4:] for m in mechanisms if m.startswith("ip4:")],
+            ip6_addresses=[m[4:] for m in mechanisms if m.startswith("ip6:")],
+            exists=[m[7:] for m in mechanisms if m.startswith("exists:")],
         )
 
     def _get_dmarc_record(self, domain: str) -> tuple[Optional[DMARCRecord], str]:
@@ -188,7 +249,9 @@ class DNSEmailAdapter(EmailPort):
             response.raw_data.get("raw_output", "") if response.raw_data else ""
         )
 
-        for record in response.records:
+        for record in response.iter_records(RecordType.TXT):
+            if "v=DMARC1" not in record.value:
+                continue
             value = record.value.strip('"')
             if value.startswith("v=DMARC1"):
                 return self._parse_dmarc(domain, value), raw_output
@@ -198,54 +261,34 @@ class DNSEmailAdapter(EmailPort):
     def _parse_dmarc(self, domain: str, record: str) -> DMARCRecord:
         """Parse DMARC record."""
         policy = DMARCPolicy.NONE
-        subdomain_policy = None
+        subdomain_policy: Optional[DMARCPolicy] = None
         percentage = 100
-        rua_addresses = []
-        ruf_addresses = []
+        rua_addresses: list[str] = []
+        ruf_addresses: list[str] = []
         alignment_spf = "r"
         alignment_dkim = "r"
 
-        # Split on semicolons
-        parts = record.split(";")
-
-        for part in parts:
-            part = part.strip()
-            if not part or part.startswith("v="):
-                continue
+        for match in _DMARC_TAG_RE.finditer(record):
+            key = match.group(1)
+            value = match.group(2).strip()
 
-            if "=" in part:
-                key, value = part.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-
-                if key == "p":
-                    try:
-                        policy = DMARCPolicy(value)
-                    except ValueError:
-                        policy = DMARCPolicy.UNKNOWN
-                elif key == "sp":
-                    try:
-                        subdomain_policy = DMARCPolicy(value)
-                    except ValueError:
-                        subdomain_policy = DMARCPolicy.UNKNOWN
-                elif key == "pct":
-                    try:
-                        percentage = int(value)
-                    except ValueError:
-                        pass
-                elif key == "rua":
-                    # Parse mailto: addresses
-                    rua_addresses = [
-                        addr.strip() for addr in value.replace("mailto:", "").split(",")
-                    ]
-                elif key == "ruf":
-                    ruf_addresses = [
-                        addr.strip() for addr in value.replace("mailto:", "").split(",")
-                    ]
-                elif key == "aspf":
-                    alignment_spf = value
-                elif key == "adkim":
-                    alignment_dkim = value
+            if key == "p":
+                policy = _parse_dmarc_policy(value)
+            elif key == "sp":
+                subdomain_policy = _parse_dmarc_policy(value)
+            elif key == "pct":
+                try:
+                    percentage = int(value)
+                except ValueError:
+                    pass
+            elif key == "rua":
+                rua_addresses = _parse_dmarc_addresses(value)
+            elif key == "ruf":
+                ruf_addresses = _parse_dmarc_addresses(value)
+            elif key == "aspf":
+                alignment_spf = value
+            elif key == "adkim":
+                alignment_dkim = value
 
         return DMARCRecord(
             domain=domain,
@@ -268,34 +311,76 @@ class DNSEmailAdapter(EmailPort):
         dkim_records = []
         raw_outputs = []
 
-        for selector in self.COMMON_DKIM_SELECTORS:
-            dkim_record, raw = self._check_dkim_selector(domain, selector)
-            dkim_records.append(dkim_record)
-            if raw:
-                raw_outputs.append(raw)
+        # Each selector is an independent network-bound lookup, so probe them
+        # all at once. map() keeps results in selector order.
+        with ThreadPoolExecutor(
+            max_workers=len(self.COMMON_DKIM_SELECTORS)
+        ) as executor:
+            results = executor.map(
+                lambda selector: self._check_dkim_selector(domain, selector),
+                self.COMMON_DKIM_SELECTORS,
+            )
+
+            for dkim_record, raw in results:
+                dkim_records.append(dkim_record)
+                if raw:
+                    raw_outputs.append(raw)
 
         return dkim_records, "\n\n".join(raw_outputs) if raw_outputs else ""
 
     def _check_dkim_selector(
         self, domain: str, selector: str
     ) -> tuple[DKIMRecord, str]:
-        """Check a specific DKIM selector.
+        """Check a specific DKIM selector, reusing a cached result if fresh.
+
+        Results are kept for the record TTL, clamped to
+        [DKIM_CACHE_MIN_TTL, DKIM_CACHE_MAX_TTL]. Missing selectors are
+        kept for DKIM_CACHE_MIN_TTL. Failed lookups (timeouts, SERVFAIL)
+        are not cached, so a transient error is not remembered as a
+        missing selector.
 
         Returns:
             Tuple of (dkim_record, raw_output)
         """
+        key = (domain, selector)
+        now = time.monotonic()
+        with self._dkim_cache_lock:
+            cached = self._dkim_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        result, ttl = self._lookup_dkim_selector(domain, selector)
+        if ttl is not None:
+            ttl = min(max(ttl, self.DKIM_CACHE_MIN_TTL), self.DKIM_CACHE_MAX_TTL)
+            with self._dkim_cache_lock:
+                self._dkim_cache[key] = (now + ttl, result)
+        return result
+
+    def _lookup_dkim_selector(
+        self, domain: str, selector: str
+    ) -> tuple[tuple[DKIMRecord, str], Optional[int]]:
+        """Query DNS for a specific DKIM selector.
+
+        Returns:
+            Tuple of ((dkim_record, raw_output), ttl), where ttl is 0 if the
+            lookup succeeded without finding a key (NOERROR with no DKIM
+            record, or NXDOMAIN) and None if the lookup itself failed
+        """
         # DKIM records are at selector._domainkey.domain.com
         dkim_domain = f"{selector}._domainkey.{domain}"
+        missing = (DKIMRecord(selector=selector, domain=domain, exists=False), "")
 
         try:
             response = self.dns_adapter.query(dkim_domain, RecordType.TXT)
+            if not response.is_success:
+                return missing, None
             raw_output = (
                 response.raw_data.get("raw_output", "") if response.raw_data else ""
             )
 
-            if response.is_success and response.record_count > 0:
+            if response.record_count > 0:
                 # Found a DKIM record
-                for record in response.records:
+                for record in response.iter_records(RecordType.TXT):
                     value = record.value.strip('"')
                     if "p=" in value:  # DKIM public key
                         # Parse the public key
@@ -309,23 +394,24 @@ class DNSEmailAdapter(EmailPort):
                             elif part.startswith("k="):
                                 key_type = part[2:]
 
-                        return (
-                            DKIMRecord(
-                                selector=selector,
-                                domain=domain,
-                                public_key=public_key,
-                                key_type=key_type,
-                                exists=True,
-                                raw_record=value,
-                            ),
+                        dkim_record = DKIMRecord(
+                            selector=selector,
+                            domain=domain,
+                            public_key=public_key,
+                            key_type=key_type,
+                            exists=True,
+                            raw_record=value,
+                        )
+                        raw = (
                             f"# DKIM selector: {selector}\n{raw_output}"
                             if raw_output
-                            else "",
+                            else ""
                         )
+                        return (dkim_record, raw), record.ttl
         except Exception:
-            pass
+            return missing, None
 
-        return DKIMRecord(selector=selector, domain=domain, exists=False), ""
+        return missing, 0
 
     def check_dkim(self, domain: str, selector: str) -> bool:
         """Check if a specific DKIM selector exists."""
@@ -1,13 +1,35 @@
 """HTTP adapter implementation using curl command."""
 
+import functools
 import json
 import re
 import subprocess
+import time
 from datetime import datetime
 from typing import Optional
 
 from dns_debugger.domain.models.http_info import HTTPResponse, HTTPRedirect, HTTPMethod
 from dns_debugger.domain.ports.http_port import HTTPPort
+from dns_debugger.adapters.tool_probe import is_tool_available, tool_path
+
+# curl version output: "curl 7.64.1 ..."
+_CURL_VERSION_RE = re.compile(rb"curl ([\d.]+)")
+
+
+@functools.lru_cache(maxsize=None)
+def _curl_version() -> Optional[str]:
+    """Run `curl --version` once and return the version it reports."""
+    try:
+        result = subprocess.run(
+            [tool_path("curl") or "curl", "--version"],
+            capture_output=True,
+            timeout=5,
+            check=True,
+        )
+        match = _CURL_VERSION_RE.search(result.stdout)
+        return match.group(1).decode("ascii") if match else None
+    except Exception:
+        return None
 
 
 class CurlAdapter(HTTPPort):
@@ -21,7 +43,7 @@ class CurlAdapter(HTTPPort):
         timeout: int = 5,
     ) -> HTTPResponse:
         """Execute an HTTP request using curl."""
-        start_time = datetime.now()
+        start = time.perf_counter()
 
         # Build curl command
         cmd = [
@@ -59,12 +81,12 @@ class CurlAdapter(HTTPPort):
 
             # Parse curl output
             response = self._parse_curl_output(
-                url, result.stdout, result.stderr, start_time, result
+                url, result.stdout, result.stderr, start, result
             )
             return response
 
         except subprocess.TimeoutExpired:
-            query_time = (datetime.now() - start_time).total_seconds() * 1000
+            query_time = (time.perf_counter() - start) * 1000
             return HTTPResponse(
                 url=url,
                 final_url=url,
@@ -80,7 +102,7 @@ class CurlAdapter(HTTPPort):
                 error=f"Request timed out after {timeout}s",
             )
         except Exception as e:
-            query_time = (datetime.now() - start_time).total_seconds() * 1000
+            query_time = (time.perf_counter() - start) * 1000
             return HTTPResponse(
                 url=url,
                 final_url=url,
@@ -97,10 +119,10 @@ class CurlAdapter(HTTPPort):
             )
 
     def _parse_curl_output(
-        self, url: str, stdout: str, stderr: str, start_time: datetime, result=None
+        self, url: str, stdout: str, stderr: str, start: float, result=None
     ) -> HTTPResponse:
         """Parse curl output into HTTPResponse."""
-        query_time = (datetime.now() - start_time).total_seconds() * 1000
+        query_time = (time.perf_counter() - start) * 1000
 
         # Split headers from the JSON stats at the end
         lines = stdout.strip().split("\n")
@@ -240,13 +262,7 @@ class CurlAdapter(HTTPPort):
 
     def is_available(self) -> bool:
         """Check if curl is available."""
-        try:
-            result = subprocess.run(
-                ["which", "curl"], capture_output=True, timeout=5, check=False
-            )
-            return result.returncode == 0
-        except:
-            return False
+        return is_tool_available("curl")
 
     def get_tool_name(self) -> str:
         """Get the name of the HTTP tool."""
@@ -254,16 +270,4 @@ class CurlAdapter(HTTPPort):
 
     def get_version(self) -> Optional[str]:
         """Get the version of curl."""
-        try:
-            result = subprocess.run(
-                ["curl", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                check=True,
-            )
-            # curl version output: "curl 7.64.1 ..."
-            match = re.search(r"curl ([\d.]+)", result.stdout)
-            return match.group(1) if match else None
-        except:
-            return None
+        return _curl_version()
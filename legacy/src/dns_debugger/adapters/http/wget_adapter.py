@@ -1,12 +1,34 @@
 """HTTP adapter implementation using wget command (fallback)."""
 
+import functools
 import re
 import subprocess
+import time
 from datetime import datetime
 from typing import Optional
 
 from dns_debugger.domain.models.http_info import HTTPResponse, HTTPRedirect, HTTPMethod
 from dns_debugger.domain.ports.http_port import HTTPPort
+from dns_debugger.adapters.tool_probe import is_tool_available, tool_path
+
+# wget version output: "GNU Wget 1.21.3 ..."
+_WGET_VERSION_RE = re.compile(rb"Wget ([\d.]+)")
+
+
+@functools.lru_cache(maxsize=None)
+def _wget_version() -> Optional[str]:
+    """Run `wget --version` once and return the version it reports."""
+    try:
+        result = subprocess.run(
+            [tool_path("wget") or "wget", "--version"],
+            capture_output=True,
+            timeout=5,
+            check=True,
+        )
+        match = _WGET_VERSION_RE.search(result.stdout)
+        return match.group(1).decode("ascii") if match else None
+    except Exception:
+        return None
 
 
 class WgetAdapter(HTTPPort):
@@ -20,7 +42,7 @@ class WgetAdapter(HTTPPort):
         timeout: int = 5,
     ) -> HTTPResponse:
         """Execute an HTTP request using wget."""
-        start_time = datetime.now()
+        start = time.perf_counter()
 
         # Build wget command
         cmd = [
@@ -46,11 +68,11 @@ class WgetAdapter(HTTPPort):
             )
 
             # Parse wget output (goes to stderr)
-            response = self._parse_wget_output(url, result.stderr, start_time)
+            response = self._parse_wget_output(url, result.stderr, start)
             return response
 
         except subprocess.TimeoutExpired:
-            query_time = (datetime.now() - start_time).total_seconds() * 1000
+            query_time = (time.perf_counter() - start) * 1000
             return HTTPResponse(
                 url=url,
                 final_url=url,
@@ -66,7 +88,7 @@ class WgetAdapter(HTTPPort):
                 error=f"Request timed out after {timeout}s",
             )
         except Exception as e:
-            query_time = (datetime.now() - start_time).total_seconds() * 1000
+            query_time = (time.perf_counter() - start) * 1000
             return HTTPResponse(
                 url=url,
                 final_url=url,
@@ -83,10 +105,10 @@ class WgetAdapter(HTTPPort):
             )
 
     def _parse_wget_output(
-        self, url: str, stderr: str, start_time: datetime
+        self, url: str, stderr: str, start: float
     ) -> HTTPResponse:
         """Parse wget stderr output into HTTPResponse."""
-        query_time = (datetime.now() - start_time).total_seconds() * 1000
+        query_time = (time.perf_counter() - start) * 1000
 
         lines = stderr.split("\n")
 
@@ -177,13 +199,7 @@ class WgetAdapter(HTTPPort):
 
     def is_available(self) -> bool:
         """Check if wget is available."""
-        try:
-            result = subprocess.run(
-                ["which", "wget"], capture_output=True, timeout=5, check=False
-            )
-            return result.returncode == 0
-        except:
-            return False
+        return is_tool_available("wget")
 
     def get_tool_name(self) -> str:
         """Get the name of the HTTP tool."""
@@ -191,16 +207,4 @@ class WgetAdapter(HTTPPort):
 
     def get_version(self) -> Optional[str]:
         """Get the version of wget."""
-        try:
-            result = subprocess.run(
-                ["wget", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                check=True,
-            )
-            # wget version output: "GNU Wget 1.21.3 ..."
-            match = re.search(r"Wget ([\d.]+)", result.stdout)
-            return match.group(1) if match else None
-        except:
-            return None
+        return _wget_version()
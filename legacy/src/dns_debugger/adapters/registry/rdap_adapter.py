@@ -1,8 +1,16 @@
 """RDAP adapter for domain registration lookups (primary)."""
 
+import sys
 from datetime import datetime
 from typing import Optional
-import whodap
+
+try:
+    import whodap
+
+    _WHODAP_AVAILABLE = True
+except ImportError:
+    whodap = None
+    _WHODAP_AVAILABLE = False
 
 from dns_debugger.domain.models.domain_info import (
     Contact,
@@ -12,6 +20,40 @@ from dns_debugger.domain.models.domain_info import (
 )
 from dns_debugger.domain.ports.registry_port import RegistryPort
 
+# Simple vCard properties -> Contact attribute ("adr" is unpacked separately)
+_VCARD_CONTACT_FIELDS = {
+    "fn": "name",  # Full name
+    "org": "organization",
+    "email": "email",
+    "tel": "phone",
+}
+
+
+def _vcard_fn(entity: dict) -> Optional[str]:
+    """Return the formatted name ("fn") from an RDAP entity's vCard, if any."""
+    vcard_array = entity.get("vcardArray")
+    if not vcard_array or len(vcard_array) < 2:
+        return None
+
+    for vcard_item in vcard_array[1]:
+        if isinstance(vcard_item, list) and len(vcard_item) >= 4:
+            if vcard_item[0] == "fn":
+                return str(vcard_item[3])
+
+    return None
+
+
+if sys.version_info >= (3, 11):
+    # fromisoformat() accepts a trailing "Z" natively from 3.11
+    _parse_rdap_date = datetime.fromisoformat
+else:
+
+    def _parse_rdap_date(value: str) -> datetime:
+        """Parse an RDAP ISO 8601 timestamp, accepting a trailing "Z" for UTC."""
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+
 
 class RDAPAdapter(RegistryPort):
     """Adapter for RDAP (Registration Data Access Protocol).
@@ -22,6 +64,9 @@ class RDAPAdapter(RegistryPort):
     def lookup(self, domain: str) -> DomainRegistration:
         """Look up domain registration information via RDAP."""
         try:
+            if not _WHODAP_AVAILABLE:
+                raise RuntimeError("whodap is not installed")
+
             # Use whodap to perform RDAP query
             result = whodap.lookup_domain(domain)
 
@@ -33,17 +78,24 @@ class RDAPAdapter(RegistryPort):
 
     def _parse_rdap_response(self, domain: str, result: dict) -> DomainRegistration:
         """Parse RDAP JSON response into DomainRegistration model."""
-        # Extract registrar
+        # Extract registrar and contacts (registrant, admin, tech) in one pass
         registrar = None
-        if "entities" in result:
-            for entity in result.get("entities", []):
-                if "registrar" in entity.get("roles", []):
-                    registrar = (
-                        entity.get("vcardArray", [[]])[1][0][3]
-                        if entity.get("vcardArray")
-                        else None
-                    )
-                    break
+        registrant = None
+        admin_contact = None
+        tech_contact = None
+
+        for entity in result.get("entities", []):
+            roles = entity.get("roles", [])
+
+            if registrar is None and "registrar" in roles:
+                registrar = _vcard_fn(entity)
+
+            if "registrant" in roles and not registrant:
+                registrant = self._parse_entity_contact(entity)
+            elif "administrative" in roles and not admin_contact:
+                admin_contact = self._parse_entity_contact(entity)
+            elif "technical" in roles and not tech_contact:
+                tech_contact = self._parse_entity_contact(entity)
 
         # Extract status
         status = result.get("status", [])
@@ -71,9 +123,7 @@ class RDAPAdapter(RegistryPort):
 
             if event_date_str:
                 try:
-                    event_date = datetime.fromisoformat(
-                        event_date_str.replace("Z", "+00:00")
-                    )
+                    event_date = _parse_rdap_date(event_date_str)
 
                     if event_action == "registration":
                         created_date = event_date
@@ -84,23 +134,6 @@ class RDAPAdapter(RegistryPort):
                 except ValueError:
                     pass
 
-        # Extract contacts (registrant, admin, tech)
-        registrant = None
-        admin_contact = None
-        tech_contact = None
-
-        if "entities" in result:
-            for entity in result.get("entities", []):
-                roles = entity.get("roles", [])
-                contact = self._parse_entity_contact(entity)
-
-                if "registrant" in roles and not registrant:
-                    registrant = contact
-                elif "administrative" in roles and not admin_contact:
-                    admin_contact = contact
-                elif "technical" in roles and not tech_contact:
-                    tech_contact = contact
-
         # Check DNSSEC
         dnssec = "signedDelegation" in status
 
@@ -134,14 +167,9 @@ class RDAPAdapter(RegistryPort):
                 field_name = vcard_item[0].lower()
                 field_value = vcard_item[3]
 
-                if field_name == "fn":  # Full name
-                    contact.name = field_value
-                elif field_name == "org":  # Organization
-                    contact.organization = field_value
-                elif field_name == "email":
-                    contact.email = field_value
-                elif field_name == "tel":
-                    contact.phone = field_value
+                attr = _VCARD_CONTACT_FIELDS.get(field_name)
+                if attr:
+                    setattr(contact, attr, field_value)
                 elif field_name == "adr":  # Address
                     if isinstance(field_value, list) and len(field_value) >= 7:
                         contact.address = field_value[2] if field_value[2] else None
@@ -155,6 +183,9 @@ class RDAPAdapter(RegistryPort):
     def lookup_ip(self, ip_address: str) -> DomainRegistration:
         """Look up IP address registration information via RDAP."""
         try:
+            if not _WHODAP_AVAILABLE:
+                raise RuntimeError("whodap is not installed")
+
             result = (
                 whodap.lookup_ipv4(ip_address)
                 if "." in ip_address
@@ -164,11 +195,10 @@ class RDAPAdapter(RegistryPort):
             # For IP lookups, we create a simplified DomainRegistration
             # Extract relevant information
             registrar = None
-            if "entities" in result:
-                for entity in result.get("entities", []):
-                    if entity.get("vcardArray"):
-                        registrar = entity.get("vcardArray", [[]])[1][0][3]
-                        break
+            for entity in result.get("entities", []):
+                registrar = _vcard_fn(entity)
+                if registrar is not None:
+                    break
 
             return DomainRegistration(
                 domain=ip_address,
@@ -192,12 +222,7 @@ class RDAPAdapter(RegistryPort):
 
     def is_available(self) -> bool:
         """Check if RDAP is available (whodap library)."""
-        try:
-            import whodap
-
-            return True
-        except ImportError:
-            return False
+        return _WHODAP_AVAILABLE
 
     def get_source_name(self) -> str:
         """Get the name of the registry source."""
@@ -12,6 +12,7 @@ from dns_debugger.domain.models.domain_info import (
     RegistrySource,
 )
 from dns_debugger.domain.ports.registry_port import RegistryPort
+from dns_debugger.adapters.tool_probe import is_tool_available
 
 
 class WHOISBashAdapter(RegistryPort):
@@ -273,14 +274,7 @@ class WHOISBashAdapter(RegistryPort):
 
     def is_available(self) -> bool:
         """Check if whois command is available."""
-        try:
-            # Just check if the command exists using which
-            result = subprocess.run(
-                ["which", "whois"], capture_output=True, timeout=5, check=False
-            )
-            return result.returncode == 0
-        except:
-            return False
+        return is_tool_available("whois")
 
     def get_source_name(self) -> str:
         """Get the name of the registry source."""
@@ -0,0 +1,35 @@
+"""Cached availability probes for the command-line tools adapters wrap."""
+
+import functools
+import shutil
+from typing import Optional
+
+
+@functools.lru_cache(maxsize=None)
+def tool_path(name: str) -> Optional[str]:
+    """Find an executable on PATH.
+
+    Tool locations do not change during a session, so each name is looked
+    up once per process and adapters can run the absolute path without
+    another PATH search per subprocess. Call tool_path.cache_clear() to
+    probe again (e.g. in tests or after installing a tool).
+
+    Args:
+        name: Executable name, e.g. "dig"
+
+    Returns:
+        Absolute path of the executable, or None if it is not on PATH
+    """
+    return shutil.which(name)
+
+
+def is_tool_available(name: str) -> bool:
+    """Check whether an executable is on PATH (cached, see tool_path).
+
+    Args:
+        name: Executable name, e.g. "dig"
+
+    Returns:
+        True if the executable was found on PATH
+    """
+    return tool_path(name) is not None
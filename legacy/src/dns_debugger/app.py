@@ -1,5 +1,6 @@
 """Main Textual application for DNS Debugger."""
 
+import asyncio
 import json
 
 from textual.app import App, ComposeResult
@@ -676,9 +677,13 @@ class CertificatePanel(VerticalScroll):
                         output.append(f"  • {version.value}\n")
 
                 output.append(f"\n[bold yellow]Security Features:[/bold yellow]\n")
-                output.append(
-                    f"  OCSP Stapling: {'[green]Yes[/green]' if tls_info.has_ocsp_stapling else '[dim]No[/dim]'}\n"
-                )
+                if tls_info.has_ocsp_stapling is None:
+                    ocsp = "[dim]Unknown[/dim]"
+                elif tls_info.has_ocsp_stapling:
+                    ocsp = "[green]Yes[/green]"
+                else:
+                    ocsp = "[dim]No[/dim]"
+                output.append(f"  OCSP Stapling: {ocsp}\n")
                 output.append(
                     f"  Self-Signed: {'[yellow]Yes[/yellow]' if cert.is_self_signed else '[green]No[/green]'}\n"
                 )
@@ -712,8 +717,11 @@ class CertificatePanel(VerticalScroll):
                 f"[bold cyan]SSL/TLS Certificate for {self.domain}[/bold cyan]\n"
             )
 
-            # Get certificate info
-            tls_info = self.cert_adapter.get_certificate_info(self.domain)
+            # Get certificate info, including the TLS version and OCSP probes
+            # that the dashboard skips
+            tls_info = await asyncio.to_thread(
+                self.cert_adapter.probe_full_tls_matrix, self.domain
+            )
             self.last_tls_info = tls_info  # Store for raw logs
 
             if tls_info.certificate_chain.leaf_certificate:
@@ -765,9 +773,13 @@ class CertificatePanel(VerticalScroll):
                         output.append(f"  • {version.value}\n")
 
                 output.append(f"\n[bold yellow]Security Features:[/bold yellow]\n")
-                output.append(
-                    f"  OCSP Stapling: {'[green]Yes[/green]' if tls_info.has_ocsp_stapling else '[dim]No[/dim]'}\n"
-                )
+                if tls_info.has_ocsp_stapling is None:
+                    ocsp = "[dim]Unknown[/dim]"
+                elif tls_info.has_ocsp_stapling:
+                    ocsp = "[green]Yes[/green]"
+                else:
+                    ocsp = "[dim]No[/dim]"
+                output.append(f"  OCSP Stapling: {ocsp}\n")
                 output.append(
                     f"  Self-Signed: {'[yellow]Yes[/yellow]' if cert.is_self_signed else '[green]No[/green]'}\n"
                 )
@@ -921,7 +933,9 @@ class RegistryPanel(VerticalScroll):
             )
 
             # Get registration info
-            registration = self.registry_adapter.lookup(self.domain)
+            registration = await asyncio.to_thread(
+                self.registry_adapter.lookup, self.domain
+            )
             self.last_registration = registration  # Store for raw logs
 
             output.append("[bold yellow]Registrar:[/bold yellow]\n")
@@ -1593,7 +1607,9 @@ class DNSSECPanel(VerticalScroll):
             )
 
             # Validate DNSSEC
-            validation = self.dns_adapter.validate_dnssec(self.domain)
+            validation = await asyncio.to_thread(
+                self.dns_adapter.validate_dnssec, self.domain
+            )
             self.last_validation = validation
 
             # Status
@@ -1872,7 +1888,7 @@ class HTTPPanel(VerticalScroll):
                     f"[bold yellow]{protocol.upper()}://{self.domain}[/bold yellow]\n"
                 )
 
-                response = self.http_adapter.check_url(url)
+                response = await asyncio.to_thread(self.http_adapter.check_url, url)
                 self.last_response = response  # Store for logs
 
                 if response.error:
@@ -2204,7 +2220,9 @@ class EmailPanel(VerticalScroll):
             )
 
             # Get email configuration
-            email_config = self.email_adapter.get_email_config(self.domain)
+            email_config = await asyncio.to_thread(
+                self.email_adapter.get_email_config, self.domain
+            )
             self.last_email_config = email_config  # Store for logs
 
             # Overall security score
@@ -2730,9 +2748,13 @@ class DNSDebuggerApp(App):
 
         loading_status.update("\n".join(lines))
 
-    async def fetch_all_data(self) -> None:
-        """Fetch all data from all ports and populate state (parallelized)."""
-        import asyncio
+    async def fetch_all_data(self, refresh: bool = False) -> None:
+        """Fetch all data from all ports and populate state (parallelized).
+
+        Args:
+            refresh: The user asked to refresh, so results kept on disk from
+                earlier runs (with --cache) are dropped for this domain first
+        """
         from concurrent.futures import ThreadPoolExecutor
 
         try:
@@ -2756,6 +2778,10 @@ class DNSDebuggerApp(App):
             facade.clear_caches()
             if hasattr(dns_adapter, "clear_cache"):
                 dns_adapter.clear_cache()
+            if refresh:
+                for adapter in (dns_adapter, cert_adapter):
+                    if hasattr(adapter, "forget_domain"):
+                        adapter.forget_domain(self.domain)
 
             # Define all fetch operations as async functions
             async def fetch_http_health():
@@ -3144,7 +3170,7 @@ class DNSDebuggerApp(App):
         self.update_loading_checklist()
 
         # Refetch all data and re-render all panels
-        self.run_worker(self.fetch_all_data(), exclusive=True)
+        self.run_worker(self.fetch_all_data(refresh=True), exclusive=True)
 
     def action_show_raw(self) -> None:
         """Show raw logs for the current panel."""
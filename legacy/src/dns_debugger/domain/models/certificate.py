@@ -126,7 +126,7 @@ class TLSInfo:
     certificate_chain: CertificateChain
     supported_versions: list[TLSVersion]
     cipher_suites: list[str]
-    has_ocsp_stapling: bool
+    has_ocsp_stapling: Optional[bool]  # None if the handshake could not tell
     supports_sni: bool
     connection_time_ms: float
     timestamp: datetime
@@ -1,9 +1,15 @@
 """Domain models for DNS records."""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Iterator, Optional, Sequence
+
+# Keyword arguments that give a dataclass __slots__ where supported (3.10+).
+# Records are allocated once per parsed answer line, so dropping the
+# per-instance __dict__ noticeably shrinks large result sets.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class RecordType(Enum):
@@ -25,8 +31,26 @@ class RecordType(Enum):
     NSEC3 = "NSEC3"
     RRSIG = "RRSIG"
 
+    @classmethod
+    def from_str(cls, value: str) -> "RecordType":
+        """Look up a record type by its string value (e.g. "MX").
+
+        Equivalent to RecordType(value) but a single dict lookup, without the
+        EnumMeta call machinery.
+
+        Raises:
+            ValueError: If value is not a known record type
+        """
+        try:
+            return _RECORD_TYPES_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+_RECORD_TYPES_BY_VALUE: dict[str, RecordType] = {rt.value: rt for rt in RecordType}
+
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class DNSRecord:
     """Represents a single DNS record."""
 
@@ -41,7 +65,7 @@ class DNSRecord:
         return f"{self.name} {self.ttl} {self.record_class} {self.record_type.value} {self.value}"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class DNSQuery:
     """Represents a DNS query request."""
 
@@ -56,7 +80,7 @@ class DNSQuery:
             raise ValueError("Domain cannot be empty")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DNSResponse:
     """Represents a DNS query response."""
 
@@ -68,6 +92,10 @@ class DNSResponse:
     has_dnssec: bool = False
     error: Optional[str] = None
     raw_data: Optional[dict] = None
+    # Records grouped by type, built on first get_records_by_type() call
+    _by_type: Optional[dict[RecordType, list[DNSRecord]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def is_success(self) -> bool:
@@ -80,5 +108,30 @@ class DNSResponse:
         return len(self.records)
 
     def get_records_by_type(self, record_type: RecordType) -> list[DNSRecord]:
-        """Filter records by type."""
-        return [r for r in self.records if r.record_type == record_type]
+        """Filter records by type.
+
+        The records are indexed by type on the first call, so asking for
+        several types costs a single pass over the records.
+        """
+        return list(self._records_of_type(record_type))
+
+    def iter_records(
+        self, record_type: Optional[RecordType] = None
+    ) -> Iterator[DNSRecord]:
+        """Iterate over the records, optionally only those of one type.
+
+        Unlike get_records_by_type(), no list is copied, so prefer this for
+        a single pass over the records.
+        """
+        if record_type is None:
+            return iter(self.records)
+        return iter(self._records_of_type(record_type))
+
+    def _records_of_type(self, record_type: RecordType) -> Sequence[DNSRecord]:
+        """Return the indexed records of one type, building the index once."""
+        if self._by_type is None:
+            by_type: dict[RecordType, list[DNSRecord]] = {}
+            for record in self.records:
+                by_type.setdefault(record.record_type, []).append(record)
+            self._by_type = by_type
+        return self._by_type.get(record_type, ())
@@ -5,6 +5,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from dns_debugger.domain.models.dns_record import DATACLASS_SLOTS
+
 
 class DNSSECStatus(Enum):
     """DNSSEC validation status."""
@@ -44,7 +46,7 @@ class DigestType(Enum):
     UNKNOWN = "Unknown"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DNSKEYRecord:
     """Represents a DNSKEY record."""
 
@@ -66,7 +68,7 @@ class DNSKEYRecord:
         return self.flags == 256
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DSRecord:
     """Represents a DS (Delegation Signer) record."""
 
@@ -77,7 +79,7 @@ class DSRecord:
     ttl: int
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RRSIGRecord:
     """Represents a RRSIG (Resource Record Signature) record."""
 
@@ -37,6 +37,25 @@ class CertificatePort(ABC):
         """
         pass
 
+    def probe_full_tls_matrix(
+        self, host: str, port: int = 443, servername: Optional[str] = None
+    ) -> TLSInfo:
+        """Get certificate information plus the more expensive TLS probes.
+
+        Adapters that can cheaply skip some probes in get_certificate_info
+        (such as the per-version TLS handshakes) run them here. By default
+        this is the same as get_certificate_info.
+
+        Args:
+            host: The hostname to connect to
+            port: The port to connect on (default: 443)
+            servername: Optional SNI servername (defaults to host)
+
+        Returns:
+            TLSInfo containing certificate and connection details
+        """
+        return self.get_certificate_info(host, port, servername)
+
     @abstractmethod
     def get_certificate_chain(
         self, host: str, port: int = 443, servername: Optional[str] = None
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Optional
 
 from dns_debugger.domain.models.dns_record import DNSQuery, DNSResponse, RecordType
+from dns_debugger.domain.models.dnssec_info import DNSSECValidation
 
 
 class DNSPort(ABC):
@@ -79,6 +80,22 @@ class DNSPort(ABC):
         """
         pass
 
+    @abstractmethod
+    def validate_dnssec(
+        self, domain: str, *, build_chain: bool = True
+    ) -> DNSSECValidation:
+        """Validate DNSSEC for a domain.
+
+        Args:
+            domain: The domain to validate
+            build_chain: Also fetch the root and parent zones' DNSKEY and DS
+                records (False leaves chain.parent_zones empty)
+
+        Returns:
+            DNSSECValidation with validation results
+        """
+        pass
+
     @abstractmethod
     def is_available(self) -> bool:
         """Check if this DNS tool is available on the system.
@@ -125,6 +125,8 @@ class DashboardFacade:
         """Clear all adapter caches (e.g., DNS nameserver cache)."""
         if hasattr(self.dns_adapter, "clear_cache"):
             self.dns_adapter.clear_cache()
+        if hasattr(self.email_adapter, "clear_cache"):
+            self.email_adapter.clear_cache()
 
     def get_http_health(self, domain: str) -> HTTPHealthData:
         """Get HTTP/HTTPS health data."""
@@ -255,7 +257,8 @@ class DashboardFacade:
     def get_dnssec_health(self, domain: str) -> DNSSECHealthData:
         """Get DNSSEC health data."""
         try:
-            validation = self.dns_adapter.validate_dnssec(domain)
+            # Only the domain's own records are summarized; skip the chain
+            validation = self.dns_adapter.validate_dnssec(domain, build_chain=False)
 
             has_dnskey = (
                 validation.chain.has_dnskey_record if validation.chain else False
@@ -272,7 +275,7 @@ class DashboardFacade:
                 ksk_count=ksk_count,
                 zsk_count=zsk_count,
                 warning_count=len(validation.warnings) if validation.warnings else 0,
-                error=None,
+                error=validation.error_message,
             )
         except Exception as e:
             return DNSSECHealthData(
@@ -1,12 +1,32 @@
 """Screen for displaying raw data/logs."""
 
 import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from textual.app import ComposeResult
 from textual.containers import Container, VerticalScroll, Horizontal
 from textual.screen import ModalScreen
 from textual.widgets import Static, Button
 
 
+def _dump_json(data: dict) -> str:
+    """Pretty-print data as JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str,
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib copes
+    return json.dumps(data, indent=2, default=str)
+
+
 class RawDataScreen(ModalScreen):
     """Modal screen for displaying raw data in JSON or raw tool output format."""
 
@@ -65,6 +85,13 @@ class RawDataScreen(ModalScreen):
         self.raw_output = raw_output
         self.show_json = True  # Start with JSON view
 
+        # Render both views once so toggling only swaps strings
+        if isinstance(data, dict):
+            self._json_rendered = _dump_json(data)
+        else:
+            self._json_rendered = str(data)
+        self._raw_rendered = raw_output or "[dim]No raw tool output available[/dim]"
+
     def compose(self) -> ComposeResult:
         """Create the modal dialog."""
         with Container(id="raw-dialog"):
@@ -83,18 +110,7 @@ class RawDataScreen(ModalScreen):
 
     def _get_formatted_content(self) -> str:
         """Get formatted content based on current view mode."""
-        if self.show_json:
-            # Show JSON view
-            if isinstance(self.json_data, dict):
-                return json.dumps(self.json_data, indent=2, default=str)
-            else:
-                return str(self.json_data)
-        else:
-            # Show raw tool output
-            if self.raw_output:
-                return self.raw_output
-            else:
-                return "[dim]No raw tool output available[/dim]"
+        return self._json_rendered if self.show_json else self._raw_rendered
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press."""
@@ -0,0 +1,171 @@
+"""Unit tests for DigAdapter's parsing helpers (no dig process is run)."""
+
+import textwrap
+from datetime import datetime
+
+import pytest
+
+from dns_debugger.adapters.dns.dig_adapter import DigAdapter
+from dns_debugger.domain.models.dns_record import (
+    DNSQuery,
+    DNSRecord,
+    DNSResponse,
+    RecordType,
+)
+from dns_debugger.domain.models.dnssec_info import DigestType, DNSSECAlgorithm
+
+# Root zone KSK-2017 (key tag 20326)
+ROOT_KSK = (
+    "AwEAAaz/tAm8yTn4Mfeh5eyI96WSVexTBAvkMgJzkKTOiW1vkIbzxeF3+/4RgWOq7HrxRixHlFlExOLAJr"
+    "5emLvN7SWXgnLh4+B5xQlNVz8Og8kvArMtNROxVQuCaSnIDdD5LKyWbRd2n9WGe2R8PzgCmr3EgVLrjyBx"
+    "WezF0jLHwVN8efS3rCj/EWgvIWgb9tarpVUDK/b58Da+sqqls3eNbuv7pr+eoZG+SrDK6nWeL3c6H5Apxz"
+    "7LjVc1uTIdsIXxuOLYA4/ilBmSVIzuDWfdRUfhHdY6+cn8HFRm+2hM8AnXGXws9555KrUB5qihylGa8sub"
+    "X2Nn6UwNR1AkUTV74bU="
+)
+
+
+def dnskey_response(*values: str) -> DNSResponse:
+    """Build a DNSKEY response for the root zone with the given RDATA values."""
+    return DNSResponse(
+        query=DNSQuery(domain=".", record_type=RecordType.DNSKEY),
+        records=[
+            DNSRecord(name="", record_type=RecordType.DNSKEY, value=value, ttl=172800)
+            for value in values
+        ],
+        query_time_ms=0.0,
+        resolver_used="system",
+        timestamp=datetime.now(),
+    )
+
+
+class TestCalculateKeyTag:
+    """Tests for DigAdapter._calculate_key_tag (RFC 4034 Appendix B)."""
+
+    def test_root_ksk(self):
+        assert DigAdapter._calculate_key_tag(257, 3, 8, ROOT_KSK) == 20326
+
+    def test_invalid_base64_raises(self):
+        with pytest.raises(ValueError):
+            DigAdapter._calculate_key_tag(256, 3, 8, "AwEAAa")
+
+
+class TestParseDnskeyRecords:
+    """Tests for DigAdapter._parse_dnskey_records."""
+
+    def test_malformed_key_is_skipped_not_the_zone(self):
+        adapter = DigAdapter(in_process=False)
+        response = dnskey_response(f"257 3 8 {ROOT_KSK}", "256 3 8 AwEAAa")
+
+        records = adapter._parse_dnskey_records(response)
+
+        assert [record.key_tag for record in records] == [20326]
+        assert records[0].public_key == ROOT_KSK
+        assert records[0].ttl == 172800
+
+    def test_key_split_over_several_chunks(self):
+        adapter = DigAdapter(in_process=False)
+        chunked = " ".join(textwrap.wrap(ROOT_KSK, 56))
+
+        records = adapter._parse_dnskey_records(dnskey_response(f"257 3 8 {chunked}"))
+
+        assert records[0].public_key == ROOT_KSK
+        assert records[0].key_tag == 20326
+
+
+class TestParseDnskeyMulti:
+    """Tests for DigAdapter._parse_dnskey_multi."""
+
+    def test_malformed_single_line_key_is_skipped(self):
+        adapter = DigAdapter(in_process=False)
+        output = (
+            f". 172800 IN DNSKEY 257 3 8 {ROOT_KSK}\n"
+            ". 172800 IN DNSKEY 256 3 8 AwEAAa\n"
+        )
+
+        records = adapter._parse_dnskey_multi(output)
+
+        assert [record.key_tag for record in records] == [20326]
+
+    def test_multi_line_key_uses_key_id_comment(self):
+        adapter = DigAdapter(in_process=False)
+        chunks = "\n\t\t\t\t".join(textwrap.wrap(ROOT_KSK, 56))
+        output = (
+            ".\t\t\t172800 IN DNSKEY 257 3 8 (\n"
+            f"\t\t\t\t{chunks}\n"
+            "\t\t\t\t) ; KSK; alg = RSASHA256 ; key id = 20326\n"
+            ".\t\t\t172800 IN DNSKEY 256 3 8 (\n"
+            "\t\t\t\tAwEAAa\n"
+            "\t\t\t\t) ; ZSK; alg = RSASHA256 ; key id = 12345\n"
+        )
+
+        records = adapter._parse_dnskey_multi(output)
+
+        # The tag is taken from dig's comment, so the short key is not decoded
+        assert [record.key_tag for record in records] == [20326, 12345]
+        assert records[0].public_key == ROOT_KSK
+        assert records[0].flags == 257
+        assert records[0].algorithm == DNSSECAlgorithm.RSASHA256
+        assert records[0].ttl == 172800
+
+    def test_comment_lines_are_ignored(self):
+        adapter = DigAdapter(in_process=False)
+        output = (
+            ";; ANSWER SECTION:\n"
+            "; . 172800 IN DNSKEY 256 3 8 AwEAAa\n"
+            f". 172800 IN DNSKEY 257 3 8 {ROOT_KSK}\n"
+        )
+
+        records = adapter._parse_dnskey_multi(output)
+
+        assert [record.key_tag for record in records] == [20326]
+
+
+class TestParseDsRecords:
+    """Tests for DigAdapter._parse_ds_records."""
+
+    def test_parses_fields(self):
+        adapter = DigAdapter(in_process=False)
+        digest = "E06D44B80B8F1D39A95C0B0D7C65D08458E880409BBC683457104237C7F8EC8D"
+        records = [
+            DNSRecord("com", RecordType.DS, f"19718 13 2 {digest}", 86400),
+            DNSRecord("com", RecordType.DS, "not a ds record", 86400),
+        ]
+
+        (ds,) = adapter._parse_ds_records(records)
+
+        assert ds.key_tag == 19718
+        assert ds.algorithm == DNSSECAlgorithm.ECDSAP256SHA256
+        assert ds.digest_type == DigestType.SHA256
+        assert ds.digest == digest
+        assert ds.ttl == 86400
+
+
+class TestSplitBatchOutput:
+    """Tests for DigAdapter._split_batch_output."""
+
+    def test_splits_answers_by_question(self):
+        adapter = DigAdapter(in_process=False)
+        output = (
+            ";; QUESTION SECTION:\n"
+            ";Example.com.\t\t\tIN\tMX\n"
+            "\n"
+            ";; ANSWER SECTION:\n"
+            "example.com.\t300\tIN\tMX\t10 mx.example.com.\n"
+            "\n"
+            ";; QUESTION SECTION:\n"
+            ";example.com.\t\t\tIN\tTXT\n"
+            "\n"
+            ";; QUESTION SECTION:\n"
+            ";.\t\t\t\tIN\tNS\n"
+            "\n"
+            ";; ANSWER SECTION:\n"
+            ".\t518400\tIN\tNS\ta.root-servers.net.\n"
+        )
+
+        sections = adapter._split_batch_output(output)
+
+        assert sections == {
+            ("example.com", "MX"): "example.com.\t300\tIN\tMX\t10 mx.example.com.\n",
+            ("example.com", "TXT"): "",
+            ("", "NS"): ".\t518400\tIN\tNS\ta.root-servers.net.\n",
+        }
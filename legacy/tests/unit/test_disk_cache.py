@@ -0,0 +1,184 @@
+"""Unit tests for the SQLite-backed DiskCache."""
+
+import pickle
+import sqlite3
+import time
+from datetime import datetime
+
+from dns_debugger.adapters.cert.persistent_cache import (
+    PersistentCachingCertificatePort,
+)
+from dns_debugger.adapters.disk_cache import DiskCache
+from dns_debugger.adapters.dns.persistent_cache import PersistentCachingDNSPort
+from dns_debugger.domain.models.certificate import CertificateChain, TLSInfo
+from dns_debugger.domain.models.dns_record import (
+    DNSQuery,
+    DNSRecord,
+    DNSResponse,
+    RecordType,
+)
+
+
+def mx_response() -> DNSResponse:
+    """Build a successful MX response for example.com."""
+    return DNSResponse(
+        query=DNSQuery(domain="example.com", record_type=RecordType.MX),
+        records=[DNSRecord("example.com", RecordType.MX, "10 mx.example.com.", 300)],
+        query_time_ms=1.5,
+        resolver_used="system",
+        timestamp=datetime.now(),
+        raw_data={"raw_output": "example.com. 300 IN MX 10 mx.example.com.\n"},
+    )
+
+
+def tls_info() -> TLSInfo:
+    """Build a TLSInfo for example.com with an empty chain."""
+    return TLSInfo(
+        host="example.com",
+        port=443,
+        certificate_chain=CertificateChain(
+            certificates=[], is_valid=True, validation_errors=[]
+        ),
+        supported_versions=[],
+        cipher_suites=[],
+        has_ocsp_stapling=None,
+        supports_sni=True,
+        connection_time_ms=12.5,
+        timestamp=datetime.now(),
+    )
+
+
+class TestDiskCache:
+    """Tests for DiskCache."""
+
+    def test_round_trips_a_response(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache.sqlite")
+        response = mx_response()
+
+        cache.put("key", response, 60)
+
+        assert cache.get("key", DNSResponse) == response
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache.sqlite")
+        cache.put("key", mx_response(), 0.01)
+        time.sleep(0.02)
+
+        assert cache.get("key", DNSResponse) is None
+
+    def test_get_with_ttl_returns_the_time_left(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache.sqlite")
+        response = mx_response()
+        cache.put("key", response, 60)
+
+        value, remaining = cache.get_with_ttl("key", DNSResponse)
+
+        assert value == response
+        assert 59 < remaining <= 60
+
+    def test_delete_matching_only_deletes_matching_keys(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache.sqlite")
+        cache.put("dns:example.com:MX:", mx_response(), 60)
+        cache.put("dns:example.org:MX:", mx_response(), 60)
+
+        cache.delete_matching("dns:example.com:*")
+
+        assert cache.get("dns:example.com:MX:", DNSResponse) is None
+        assert cache.get("dns:example.org:MX:", DNSResponse) is not None
+
+    def test_undecodable_entry_is_deleted(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        cache = DiskCache(path)
+        conn = sqlite3.connect(path)
+        with conn:
+            conn.execute(
+                "INSERT INTO cache (key, expiry, blob) VALUES (?, ?, ?)",
+                ("key", time.time() + 60, pickle.dumps(mx_response())),
+            )
+
+        assert cache.get("key", DNSResponse) is None
+        assert conn.execute("SELECT COUNT(*) FROM cache").fetchone() == (0,)
+
+
+class TestPersistentCachingDNSPort:
+    """Tests for PersistentCachingDNSPort."""
+
+    def test_disk_hit_counts_the_ttl_down(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache.sqlite")
+        key = PersistentCachingDNSPort._key("example.com", RecordType.MX, None)
+        # Stored with a 300s record TTL, but only 100s left on disk
+        cache.put(key, mx_response(), 100)
+
+        response = PersistentCachingDNSPort(object(), cache).query(
+            "example.com", RecordType.MX
+        )
+
+        assert [record.ttl for record in response.records] == [99]
+
+    def test_forget_domain_deletes_the_domain_and_its_subdomains(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache.sqlite")
+        keys = {
+            name: PersistentCachingDNSPort._key(name, RecordType.TXT, None)
+            for name in ("example.com", "_dmarc.example.com", "notexample.com")
+        }
+        for key in keys.values():
+            cache.put(key, mx_response(), 60)
+
+        PersistentCachingDNSPort(object(), cache).forget_domain("Example.com.")
+
+        assert cache.get(keys["example.com"], DNSResponse) is None
+        assert cache.get(keys["_dmarc.example.com"], DNSResponse) is None
+        assert cache.get(keys["notexample.com"], DNSResponse) is not None
+
+    def test_clear_cache_keeps_persisted_responses(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache.sqlite")
+        key = PersistentCachingDNSPort._key("example.com", RecordType.MX, None)
+        cache.put(key, mx_response(), 60)
+
+        PersistentCachingDNSPort(object(), cache).clear_cache()
+
+        assert cache.get(key, DNSResponse) is not None
+
+
+class FakeCertificateAdapter:
+    """Records which probe the decorator delegated to."""
+
+    def __init__(self):
+        self.calls = []
+
+    def probe_full_tls_matrix(self, host, port=443, servername=None):
+        self.calls.append("probe_full_tls_matrix")
+        return tls_info()
+
+
+class TestPersistentCachingCertificatePort:
+    """Tests for PersistentCachingCertificatePort."""
+
+    def test_full_tls_matrix_miss_runs_the_full_probe(self, tmp_path):
+        adapter = FakeCertificateAdapter()
+        port = PersistentCachingCertificatePort(
+            adapter, DiskCache(tmp_path / "cache.sqlite")
+        )
+
+        assert port.probe_full_tls_matrix("example.com").host == "example.com"
+        assert adapter.calls == ["probe_full_tls_matrix"]
+
+    def test_full_tls_matrix_is_answered_from_disk(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache.sqlite")
+        key = PersistentCachingCertificatePort._key("matrix", "example.com", 443, None)
+        cache.put(key, tls_info(), 60)
+        adapter = FakeCertificateAdapter()
+
+        port = PersistentCachingCertificatePort(adapter, cache)
+
+        assert port.probe_full_tls_matrix("example.com") == cache.get(key, TLSInfo)
+        assert adapter.calls == []
+
+    def test_forget_domain_deletes_its_results(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache.sqlite")
+        key = PersistentCachingCertificatePort._key("info", "example.com", 443, None)
+        cache.put(key, tls_info(), 60)
+
+        PersistentCachingCertificatePort(object(), cache).forget_domain("example.com")
+
+        assert cache.get(key, TLSInfo) is None
@@ -0,0 +1,136 @@
+"""Unit tests for DNSEmailAdapter's SPF/DMARC parsers and DKIM cache."""
+
+from datetime import datetime
+
+from dns_debugger.adapters.email.dns_email_adapter import DNSEmailAdapter
+from dns_debugger.domain.models.dns_record import (
+    DNSQuery,
+    DNSRecord,
+    DNSResponse,
+    RecordType,
+)
+from dns_debugger.domain.models.email_info import DMARCPolicy
+
+
+def make_adapter() -> DNSEmailAdapter:
+    """Build an adapter whose DNS adapter is never used by the parsers."""
+    return DNSEmailAdapter(dns_adapter=object())
+
+
+class TestParseSpf:
+    """Tests for DNSEmailAdapter._parse_spf."""
+
+    def test_parses_mechanisms(self):
+        record = (
+            "v=spf1 ip4:192.0.2.0/24 ip6:2001:db8::/32 include:_spf.example.net"
+            " exists:%{i}.spf.example.com ~all"
+        )
+
+        spf = make_adapter()._parse_spf("example.com", record)
+
+        assert spf.record == record
+        assert spf.mechanisms == record.split()[1:]
+        assert spf.ip4_addresses == ["192.0.2.0/24"]
+        assert spf.ip6_addresses == ["2001:db8::/32"]
+        assert spf.includes == ["_spf.example.net"]
+        assert spf.exists == ["%{i}.spf.example.com"]
+        assert spf.all_mechanism == "~all"
+
+    def test_last_all_mechanism_wins(self):
+        spf = make_adapter()._parse_spf("example.com", "v=spf1 -all mx ?all")
+
+        assert spf.all_mechanism == "?all"
+
+    def test_no_all_mechanism(self):
+        spf = make_adapter()._parse_spf("example.com", "v=spf1 mx")
+
+        assert spf.all_mechanism is None
+
+
+class TestParseDmarc:
+    """Tests for DNSEmailAdapter._parse_dmarc."""
+
+    def test_parses_tags(self):
+        record = (
+            "v=DMARC1; p=reject; sp=quarantine; pct=50;"
+            " rua=mailto:a@example.com,mailto:b@example.com;"
+            " ruf=mailto:f@example.com; aspf=s; adkim=s"
+        )
+
+        dmarc = make_adapter()._parse_dmarc("example.com", record)
+
+        assert dmarc.raw_record == record
+        assert dmarc.policy == DMARCPolicy.REJECT
+        assert dmarc.subdomain_policy == DMARCPolicy.QUARANTINE
+        assert dmarc.percentage == 50
+        assert dmarc.rua_addresses == ["a@example.com", "b@example.com"]
+        assert dmarc.ruf_addresses == ["f@example.com"]
+        assert dmarc.alignment_spf == "s"
+        assert dmarc.alignment_dkim == "s"
+
+    def test_defaults_when_tags_missing(self):
+        dmarc = make_adapter()._parse_dmarc("example.com", "v=DMARC1")
+
+        assert dmarc.policy == DMARCPolicy.NONE
+        assert dmarc.subdomain_policy is None
+        assert dmarc.percentage == 100
+        assert dmarc.rua_addresses == []
+
+    def test_unknown_policy_and_bad_percentage(self):
+        dmarc = make_adapter()._parse_dmarc(
+            "example.com", "v=DMARC1; p=bogus; pct=lots; x=1"
+        )
+
+        assert dmarc.policy == DMARCPolicy.UNKNOWN
+        assert dmarc.percentage == 100
+
+
+class FakeDKIMPort:
+    """DNS adapter stub that answers every TXT query with a DKIM key."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def query(self, domain, record_type, resolver=None):
+        self.calls += 1
+        return DNSResponse(
+            query=DNSQuery(domain=domain, record_type=record_type),
+            records=[
+                DNSRecord(domain, RecordType.TXT, '"v=DKIM1; k=rsa; p=AAAA"', 300)
+            ],
+            query_time_ms=1.0,
+            resolver_used="system",
+            timestamp=datetime.now(),
+        )
+
+
+class TestDkimSelectorCache:
+    """Tests for DNSEmailAdapter's per-adapter DKIM selector cache."""
+
+    def test_result_is_reused_by_the_same_adapter(self):
+        port = FakeDKIMPort()
+        adapter = DNSEmailAdapter(dns_adapter=port)
+
+        adapter._check_dkim_selector("example.com", "google")
+        dkim, _ = adapter._check_dkim_selector("example.com", "google")
+
+        assert port.calls == 1
+        assert dkim.exists and dkim.public_key == "AAAA"
+
+    def test_cache_is_not_shared_between_adapters(self):
+        first, second = FakeDKIMPort(), FakeDKIMPort()
+
+        DNSEmailAdapter(dns_adapter=first)._check_dkim_selector("example.com", "s1")
+        DNSEmailAdapter(dns_adapter=second)._check_dkim_selector("example.com", "s1")
+
+        assert (first.calls, second.calls) == (1, 1)
+
+    def test_clear_cache_forgets_results(self):
+        port = FakeDKIMPort()
+        adapter = DNSEmailAdapter(dns_adapter=port)
+
+        adapter._check_dkim_selector("example.com", "google")
+        adapter.clear_cache()
+        adapter._check_dkim_selector("example.com", "google")
+
+        assert port.calls == 2
@@ -0,0 +1,62 @@
+"""Unit tests for DnsPythonAdapter (no network traffic is sent)."""
+
+import pytest
+
+from dns_debugger.adapters.dns.dnspython_adapter import DnsPythonAdapter
+from dns_debugger.domain.models.dns_record import RecordType
+
+# dnspython is an optional dependency (the "speedups" extra)
+dns = pytest.importorskip("dns")
+pytest.importorskip("dns.message")
+pytest.importorskip("dns.rrset")
+
+
+def mx_reply(request: "dns.message.Message") -> "dns.message.Message":
+    """Answer a query for example.com MX with one record."""
+    response = dns.message.make_response(request)
+    response.answer.append(
+        dns.rrset.from_text("example.com.", 300, "IN", "MX", "10 mx.example.com.")
+    )
+    return response
+
+
+class FakeAnswer:
+    """Stand-in for dns.resolver.Answer carrying only the reply message."""
+
+    def __init__(self, response: "dns.message.Message"):
+        self.response = response
+
+
+class FakeResolver:
+    """Stand-in for dns.resolver.Resolver that answers with mx_reply()."""
+
+    def resolve(self, qname, rdtype, lifetime, raise_on_no_answer):
+        return FakeAnswer(mx_reply(dns.message.make_query(qname, rdtype)))
+
+
+class TestRawOutput:
+    """Tests for the raw_data DnsPythonAdapter attaches to responses."""
+
+    def test_direct_query_keeps_reply_text(self, monkeypatch):
+        adapter = DnsPythonAdapter()
+        monkeypatch.setattr(
+            adapter, "_exchange", lambda request, nameserver: mx_reply(request)
+        )
+
+        response = adapter.query("example.com", RecordType.MX, "192.0.2.53")
+
+        assert response.records[0].value == "10 mx.example.com."
+        assert "example.com. 300 IN MX 10 mx.example.com." in (
+            response.raw_data["raw_output"]
+        )
+
+    def test_system_resolver_query_keeps_reply_text(self, monkeypatch):
+        adapter = DnsPythonAdapter()
+        monkeypatch.setattr(adapter, "_get_resolver", FakeResolver)
+
+        response = adapter.query("example.com", RecordType.MX)
+
+        assert response.records[0].value == "10 mx.example.com."
+        assert "example.com. 300 IN MX 10 mx.example.com." in (
+            response.raw_data["raw_output"]
+        )
@@ -0,0 +1,65 @@
+"""Unit tests for the iterative trace (no network traffic is sent)."""
+
+import time
+
+import pytest
+
+from dns_debugger.adapters.dns import iterative_trace
+from dns_debugger.domain.models.dns_record import RecordType
+
+# dnspython is an optional dependency (the "speedups" extra)
+dns = pytest.importorskip("dns")
+pytest.importorskip("dns.message")
+pytest.importorskip("dns.rcode")
+
+SERVERS = {"a.example": "192.0.2.1", "b.example": "192.0.2.2"}
+
+
+class TestQueryLevel:
+    """Tests for iterative_trace._query_level."""
+
+    def test_reply_clears_earlier_nameserver_failure(self, monkeypatch):
+        def exchange(request, address, timeout):
+            if address == "192.0.2.1":
+                raise OSError("Network is unreachable")
+            # Let the failing nameserver be seen first
+            time.sleep(0.05)
+            return dns.message.make_response(request)
+
+        monkeypatch.setattr(iterative_trace, "_exchange", exchange)
+
+        step, response = iterative_trace._query_level(
+            "example.com", RecordType.A, SERVERS, 1.0
+        )
+
+        assert response is not None
+        assert step.error is None
+        assert step.resolver_used == "192.0.2.2"
+
+    def test_error_rcode_is_reported(self, monkeypatch):
+        def exchange(request, address, timeout):
+            response = dns.message.make_response(request)
+            response.set_rcode(dns.rcode.SERVFAIL)
+            return response
+
+        monkeypatch.setattr(iterative_trace, "_exchange", exchange)
+
+        step, _ = iterative_trace._query_level(
+            "example.com", RecordType.A, SERVERS, 1.0
+        )
+
+        assert step.error == "Query failed: SERVFAIL"
+
+    def test_every_nameserver_failing_is_reported(self, monkeypatch):
+        def exchange(request, address, timeout):
+            raise OSError("Network is unreachable")
+
+        monkeypatch.setattr(iterative_trace, "_exchange", exchange)
+
+        step, response = iterative_trace._query_level(
+            "example.com", RecordType.A, SERVERS, 1.0
+        )
+
+        assert response is None
+        assert step.error.endswith("failed: Network is unreachable")
+        assert not step.records
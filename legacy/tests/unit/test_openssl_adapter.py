@@ -0,0 +1,36 @@
+"""Unit tests for OpenSSLAdapter (no handshake is performed)."""
+
+import pytest
+
+from dns_debugger.adapters.cert.openssl_adapter import OpenSSLAdapter
+from dns_debugger.domain.models.certificate import CertificateChain
+
+
+class TestOcspStapling:
+    """Tests for how get_certificate_info reports OCSP stapling."""
+
+    @pytest.mark.parametrize(
+        "raw_output, expected",
+        [
+            ("OCSP response: no response sent\n", False),
+            (
+                "OCSP response: \n"
+                "======================================\n"
+                "OCSP Response Data:\n"
+                "    OCSP Response Status: successful (0x0)\n",
+                True,
+            ),
+            # In-process handshakes cannot request a stapled response
+            ("CONNECTED(example.com:443)\n---\nCertificate chain\n", None),
+        ],
+    )
+    def test_stapling_from_chain_output(self, monkeypatch, raw_output, expected):
+        adapter = OpenSSLAdapter()
+        chain = CertificateChain(certificates=[], is_valid=True, validation_errors=[])
+        monkeypatch.setattr(
+            adapter, "get_certificate_chain", lambda *args: (chain, raw_output)
+        )
+
+        tls_info = adapter.get_certificate_info("example.com")
+
+        assert tls_info.has_ocsp_stapling is expected
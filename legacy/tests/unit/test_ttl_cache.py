@@ -0,0 +1,137 @@
+"""Unit tests for the CachingDNSPort decorator."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional
+
+from dns_debugger.adapters.dns.ttl_cache import CachingDNSPort
+from dns_debugger.domain.models.dns_record import (
+    DNSQuery,
+    DNSRecord,
+    DNSResponse,
+    RecordType,
+)
+from dns_debugger.domain.ports.dns_port import DNSPort
+
+
+def make_response(
+    domain: str, ttls: list[int], error: Optional[str] = None
+) -> DNSResponse:
+    """Build an A response with one record per TTL."""
+    return DNSResponse(
+        query=DNSQuery(domain=domain, record_type=RecordType.A),
+        records=[DNSRecord(domain, RecordType.A, "192.0.2.1", ttl) for ttl in ttls],
+        query_time_ms=1.0,
+        resolver_used="system",
+        timestamp=datetime.now(),
+        error=error,
+    )
+
+
+class FakeDNSPort(DNSPort):
+    """DNSPort that answers every query with a canned response and counts calls."""
+
+    def __init__(self, response: DNSResponse, delay: float = 0.0):
+        self.response = response
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def query(self, domain, record_type, resolver=None):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return self.response
+
+    def query_multiple_types(self, domain, record_types, resolver=None):
+        return {rt: self.query(domain, rt, resolver) for rt in record_types}
+
+    def reverse_lookup(self, ip_address):
+        raise NotImplementedError
+
+    def trace(self, domain):
+        raise NotImplementedError
+
+    def validate_dnssec(self, domain, *, build_chain=True):
+        raise NotImplementedError
+
+    def is_available(self):
+        return True
+
+    def get_tool_name(self):
+        return "fake"
+
+    def get_version(self):
+        return None
+
+
+class TestCachingDNSPort:
+    """Tests for CachingDNSPort."""
+
+    def test_response_is_reused_until_lowest_ttl_expires(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        adapter = FakeDNSPort(make_response("example.com", [300, 60]))
+        cache = CachingDNSPort(adapter)
+
+        cache.query("example.com", RecordType.A)
+        now[0] += 59
+        cache.query("Example.com.", RecordType.A)
+        assert adapter.calls == 1
+
+        now[0] += 1
+        cache.query("example.com", RecordType.A)
+        assert adapter.calls == 2
+
+    def test_ttl_is_capped_at_max_ttl(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        adapter = FakeDNSPort(make_response("example.com", [86400]))
+        cache = CachingDNSPort(adapter, max_ttl=100)
+
+        cache.query("example.com", RecordType.A)
+        now[0] += 100
+        cache.query("example.com", RecordType.A)
+
+        assert adapter.calls == 2
+
+    def test_empty_answer_is_kept_for_negative_ttl(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        adapter = FakeDNSPort(make_response("example.com", []))
+        cache = CachingDNSPort(adapter, negative_ttl=30)
+
+        cache.query("example.com", RecordType.A)
+        now[0] += 29
+        cache.query("example.com", RecordType.A)
+        assert adapter.calls == 1
+
+        now[0] += 1
+        cache.query("example.com", RecordType.A)
+        assert adapter.calls == 2
+
+    def test_failed_response_is_not_cached(self):
+        adapter = FakeDNSPort(make_response("example.com", [], error="SERVFAIL"))
+        cache = CachingDNSPort(adapter)
+
+        cache.query("example.com", RecordType.A)
+        cache.query("example.com", RecordType.A)
+
+        assert adapter.calls == 2
+
+    def test_concurrent_identical_queries_are_coalesced(self):
+        response = make_response("example.com", [300])
+        adapter = FakeDNSPort(response, delay=0.2)
+        cache = CachingDNSPort(adapter)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(
+                    lambda _: cache.query("example.com", RecordType.A), range(8)
+                )
+            )
+
+        assert adapter.calls == 1
+        assert all(result is response for result in results)